@@ -0,0 +1,185 @@
+"""
+Resource aware admission of tasks to an event loop.
+
+An AdmissionController caps how many tasks run at once on the loop it belongs to.
+The cap, its window, is adjusted AIMD style from live signals sampled on that loop:
+the resident memory (RSS) and the open file descriptors of the process, and the lag
+of the event loop, i.e. how late a sleep on the loop wakes up. When a sample goes over
+one of the thresholds of its ResourceLimits the window is cut by a factor, and while
+the samples stay under them it grows back by a fixed step, so intake backs off
+smoothly under load rather than stopping dead. Like TCP, the window starts small and
+doubles with each sample until the first time a limit is hit, so that a burst of tasks
+arriving before the first sample can't all start at once.
+
+RSS and open file descriptors are read with psutil when it is installed, or from
+/proc on Linux, and are otherwise not available, so their limits are ignored.
+"""
+
+import asyncio
+import os
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+from . import f4a_logging as logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+except ImportError:  # psutil is optional
+    psutil = None
+
+
+class ResourceLimits:
+    """
+    The thresholds that make an AdmissionController back off, a limit left as None is not checked.
+
+    Args:
+        max_rss_mb (Optional[float]): Resident memory of the process, in megabytes.
+        max_loop_lag (Optional[float]): Lag of the event loop, in seconds.
+        max_open_fds (Optional[int]): Open file descriptors of the process.
+        sample_interval (float): Seconds between samples. Defaults to 0.1.
+    """
+
+    def __init__(self, max_rss_mb: Optional[float] = None, max_loop_lag: Optional[float] = None,
+                 max_open_fds: Optional[int] = None, sample_interval: float = 0.1):
+        if sample_interval <= 0:
+            raise ValueError(f"sample_interval must be greater than 0, got {sample_interval!r}")
+        self.max_rss_mb = max_rss_mb
+        self.max_loop_lag = max_loop_lag
+        self.max_open_fds = max_open_fds
+        self.sample_interval = sample_interval
+
+    def exceeded(self, rss: Optional[int], open_fds: Optional[int], loop_lag: float) -> bool:
+        """Returns True if any sampled signal is over its limit, rss is in bytes."""
+        return ((self.max_rss_mb is not None and rss is not None and rss > self.max_rss_mb * 2**20)
+                or (self.max_open_fds is not None and open_fds is not None and open_fds > self.max_open_fds)
+                or (self.max_loop_lag is not None and loop_lag > self.max_loop_lag))
+
+
+_process = None
+
+
+def sample_process_resources() -> Tuple[Optional[int], Optional[int]]:
+    """Returns the RSS in bytes and the number of open file descriptors of this process,
+    either is None when it can't be read on this platform."""
+    global _process
+    if psutil is not None:
+        if _process is None or _process.pid != os.getpid():
+            _process = psutil.Process()
+        try:
+            open_fds = _process.num_fds()
+        except AttributeError:  # num_fds is POSIX only
+            open_fds = None
+        return _process.memory_info().rss, open_fds
+    try:
+        with open("/proc/self/statm") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        return rss, len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None, None
+
+
+class AdmissionController:
+    """
+    Admits tasks to run on an event loop while fewer than window tasks are running.
+
+    acquire and release are called on the loop, around each task. Without limits the
+    window is max_window, None meaning no cap. With limits, monitor adjusts the window
+    from samples taken on the loop, never above max_window, or without a max_window,
+    above twice the running tasks, so an idle loop can't build up a window that would
+    let the next burst in at once.
+
+    Args:
+        limits (Optional[ResourceLimits]): The thresholds to back off at, None for a fixed window.
+        max_window (Optional[int]): The largest window, e.g. a max_in_flight limit. Defaults to None.
+    """
+    MIN_WINDOW = 1
+    INITIAL_WINDOW = 16  # window when there are limits, grown from by slow start
+    DECREASE_FACTOR = 0.5  # multiplicative decrease when over a limit
+    INCREASE_STEP = 8  # additive increase per sample under the limits
+
+    def __init__(self, limits: Optional[ResourceLimits] = None, max_window: Optional[int] = None):
+        self.limits = limits
+        self.max_window = max_window
+        self.window: Optional[int] = max_window
+        if limits is not None:
+            self.window = self.INITIAL_WINDOW if max_window is None else min(self.INITIAL_WINDOW, max_window)
+        self.in_flight = 0
+        self.loop_lag = 0.0  # of the last sample
+        self.overloaded = False
+        self.slow_start = True
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def throttled(self) -> bool:
+        """True while the last sample was over a limit, or the window is holding back tasks that
+        max_window alone would let run."""
+        return self.overloaded or (bool(self._waiters) and self.window is not None and
+                                   (self.max_window is None or self.window < self.max_window))
+
+    def _has_room(self) -> bool:
+        return self.window is None or self.in_flight < self.window
+
+    async def acquire(self) -> None:
+        """Wait until the window has room, then count a task as running."""
+        while not self._has_room():
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Count a task as finished, admitting a waiting task if there is room."""
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        room = len(self._waiters) if self.window is None else self.window - self.in_flight
+        while room > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                room -= 1
+
+    def adjust(self, rss: Optional[int], open_fds: Optional[int], loop_lag: float) -> None:
+        """Cut the window if a sample is over a limit, otherwise grow it back."""
+        was_throttled = self.throttled
+        self.loop_lag = loop_lag
+        self.overloaded = self.limits is not None and self.limits.exceeded(rss, open_fds, loop_lag)
+        if self.overloaded:
+            self.slow_start = False
+            self.window = max(self.MIN_WINDOW, int(self.window * self.DECREASE_FACTOR))
+        else:
+            grown = self.window * 2 if self.slow_start else self.window + self.INCREASE_STEP
+            ceiling = self.max_window if self.max_window is not None else max(self.INITIAL_WINDOW, 2 * self.in_flight)
+            self.window = min(grown, ceiling)
+        if self.throttled != was_throttled:
+            logger.info(f"Admission {'throttled' if self.throttled else 'unthrottled'}: window={self.window}, "
+                        f"in flight={self.in_flight}, rss={rss}, open fds={open_fds}, loop lag={loop_lag:.3f}s")
+        self._wake_waiters()
+
+    async def monitor(self, on_sample: Optional[Callable[['AdmissionController'], None]] = None) -> None:
+        """Sample the process and the lag of the running loop every sample_interval, adjusting the
+        window, until cancelled. on_sample is called after each adjustment, e.g. to publish stats."""
+        if self.limits is None:
+            return
+        sample_process = self.limits.max_rss_mb is not None or self.limits.max_open_fds is not None
+
+        def sample(loop_lag: float) -> None:
+            rss, open_fds = sample_process_resources() if sample_process else (None, None)
+            self.adjust(rss, open_fds, loop_lag)
+            if on_sample:
+                on_sample(self)
+
+        await sample_loop_lag(self.limits.sample_interval, sample)
+
+
+async def sample_loop_lag(interval: float, on_sample: Callable[[float], None]) -> None:
+    """Measure the lag of the running loop every interval seconds, how late a sleep of interval
+    wakes up, and pass it to on_sample, until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        on_sample(max(0.0, loop.time() - expected))
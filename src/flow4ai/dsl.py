@@ -56,7 +56,7 @@ class Serial:
         return f"serial({', '.join(repr(c) for c in self.components)})"
 
 
-def wrap(obj=None, **kwargs):
+def wrap(obj=None, executor=None, **kwargs):
     """
     Wrap any object to enable direct graph operations with | and >> operators.
     
@@ -74,7 +74,18 @@ def wrap(obj=None, **kwargs):
        wrap(obj_a_name=obj_a, obj_b_name=obj_b) or wrap({"obj_a_name": obj_a, "obj_b_name": obj_b})
        - Returns a collection of wrapped objects following the rules in case 1
        - If only one item, returns a dict with the name as key and the wrapped object as value
+
+    3. executor: where the synchronous callables wrapped in a WrappingJob are run,
+       "inline" (the default) on the event loop, "thread" in the shared thread pool or
+       an int for a dedicated thread pool of that size, e.g. wrap(parse_pdf, executor="thread"),
+       or "process" to run CPU-bound functions in the process pool.
+       It is not applied to objects that are already jobs or compositions.
+       A callable, job or composition passed as executor, as in wrap(executor=fn), is not an
+       executor policy: it is wrapped under the name "executor", as it was before this argument.
     """
+    if executor is not None and not isinstance(executor, (str, int)):
+        kwargs = {"executor": executor, **kwargs}
+        executor = None
     # Case 1: Only keyword arguments provided (no positional argument)
     if obj is None and kwargs:
         # Process keyword arguments
@@ -86,7 +97,7 @@ def wrap(obj=None, **kwargs):
             elif isinstance(value, (Parallel, Serial)):
                 result[name] = value
             else:
-                result[name] = WrappingJob(value, name)
+                result[name] = WrappingJob(value, name, executor=executor)
         
         # If only one item, return just that item
         if len(result) == 1:
@@ -103,7 +114,7 @@ def wrap(obj=None, **kwargs):
             elif isinstance(value, (Parallel, Serial)):
                 result[name] = value
             else:
-                result[name] = WrappingJob(value, name)
+                result[name] = WrappingJob(value, name, executor=executor)
         
         # If only one item, return just that item
         if len(result) == 1:
@@ -117,7 +128,7 @@ def wrap(obj=None, **kwargs):
         
     if isinstance(obj, (JobABC, Parallel, Serial)):
         return obj  # Already has the operations we need
-    return WrappingJob(obj)
+    return WrappingJob(obj, executor=executor)
 
 # Synonym for wrap
 w = wrap
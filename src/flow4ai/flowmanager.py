@@ -1,30 +1,137 @@
 import asyncio
 import threading
 import time
-from collections import defaultdict
-from typing import Any, Callable, Dict, List, Optional, Union
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 from flow4ai import f4a_logging as logging
+from flow4ai.admission import (AdmissionController, ResourceLimits,
+                               sample_loop_lag)
 from flow4ai.flowmanager_base import FlowManagerABC
 from flow4ai.job import SPLIT_STR, JobABC, Task, job_graph_context_manager
 from flow4ai.job_loader import JobFactory
+from flow4ai.result_store import (COMPLETED, ERRORS, MemoryResultStore,
+                                  ResultStore)
+
+
+class _EventLoopShard:
+    """
+    One of the event loops of a FlowManager, with the state kept per loop: the admission
+    controller of the tasks run on it, the event that wakes them when there is room in the
+    result buffer, and the last and the largest sampled lag of the loop.
+    """
+    LAG_SAMPLE_INTERVAL = 0.1  # seconds, unless resource_limits sets a sample_interval
+
+    def __init__(self, index: int, admission: Optional[AdmissionController]):
+        self.index = index
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.admission = admission
+        self.monitor: Optional[asyncio.Task] = None
+        self.lag: Optional[float] = None  # None until sampled
+        self.max_lag: Optional[float] = None
+        self.result_buffer_room: Optional[asyncio.Event] = None  # created on the loop
+
+    def start(self):
+        """Run a new event loop in a daemon thread of its own, sampling its lag."""
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name=f"flow4ai-loop-{self.index}", daemon=True)
+        self.thread.start()
+        self.loop.call_soon_threadsafe(self.start_monitor)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def start_monitor(self):
+        """Called on the loop."""
+        self.monitor = self.loop.create_task(self._monitor())
+
+    async def _monitor(self):
+        if self.admission is not None and self.admission.limits is not None:
+            await self.admission.monitor(self._record_admission_sample)
+        else:
+            await sample_loop_lag(self.LAG_SAMPLE_INTERVAL, self._record_lag)
+
+    def _record_admission_sample(self, admission: AdmissionController):
+        self._record_lag(admission.loop_lag)
+
+    def _record_lag(self, lag: float):
+        self.lag = lag
+        if self.max_lag is None or lag > self.max_lag:
+            self.max_lag = lag
+
+    async def _stop_monitor(self):
+        if self.monitor is not None:
+            self.monitor.cancel()
+            await asyncio.gather(self.monitor, return_exceptions=True)
+
+    def stop(self):
+        """Stop sampling, then stop the loop and its thread and close the loop."""
+        if self.thread.is_alive():
+            # Queued after start_monitor, so the monitor has been started by the time this runs
+            asyncio.run_coroutine_threadsafe(self._stop_monitor(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        if not self.loop.is_closed():
+            self.loop.close()
 
 
 class FlowManager(FlowManagerABC):
     _lock = threading.Lock()  # Lock for thread-safe initialization
     _instance = None  # Singleton instance
+    DEFAULT_RESULT_BUFFER_SIZE = 1000
+    # How tasks are spread over the event loops when there are several, see __init__
+    LOOP_SHARDING_FQ_NAME = "fq_name"
+    LOOP_SHARDING_ROUND_ROBIN = "round_robin"
     
-    def __init__(self, dsl=None, jobs_dir_mode=False, on_complete: Optional[Callable[[Any], None]] = None):
+    def __init__(self, dsl=None, jobs_dir_mode=False, on_complete: Optional[Callable[[Any], None]] = None,
+                 resource_limits: Optional[ResourceLimits] = None,
+                 result_buffer_size: int = DEFAULT_RESULT_BUFFER_SIZE, stream_results: bool = False,
+                 result_store: Optional[ResultStore] = None, loops: int = 1,
+                 loop_sharding: str = LOOP_SHARDING_FQ_NAME):
         """Initialize the FlowManager.
         
         Args:
             dsl: A dictionary of job DSLs, a job DSL, a JobABC instance, or a collection of JobABC instances.
             jobs_dir_mode: If True, the FlowManager will load jobs from a directory.
             on_complete: A callback function to be called when a job is completed.
+            resource_limits: RSS, event loop lag and open file descriptor thresholds. Over a threshold,
+                fewer submitted tasks are run at once until the samples are back under it, the rest
+                wait their turn, see flow4ai.admission and get_stats.
+            result_buffer_size: The most tasks running or holding a result for iter_results and results
+                while they are iterated, the next tasks wait for the consumer to catch up before they start.
+                Defaults to 1000.
+            stream_results: If True, completed results are only ever handed out by iter_results and results,
+                never kept for pop_results, so result_buffer_size bounds the tasks from the first one on,
+                not only while iterating. Tasks then stall when nothing consumes the results.
+            result_store: Holds the completed results and errors until pop_results is called, see
+                flow4ai.result_store. Defaults to an unbounded MemoryResultStore.
+            loops: The number of event loops the tasks run on, each in a thread of its own. With more than
+                one, a graph doing blocking or CPU heavy work only lags the loop its tasks run on, and work
+                that releases the GIL, such as blocking I/O, runs in parallel. on_complete may then be
+                called from several threads at once. resource_limits apply to each loop. Defaults to 1.
+            loop_sharding: How tasks are spread over the loops, "fq_name" to run all the tasks of a graph
+                on one loop, the graphs taking the loops in turn as they are first submitted to, or
+                "round_robin" to spread the tasks of every graph over all the loops. Defaults to "fq_name".
         """
+        if not isinstance(result_buffer_size, int) or result_buffer_size < 1:
+            raise ValueError(f"result_buffer_size must be a positive integer, got {result_buffer_size!r}")
+        if not isinstance(loops, int) or loops < 1:
+            raise ValueError(f"loops must be a positive integer, got {loops!r}")
+        if loop_sharding not in (self.LOOP_SHARDING_FQ_NAME, self.LOOP_SHARDING_ROUND_ROBIN):
+            raise ValueError(f"loop_sharding must be '{self.LOOP_SHARDING_FQ_NAME}' or "
+                             f"'{self.LOOP_SHARDING_ROUND_ROBIN}', got {loop_sharding!r}")
         super().__init__()
         self.jobs_dir_mode = jobs_dir_mode
         self.on_complete = on_complete
+        self.resource_limits = resource_limits
+        self.result_buffer_size = result_buffer_size
+        self.stream_results = stream_results
+        self.result_store = result_store if result_store is not None else MemoryResultStore()
+        self.loops = loops
+        self.loop_sharding = loop_sharding
         self._initialize()
         
         # Add DSL dictionary if provided
@@ -33,9 +140,12 @@ class FlowManager(FlowManagerABC):
 
     def _initialize(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.loop = asyncio.new_event_loop()
-        self.thread = threading.Thread(target=self._run_loop, daemon=True)
-        self.thread.start()
+        # The admission window is kept per loop, as the loop lag it backs off on is
+        self._shards = [_EventLoopShard(index, AdmissionController(self.resource_limits) if self.resource_limits else None)
+                        for index in range(self.loops)]
+        self._fq_name_shards: Dict[str, _EventLoopShard] = {}  # with fq_name sharding
+        self._next_shard = 0  # with round_robin sharding
+        self._start_loop()
         self.head_jobs: List[JobABC] = []
         if self.jobs_dir_mode:
             self.head_jobs = JobFactory.get_head_jobs_from_config()
@@ -44,66 +154,175 @@ class FlowManager(FlowManagerABC):
         self.completed_count = 0
         self.error_count = 0
         self.post_processing_count = 0
-        self.completed_results = defaultdict(list)
-        self.error_results = defaultdict(list)
 
         self._data_lock = threading.Lock()
+        # Notified under _data_lock whenever a task completes or errors, see wait_for_completion
+        self._counts_changed = threading.Condition(self._data_lock)
 
-    def _run_loop(self):
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
+        # While iter_results runs, or always with stream_results, completed results are streamed
+        # through this buffer of (fq_name, result) rather than kept in the result_store.
+        # _result_buffer_used counts the buffered results plus the running tasks that reserved room.
+        self._result_stream: Optional[Deque[Tuple[str, Any]]] = deque() if self.stream_results else None
+        self._result_buffer_used = 0
+        self._iterating_results = False
 
-    async def _execute_with_context(self, job: JobABC, task: Task):
-        """Execute a job with the job graph context manager.
-        
-        This ensures that the local async context variables are reset for each
-        coroutine that is executed.
+    def _start_loop(self):
+        """Start the event loops the tasks run on, each in a thread of its own."""
+        for shard in self._shards:
+            shard.start()
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """The first event loop the tasks run on, the only one unless loops is more than 1."""
+        return self._shards[0].loop
+
+    @property
+    def thread(self) -> Optional[threading.Thread]:
+        """The thread running loop."""
+        return self._shards[0].thread
+
+    def close(self):
+        """Shut down the FlowManager: release the resources held by its jobs, such as the
+        thread pools of wrapped functions, then stop its event loops and threads.
+        The FlowManager can't be used after it is closed.
+        """
+        self.close_jobs(self.job_graph_map)
+        for shard in self._shards:
+            shard.stop()
+        self.result_store.close()
+
+    async def _execute_with_context(self, job: JobABC, task: Task, shard: _EventLoopShard):
+        """Execute a job with the job graph context manager, once there is room for its result
+        if results are being streamed, see iter_results.
 
         Args:
             job: The job to execute
             task: The task to process
+            shard: The event loop the job runs on
             
         Returns:
             The result of the job execution
         """
-        # Create a job set for this job
-        job_set = JobABC.job_set(job)
+        reserved = await self._reserve_result_buffer_room(shard)
+        try:
+            return await self._run_job(job, task, shard)
+        except BaseException:
+            # No result will take the reserved room
+            if reserved:
+                self._release_result_buffer_room()
+            raise
+
+    async def _run_job(self, job: JobABC, task: Task, shard: _EventLoopShard):
+        """Execute a job with the job graph context manager, under admission control.
         
-        # Execute the job within the context manager
-        async with job_graph_context_manager(job_set):
-            return await job._execute(task)
+        This ensures that the local async context variables are reset for each
+        coroutine that is executed.
+        """
+        admission = shard.admission
+        if admission:
+            await admission.acquire()
+        try:
+            # Execute the job within the context manager
+            async with job_graph_context_manager():
+                return await job._execute(task)
+        finally:
+            if admission:
+                admission.release()
+
+    async def _reserve_result_buffer_room(self, shard: _EventLoopShard) -> bool:
+        """While results are streamed, wait for room in the buffer before a task starts, so tasks
+        never produce results faster than they are consumed. Returns True if room was reserved."""
+        if shard.result_buffer_room is None:
+            shard.result_buffer_room = asyncio.Event()
+        result_buffer_room = shard.result_buffer_room
+        while True:
+            # Cleared before the check, so room made after the check wakes the wait
+            result_buffer_room.clear()
+            with self._data_lock:
+                if self._result_stream is None:
+                    return False
+                if self._result_buffer_used < self.result_buffer_size:
+                    self._result_buffer_used += 1
+                    return True
+            await result_buffer_room.wait()
+
+    def _release_result_buffer_room(self):
+        """Called from any thread when a result leaves the buffer, or a task that reserved room fails."""
+        with self._data_lock:
+            # Room reserved in an earlier iteration may be released in this one
+            self._result_buffer_used = max(0, self._result_buffer_used - 1)
+        self._wake_result_buffer_waiters()
+
+    def _wake_result_buffer_waiters(self):
+        for shard in self._shards:
+            if shard.result_buffer_room is not None and shard.loop.is_running():
+                shard.loop.call_soon_threadsafe(shard.result_buffer_room.set)
     
 
-    def submit_task(self, task: Union[Dict[str, Any], List[Dict[str, Any]], str], fq_name: str = None):
+    def submit_task(self, task: Union[Dict[str, Any], List[Dict[str, Any]], str],
+                    fq_name: str = None) -> Union[Future, List[Future]]:
+        """Submit a task or list of tasks to run on the event loop, see FlowManagerABC.submit_task.
+
+        Returns:
+            A concurrent.futures.Future per task, a list of them for a list of tasks, that resolves to
+            the result of the graph's tail job or raises its error. The result is also kept for
+            pop_results as usual, unless a DropResultStore is used, see flow4ai.result_store.
+        """
         fq_name = self.check_fq_name_and_job_graph_map(fq_name)
 
         # Handle single task or list of tasks
         if isinstance(task, list):
-            for single_task in task:
-                self._submit_single_task(single_task, fq_name)
-        else:
-            self._submit_single_task(task, fq_name)
+            return [self._submit_single_task(single_task, fq_name) for single_task in task]
+        return self._submit_single_task(task, fq_name)
 
-    def _submit_single_task(self, task: Dict[str, Any], fq_name: str):
+    def _submit_single_task(self, task: Dict[str, Any], fq_name: str) -> Future:
         """Helper method to submit a single task to the job.
         
         Args:
             task: The task to submit
             fq_name: The fully qualified name of the job graph
+
+        Returns:
+            The future of the task's result
         """
         with self._data_lock:
             self.submitted_count += 1
+        job, task_obj = self._create_task(task, fq_name)
+        shard = self._shard_for(job.name)
+        coro = self._execute_with_context(job, task_obj, shard)
+        future = self._schedule(coro, shard)
+        future.add_done_callback(
+            lambda f: self._handle_completion(f, job, task_obj)
+        )
+        return future
+
+    def _create_task(self, task: Union[Dict[str, Any], str], fq_name: str) -> Tuple[JobABC, Task]:
+        """Returns the head job of the graph fq_name and the Task to run through it."""
         if not isinstance(task, dict):
             task = {'task': str(task)}
         task_obj = Task(task, fq_name)
         job = self.job_graph_map.get(task_obj.get_fq_name())
         if job is None:
             raise ValueError(f"Job not found for fq_name: {task_obj.get_fq_name()}")
-        coro = self._execute_with_context(job, task_obj)
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-        future.add_done_callback(
-            lambda f: self._handle_completion(f, job, task_obj)
-        )
+        return job, task_obj
+
+    def _shard_for(self, fq_name: str) -> _EventLoopShard:
+        """Returns the event loop to run the next task of the graph fq_name on, see loop_sharding."""
+        if len(self._shards) == 1:
+            return self._shards[0]
+        with self._data_lock:
+            if self.loop_sharding == self.LOOP_SHARDING_ROUND_ROBIN:
+                shard = self._shards[self._next_shard]
+                self._next_shard = (self._next_shard + 1) % len(self._shards)
+                return shard
+            shard = self._fq_name_shards.get(fq_name)
+            if shard is None:
+                shard = self._fq_name_shards[fq_name] = self._shards[len(self._fq_name_shards) % len(self._shards)]
+            return shard
+
+    def _schedule(self, coro, shard: _EventLoopShard):
+        """Run coro on the loop of shard, returns a future with a done callback for _handle_completion."""
+        return asyncio.run_coroutine_threadsafe(coro, shard.loop)
 
     def _handle_completion(self, future, job: JobABC, task: Task):
         result = None
@@ -113,7 +332,11 @@ class FlowManager(FlowManagerABC):
             with self._data_lock:
                 self.completed_count += 1
                 # job.name is fq_name
-                self.completed_results[job.name].append(result)
+                if self._result_stream is not None:
+                    self._result_stream.append((job.name, result))
+                else:
+                    self.result_store.add(COMPLETED, job.name, result)
+                self._counts_changed.notify_all()
                 
             if self.on_complete:
                 with self._data_lock:
@@ -127,10 +350,11 @@ class FlowManager(FlowManagerABC):
             self.logger.info("Detailed stack trace:", exc_info=True)
             with self._data_lock:
                 self.error_count += 1
-                self.error_results[job.name].append({
+                self.result_store.add(ERRORS, job.name, {
                     "error": e,
                     "task": task
                 })
+                self._counts_changed.notify_all()
 
     def get_fq_names_by_graph(self, graph_name, variant=""):
         """
@@ -182,7 +406,7 @@ class FlowManager(FlowManagerABC):
             variant: The variant name, defaults to empty string (e.g. pinecone or chromaDB) 
             
         Returns:
-            None
+            A Future or a list of Futures, see submit_task
             
         Raises:
             ValueError: If no matching graph is found or if multiple matches found
@@ -214,38 +438,110 @@ class FlowManager(FlowManagerABC):
                 'post_processing': self.post_processing_count
             }
 
+    def get_stats(self):
+        """Returns the task counts of get_counts, plus 'throttled', True while resource_limits are
+        holding back intake on any loop, 'admission_window', the most tasks run at once now over all
+        the loops, None for no cap, 'loop_lags' and 'max_loop_lags', the last and the largest sampled
+        lag in seconds of each event loop, None until sampled, and 'stored_results' and
+        'dropped_results', the completed results the result_store holds for pop_results and has dropped."""
+        stats = self.get_counts()
+        admissions = [shard.admission for shard in self._shards if shard.admission]
+        windows = [admission.window for admission in admissions]
+        stats['throttled'] = any(admission.throttled for admission in admissions)
+        stats['admission_window'] = sum(windows) if admissions and None not in windows else None
+        stats['loop_lags'] = [shard.lag for shard in self._shards]
+        stats['max_loop_lags'] = [shard.max_lag for shard in self._shards]
+        with self._data_lock:
+            stats['stored_results'] = self.result_store.count(COMPLETED)
+            stats['dropped_results'] = self.result_store.dropped[COMPLETED]
+        return stats
+
     def pop_results(self):
         with self._data_lock:
-            completed = dict(self.completed_results)
-            errors = dict(self.error_results)
-            self.completed_results.clear()
-            self.error_results.clear()
             return {
-                'completed': completed,
-                'errors': errors
+                'completed': self.result_store.pop(COMPLETED),
+                'errors': self.result_store.pop(ERRORS)
             }
             
+    def iter_results(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Yields the result of each completed task as soon as it completes, until every submitted
+        task has completed or errored, including tasks submitted while iterating.
+
+        Results completed before the iteration starts are yielded first. While iterating, results
+        are passed through a buffer rather than kept for pop_results, and at most result_buffer_size
+        tasks start before their results are consumed, so memory stays flat however many tasks run.
+        Errors are still kept for pop_results. Unless stream_results is set, results left in the
+        buffer when the iteration is stopped early go back to pop_results.
+
+        Args:
+            timeout: Maximum time in seconds to wait for each result, None to wait indefinitely.
+
+        Raises:
+            RuntimeError: If results are already being iterated.
+            TimeoutError: If no result arrives within timeout.
+        """
+        with self._data_lock:
+            if self._iterating_results:
+                raise RuntimeError("Results are already being iterated")
+            self._iterating_results = True
+            if self._result_stream is None:
+                self._result_stream = deque((fq_name, result) for fq_name, results in self.result_store.pop(COMPLETED).items()
+                                            for result in results)
+            stream = self._result_stream
+        try:
+            while True:
+                with self._counts_changed:
+                    if not self._counts_changed.wait_for(lambda: stream or self._all_tasks_done(), timeout=timeout):
+                        raise TimeoutError(f"Timed out waiting for a result after {timeout} seconds")
+                    if not stream:
+                        return
+                    _, result = stream.popleft()
+                self._release_result_buffer_room()
+                yield result
+        finally:
+            with self._data_lock:
+                self._iterating_results = False
+                if not self.stream_results:
+                    for fq_name, result in stream:
+                        self.result_store.add(COMPLETED, fq_name, result)
+                    self._result_stream = None
+                    self._result_buffer_used = 0
+            self._wake_result_buffer_waiters()
+
+    def _all_tasks_done(self) -> bool:
+        """Must be called with _data_lock held."""
+        return self.submitted_count == 0 or self.submitted_count == (self.completed_count + self.error_count)
+
     def wait_for_completion(self, timeout=10, check_interval=0.1):
         """
         Wait for all submitted tasks to complete or error out.
+
+        The wait is woken as each task completes or errors, so it returns as soon as the last one does.
         
         Args:
             timeout: Maximum time to wait in seconds. Defaults to 10 seconds.
-            check_interval: How often to check for completion in seconds. Defaults to 0.1 seconds.
+            check_interval: Unused, kept for backwards compatibility.
             
         Returns:
             bool: True if all tasks completed or errored, False if timed out
         """
         
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         
-        while (time.time() - start_time) < timeout:
+        while True:
+            remaining = deadline - time.monotonic()
+            # Woken at least every STATS_LOG_INTERVAL to log the stats
+            with self._counts_changed:
+                done = self._counts_changed.wait_for(self._all_tasks_done,
+                                                     timeout=max(0, min(self.STATS_LOG_INTERVAL, remaining)))
             counts = self.get_counts()
-            self.logger.info(f"Task Stats:\nErrors: {counts['errors']}, Submitted: {counts['submitted']}, Completed: {counts['completed']}, Post-processing: {counts['post_processing']}")
+            self._log_stats(f"Task Stats:\nErrors: {counts['errors']}, Submitted: {counts['submitted']}, Completed: {counts['completed']}, Post-processing: {counts['post_processing']}")
             # Return immediately if all tasks are complete or if there are no tasks at all
-            if counts['submitted'] == 0 or counts['submitted'] == (counts['completed'] + counts['errors']):
+            if done:
                 return True
-            time.sleep(check_interval)
+            if remaining <= self.STATS_LOG_INTERVAL:
+                break
             
         # Check one last time before returning
         counts = self.get_counts()
@@ -408,7 +704,10 @@ class FlowManager(FlowManagerABC):
             Exception: If any errors occurred during execution
         """
         tm = cls()
-        return tm.execute(task, dsl=dsl, graph_name=graph_name, timeout=timeout)
+        try:
+            return tm.execute(task, dsl=dsl, graph_name=graph_name, timeout=timeout)
+        finally:
+            tm.close()
 
     def display_results(self, results=None):
         """
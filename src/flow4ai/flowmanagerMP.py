@@ -1,25 +1,116 @@
 import asyncio
+import inspect
 # In theory it makes sense to use dill with the "multiprocess" package
 # instead of pickle with "multiprocessing", but in practice it leads to 
 # performance and stability issues.
 import multiprocessing as mp
 import pickle
 import queue
+import threading
 import time  # Added for poll_for_updates
+import weakref
+import zlib
 from multiprocessing import freeze_support, set_start_method
-from typing import Any, Callable, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import (Any, Awaitable, Callable, Dict, Iterator, List, Mapping,
+                    Optional, Union)
 
 from pydantic import BaseModel
 
+from flow4ai.admission import AdmissionController, ResourceLimits
 from flow4ai.flowmanager_base import FlowManagerABC
 
 from . import f4a_logging as logging
 from .dsl import DSLComponent
 from .job import JobABC, Task, job_graph_context_manager
 from .job_loader import ConfigLoader, JobFactory
+from .process_pool import shutdown_process_pool
+from .result_view import ResultView
 from .utils.monitor_utils import should_log_task_stats
 
 
+class PerWorkerCounter:
+    """
+    A counter in shared memory with one slot per process that writes to it.
+
+    A slot is only ever written by its own process, so increments take no lock, and value
+    sums the slots on read, like the value of an mp.Value. The job executor processes count
+    in their worker_index slot, so the parent can also tell how busy each worker is.
+    A process writing from more than one thread must serialise its own increments.
+    """
+
+    def __init__(self, num_workers: int = 1):
+        # 64 bit slots, aligned reads and writes of a slot are never torn
+        self.per_worker = mp.RawArray('q', num_workers)
+
+    @property
+    def value(self) -> int:
+        return sum(self.per_worker[:])
+
+    def increment(self, worker_index: int = 0, amount: int = 1) -> None:
+        self.per_worker[worker_index] += amount
+
+
+class AdmissionStats:
+    """
+    The admission window and throttle state of each job executor process, in shared memory.
+
+    Written only by the worker of the slot, the same way as PerWorkerCounter, and read by get_stats.
+    A window of -1 means the worker has no cap on the tasks it runs at once.
+    """
+
+    def __init__(self, num_workers: int, window: Optional[int] = None):
+        self.windows = mp.RawArray('q', [-1 if window is None else window] * num_workers)
+        self.throttled = mp.RawArray('b', num_workers)
+
+    def publish(self, worker_index: int, admission: AdmissionController) -> None:
+        self.windows[worker_index] = -1 if admission.window is None else admission.window
+        self.throttled[worker_index] = admission.throttled
+
+
+class EndOfResults:
+    """Sent by the parent to each result processor, once per processor, after every job executor
+    process has exited, so it comes after all of their results."""
+
+
+class ResultBatcher:
+    """
+    Collects results into batches for an on_complete_batch callback.
+
+    A batch is handed off once it holds batch_size results, or batch_linger seconds after its
+    first result arrived, whichever comes first, and whatever is left by a final flush.
+    """
+
+    def __init__(self, on_complete_batch: Callable[[List[Any]], None], batch_size: int, batch_linger: float, logger):
+        self.on_complete_batch = on_complete_batch
+        self.batch_size = batch_size
+        self.batch_linger = batch_linger
+        self.logger = logger
+        self.batch: List[Any] = []
+        self._deadline = 0.0
+
+    def add(self, result: Any) -> None:
+        if not self.batch:
+            self._deadline = time.monotonic() + self.batch_linger
+        self.batch.append(result)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def time_left(self) -> Optional[float]:
+        """Seconds until the waiting batch is due, None when there is no batch waiting."""
+        return max(0.0, self._deadline - time.monotonic()) if self.batch else None
+
+    def flush(self) -> None:
+        if not self.batch:
+            return
+        batch, self.batch = self.batch, []
+        try:
+            self.on_complete_batch(batch)
+        except Exception as e:
+            self.logger.error(f"Error processing a batch of {len(batch)} results: {e}")
+            self.logger.info("Detailed stack trace:", exc_info=True)
+
+
 class FlowManagerMP(FlowManagerABC):
     """
     FlowManagerMP executes up to thousands of tasks in parallel using one or more Jobs passed into constructor.
@@ -36,12 +127,73 @@ class FlowManagerMP(FlowManagerABC):
             By default, this hand-off happens in parallel, immediately after a Job processes a task.
             Typically, this function is from an existing codebase that FlowManagerMP is supplementing.
             This function must be picklable, for parallel execution, see serial_processing parameter below.
-            This code is not assumed to be asyncio compatible.
+            It may be a coroutine function, e.g. to hand results off to an async web service or database,
+            in which case up to on_complete_concurrency results are awaited at once on an event loop.
 
         serial_processing (bool, optional): Forces on_complete to execute only after all tasks are completed by the Job.
             Enables an unpicklable on_complete to callable be used by setting serial_processing=True.  However, in most cases 
             changing on_complete to be picklable is straightforward and should be the default.
             Defaults to False.
+
+        num_workers (int, optional): The number of job executor processes, each running its own event loop,
+            so that CPU-heavy job graphs can use more than one core. Defaults to 1.
+
+        routing (str, optional): How tasks are shared between the job executor processes, one of
+            "round_robin", "least_loaded" (the worker with the fewest unfinished tasks) or "key_hash"
+            (tasks with the same routing_key value always go to the same worker). Defaults to "round_robin".
+
+        routing_key (str, optional): The task key hashed by the "key_hash" routing, tasks without this key
+            are routed round robin. Defaults to "fq_name", the job graph the task is submitted to.
+
+        task_batch_size (int, optional): Tasks are sent to a worker in batches of up to this many tasks,
+            one queue put and one pickle per batch rather than per task. 1 sends every task on its own.
+            Defaults to 100.
+
+        task_batch_linger (float, optional): The longest time in seconds a task waits for its batch to fill
+            before the batch is sent anyway. A list of tasks passed to submit_task is sent without waiting,
+            and so is everything still waiting when close_processes is called. Defaults to 0.005.
+
+        max_in_flight (Optional[int], optional): The most tasks each job executor process runs at once, the
+            worker takes further tasks off its queue only as running ones finish. Defaults to None, no limit.
+
+        max_queued (Optional[int], optional): The most submitted tasks that no worker has started yet. When
+            submit_task would exceed it, it waits for room or, with reject_when_full, returns False.
+            Together with max_in_flight this bounds memory whatever the number of tasks submitted.
+            Defaults to None, no limit.
+
+        submit_timeout (Optional[float], optional): The longest time in seconds submit_task waits for room
+            under max_queued before raising TimeoutError. Defaults to None, wait for as long as it takes.
+
+        reject_when_full (bool, optional): Makes submit_task return False straight away, submitting nothing,
+            when its tasks do not fit under max_queued. Defaults to False.
+
+        on_complete_concurrency (int, optional): The most results a coroutine on_complete is awaited for
+            at once, in each result processor, so slow sinks overlap rather than hold up the whole pipeline.
+            Ignored for a plain function. Defaults to 100.
+
+        on_complete_batch (Optional[Callable[[List[Any]], None]], optional): Called with lists of results,
+            of up to result_batch_size results, so sinks like bulk database inserts or Parquet writers pay
+            their per-call cost once per batch. May be used with or without on_complete, and must be picklable
+            the same way. Defaults to None.
+
+        result_batch_size (int, optional): The most results in a batch for on_complete_batch. Defaults to 100.
+
+        result_batch_linger (float, optional): The longest time in seconds a result waits for its batch to fill
+            before the batch is handed to on_complete_batch anyway. Defaults to 0.05.
+
+        num_result_processors (int, optional): The number of result processor processes, taking results off
+            one shared queue, for an on_complete or on_complete_batch that can't keep up in one process.
+            Results are then handed off in no particular order. Defaults to 1.
+
+        result_buffer_size (Optional[int], optional): The most results queued between the job executor
+            processes and whatever takes them, the result processors, serial processing or iter_results.
+            Once it is full, workers keep running their tasks, but wait for room before queuing more results.
+            Results that were never iterated are discarded by close_processes. None for no limit. Defaults to None.
+
+        resource_limits (Optional[ResourceLimits], optional): RSS, event loop lag and open file descriptor
+            thresholds, sampled by each job executor process. Over a threshold, a worker cuts the number of
+            tasks it runs at once and grows it back once under them, see flow4ai.admission. The throttle
+            state is reported by get_stats. Defaults to None, no resource aware admission.
     """
     _lock = mp.RLock()  # Lock for thread-safe initialization
     _instance = None  # Singleton instance
@@ -49,50 +201,156 @@ class FlowManagerMP(FlowManagerABC):
     JOB_MAP_LOAD_TIME = 5  # Timeout in seconds for job map loading
     EXECUTOR_SHUTDOWN_TIMEOUT = -1  # Timeout in seconds for executor shutdown
     RESULT_PROCESSOR_SHUTDOWN_TIMEOUT = -1  # Timeout in seconds for result processor shutdown
+    # Task routing between job executor processes
+    ROUTING_ROUND_ROBIN = "round_robin"
+    ROUTING_LEAST_LOADED = "least_loaded"
+    ROUTING_KEY_HASH = "key_hash"
+    ROUTINGS = (ROUTING_ROUND_ROBIN, ROUTING_LEAST_LOADED, ROUTING_KEY_HASH)
+    DEFAULT_TASK_BATCH_SIZE = 100
+    DEFAULT_TASK_BATCH_LINGER = 0.005
+    QUEUE_ROOM_CHECK_INTERVAL = 0.1  # Seconds between checks that a worker is alive while waiting under max_queued
+    RESULT_QUEUE_FULL_MIN_BACKOFF = 0.001  # Seconds a worker first waits for room in a full result queue
+    RESULT_QUEUE_FULL_MAX_BACKOFF = 0.05  # The wait doubles on each try up to this
+    DEFAULT_ON_COMPLETE_CONCURRENCY = 100
+    DEFAULT_RESULT_BATCH_SIZE = 100
+    DEFAULT_RESULT_BATCH_LINGER = 0.05
+    _END_OF_RESULTS = object()  # Returned once every worker has sent its completion signal
 
     def __init__(self, dsl: Optional[Any] = None, on_complete: Optional[Callable[[Any], None]] = None, 
-                 serial_processing: bool = False):
+                 serial_processing: bool = False, num_workers: int = 1,
+                 routing: str = ROUTING_ROUND_ROBIN, routing_key: str = "fq_name",
+                 task_batch_size: int = DEFAULT_TASK_BATCH_SIZE,
+                 task_batch_linger: float = DEFAULT_TASK_BATCH_LINGER,
+                 max_in_flight: Optional[int] = None, max_queued: Optional[int] = None,
+                 submit_timeout: Optional[float] = None, reject_when_full: bool = False,
+                 resource_limits: Optional[ResourceLimits] = None,
+                 on_complete_concurrency: int = DEFAULT_ON_COMPLETE_CONCURRENCY,
+                 on_complete_batch: Optional[Callable[[List[Any]], None]] = None,
+                 result_batch_size: int = DEFAULT_RESULT_BATCH_SIZE,
+                 result_batch_linger: float = DEFAULT_RESULT_BATCH_LINGER,
+                 num_result_processors: int = 1,
+                 result_buffer_size: Optional[int] = None):
         super().__init__()
         # Get logger for FlowManagerMP
         self.logger = logging.getLogger('FlowManagerMP')
         self.logger.info("Initializing FlowManagerMP")
-        if not serial_processing and on_complete:
-            self._check_picklable(on_complete)
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError(f"num_workers must be a positive integer, got {num_workers!r}")
+        if routing not in self.ROUTINGS:
+            raise ValueError(f"Invalid routing {routing!r}, expected one of {', '.join(self.ROUTINGS)}")
+        if not isinstance(task_batch_size, int) or task_batch_size < 1:
+            raise ValueError(f"task_batch_size must be a positive integer, got {task_batch_size!r}")
+        if task_batch_linger <= 0:
+            raise ValueError(f"task_batch_linger must be greater than 0, got {task_batch_linger!r}")
+        for name, value in (("on_complete_concurrency", on_complete_concurrency),
+                            ("result_batch_size", result_batch_size),
+                            ("num_result_processors", num_result_processors)):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"{name} must be a positive integer, got {value!r}")
+        if result_batch_linger <= 0:
+            raise ValueError(f"result_batch_linger must be greater than 0, got {result_batch_linger!r}")
+        for name, limit in (("max_in_flight", max_in_flight), ("max_queued", max_queued),
+                            ("result_buffer_size", result_buffer_size)):
+            if limit is not None and (not isinstance(limit, int) or limit < 1):
+                raise ValueError(f"{name} must be a positive integer or None, got {limit!r}")
+        if not serial_processing:
+            for callback in (on_complete, on_complete_batch):
+                if callback:
+                    self._check_picklable(callback)
+        self.num_workers = num_workers
+        self.routing = routing
+        self.routing_key = routing_key
+        self._next_worker = 0
+        # Tasks sent to each worker, minus the tasks it finished gives its load
+        self._tasks_routed = [0] * num_workers
+        # Serialises the submitting threads' routing, _next_worker and _tasks_routed
+        self._routing_lock = threading.Lock()
         # tasks are created by submit_task(), with [fq_name] added to the task dict
-        # tasks are then sent to queue for processing
-        self._task_queue: mp.Queue[Task] = mp.Queue()  
+        # tasks are then sent to the queue of the worker they are routed to for processing
+        self._task_queues: List[mp.Queue] = [mp.Queue() for _ in range(num_workers)]
+        self._task_queue: mp.Queue[Task] = self._task_queues[0]
+        # Tasks waiting to be sent to each worker as one batch, sent when full or by the batch flusher thread
+        self.task_batch_size = task_batch_size
+        self.task_batch_linger = task_batch_linger
+        self._task_batches: List[List[Task]] = [[] for _ in range(num_workers)]
+        self._task_batches_lock = threading.Lock()
+        self._batch_flusher: Optional[threading.Thread] = None
+        self._stop_batch_flusher = threading.Event()
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.submit_timeout = submit_timeout
+        self.reject_when_full = reject_when_full
+        self.resource_limits = resource_limits
+        self.admission_stats = AdmissionStats(num_workers, max_in_flight)
+        # One permit per task that may be queued under max_queued, taken by submit_task and given back by a
+        # worker as it starts the task, so a submitter waiting for room wakes as soon as there is some
+        self._queue_room = mp.Semaphore(max_queued) if max_queued is not None else None
+        # Held by reject_when_full while it takes the permits for all of its tasks
+        self._admission_lock = threading.Lock()
         # INTERNAL USE ONLY. DO NOT ACCESS DIRECTLY.
         # This queue is for internal communication between the job executor and result processor.
-        # To process results, use the on_complete parameter in the FlowManagerMP constructor.
+        # To process results, use the on_complete parameter in the FlowManagerMP constructor, or iter_results.
         # See test_result_processing.py for examples of proper result handling.
-        self._result_queue = mp.Queue()  # type: mp.Queue
-        self.job_executor_process = None
-        self.result_processor_process = None
+        self._result_queue = mp.Queue(result_buffer_size or 0)  # type: mp.Queue
+        self.result_buffer_size = result_buffer_size
+        # Results and errors taken off _result_queue by iter_results, one per finished task
+        self._results_received = 0
+        self._iterating_results = False
+        self.job_executor_processes: List[mp.Process] = []
+        self.job_executor_process = None  # the first of job_executor_processes
+        self.result_processor_processes: List[mp.Process] = []
+        self.result_processor_process = None  # the first of result_processor_processes
         self.on_complete = on_complete
+        self.on_complete_concurrency = on_complete_concurrency
+        self.on_complete_batch = on_complete_batch
+        self.result_batch_size = result_batch_size
+        self.result_batch_linger = result_batch_linger
+        self.num_result_processors = num_result_processors
         self.serial_processing = serial_processing
         
-        # Create a manager for sharing objects between processes
-        self._manager = mp.Manager()
-        # !! This object allows us to pass the job name map between processes
-        #     so we don't have to pickle the entire job map
-        self._fq_name_map = self._manager.dict()
-        # Create an event to signal when jobs are loaded
+        # The job name map, fq_name to job set string, is a read-only local snapshot so that checking a
+        # task's fq_name costs no IPC. _fq_name_map_version counts how many times it has been published.
+        self._fq_name_map: Mapping[str, str] = MappingProxyType({})
+        self._fq_name_map_version = 0
+        # Jobs loaded from config are only known once worker 0 has loaded them, it sends their names back
+        # over this queue once
+        self._fq_name_map_queue: Optional[mp.Queue] = None if dsl else mp.Queue()
+        # Create an event to signal when jobs are loaded, it is set once every worker has loaded them
         self._jobs_loaded = mp.Event()
+        self._workers_loaded = mp.Value('i', 0)
+        # Set by a worker when it finishes the last task submitted so far, see wait_for_completion
+        self._tasks_done = mp.Event()
 
-        # Initialize shared counters for task monitoring
-        self.tasks_submitted = mp.Value('i', 0)
-        self.tasks_in_progress = mp.Value('i', 0)
-        self.tasks_completed = mp.Value('i', 0)
-        self.post_processing_tasks = mp.Value('i', 0)
-        self.job_errors = mp.Value('i', 0) # Added job_errors counter
+        # Initialize shared counters for task monitoring, see get_stats(). Submitted tasks are counted by
+        # this process, post-processed results by the result processors or this process, never both.
+        self.tasks_submitted = PerWorkerCounter()
+        self.tasks_in_progress = PerWorkerCounter(num_workers)
+        self.tasks_completed = PerWorkerCounter(num_workers)
+        self.post_processing_tasks = PerWorkerCounter(num_result_processors)
+        self.job_errors = PerWorkerCounter(num_workers) # Added job_errors counter
+        # Serialises the submitting threads' increments of tasks_submitted
+        self._tasks_submitted_lock = threading.Lock()
 
         if dsl:
             self.create_job_graph_map(dsl)
-            self._fq_name_map.clear()
-            self._fq_name_map.update({job.name: job.job_set_str() for job in self.job_graph_map.values()})
+            self._publish_fq_name_map({job.name: job.job_set_str() for job in self.job_graph_map.values()})
         
         self._start()
 
+    def _publish_fq_name_map(self, fq_name_map: Dict[str, str]) -> None:
+        """Replace the job name map snapshot, a job graph reload publishes its new map here."""
+        self._fq_name_map = MappingProxyType(dict(fq_name_map))
+        self._fq_name_map_version += 1
+
+    def _receive_fq_name_map(self, timeout: float) -> None:
+        """Take the job name map sent by worker 0 when the jobs come from config, it is sent only once."""
+        if self._fq_name_map_queue is None or self._fq_name_map_version:
+            return
+        try:
+            self._publish_fq_name_map(self._fq_name_map_queue.get(timeout=timeout))
+        except queue.Empty:
+            raise TimeoutError("Timed out waiting for the job names from the job executor process")
+
     # We will not to use context manager as it makes semantics of FlowManagerMP use less flexible
     # def __enter__(self):
     #     """Initialize resources when entering the context."""
@@ -120,33 +378,39 @@ class FlowManagerMP(FlowManagerABC):
         """
         self.logger.info("Cleaning up FlowManagerMP resources")
         
-        if self.job_executor_process:
-            if self.job_executor_process.is_alive():
-                self.logger.debug("Terminating job executor process")
-                self.job_executor_process.terminate()
+        if getattr(self, '_stop_batch_flusher', None):
+            self._stop_batch_flusher.set()
+
+        for job_executor_process in getattr(self, 'job_executor_processes', []):
+            if job_executor_process.is_alive():
+                self.logger.debug(f"Terminating job executor process {job_executor_process.name}")
+                job_executor_process.terminate()
                 self.logger.debug("Joining job executor process")
                 if self.EXECUTOR_SHUTDOWN_TIMEOUT != -1:
-                    self.job_executor_process.join(timeout=self.EXECUTOR_SHUTDOWN_TIMEOUT)
+                    job_executor_process.join(timeout=self.EXECUTOR_SHUTDOWN_TIMEOUT)
                 else:
-                    self.job_executor_process.join()
+                    job_executor_process.join()
                 self.logger.debug("Job executor process joined")
         
-        if self.result_processor_process:
-            if self.result_processor_process.is_alive():
-                self.logger.debug("Terminating result processor process")
-                self.result_processor_process.terminate()
+        for result_processor_process in getattr(self, 'result_processor_processes', []):
+            if result_processor_process.is_alive():
+                self.logger.debug(f"Terminating result processor process {result_processor_process.name}")
+                result_processor_process.terminate()
                 self.logger.debug("Joining result processor process")
                 if self.RESULT_PROCESSOR_SHUTDOWN_TIMEOUT != -1:
-                    self.result_processor_process.join(timeout=self.RESULT_PROCESSOR_SHUTDOWN_TIMEOUT)
+                    result_processor_process.join(timeout=self.RESULT_PROCESSOR_SHUTDOWN_TIMEOUT)
                 else:
-                    self.result_processor_process.join()
+                    result_processor_process.join()
                 self.logger.debug("Result processor process joined")
         
-        if hasattr(self, '_task_queue'):
+        task_queues = list(getattr(self, '_task_queues', []))
+        if getattr(self, '_fq_name_map_queue', None) is not None:
+            task_queues.append(self._fq_name_map_queue)
+        for task_queue in task_queues:
             self.logger.debug("Closing task queue")
-            self._task_queue.close()
+            task_queue.close()
             self.logger.debug("Joining task queue thread")
-            self._task_queue.join_thread()
+            task_queue.join_thread()
             self.logger.debug("Task queue thread joined")
         
         if hasattr(self, '_result_queue'):
@@ -181,30 +445,64 @@ class FlowManagerMP(FlowManagerABC):
     
     def _start(self):
         """Start the job executor and result processor processes - non-blocking."""
-        self.logger.debug("Starting job executor process")
-        self.job_executor_process = mp.Process(
-            target=self._async_worker,
-            args=(self.job_graph_map, self._task_queue, self._result_queue, 
-                  self._fq_name_map, self._jobs_loaded, ConfigLoader.directories,
-                  self.tasks_in_progress, self.tasks_completed, self.job_errors), # Pass counters
-            name="JobExecutorProcess"
-        )
-        self.job_executor_process.start()
-        self.logger.info(f"Job executor process started with PID {self.job_executor_process.pid}")
-
-        if self.on_complete and not self.serial_processing:
-            self.logger.debug("Starting result processor process")
-            self.result_processor_process = mp.Process(
-                target=self._result_processor,
-                args=(self.on_complete, self._result_queue, 
-                      self.post_processing_tasks), # Pass counter
-                name="ResultProcessorProcess"
+        for worker_index in range(self.num_workers):
+            self.logger.debug(f"Starting job executor process {worker_index}")
+            job_executor_process = mp.Process(
+                target=self._async_worker,
+                args=(self.job_graph_map, self._task_queues[worker_index], self._result_queue, 
+                      self._fq_name_map_queue, self._jobs_loaded, ConfigLoader.directories,
+                      self.tasks_in_progress, self.tasks_completed, self.job_errors, # Pass counters
+                      worker_index, self._workers_loaded, self.num_workers, self.max_in_flight,
+                      self.resource_limits, self.admission_stats, self.tasks_submitted, self._tasks_done,
+                      self._queue_room),
+                name="JobExecutorProcess" if worker_index == 0 else f"JobExecutorProcess-{worker_index}"
             )
-            self.result_processor_process.start()
-            self.logger.info(f"Result processor process started with PID {self.result_processor_process.pid}")
+            job_executor_process.start()
+            self.job_executor_processes.append(job_executor_process)
+            self.logger.info(f"Job executor process {worker_index} started with PID {job_executor_process.pid}")
+        self.job_executor_process = self.job_executor_processes[0]
+
+        if self._has_result_handler() and not self.serial_processing:
+            for processor_index in range(self.num_result_processors):
+                self.logger.debug(f"Starting result processor process {processor_index}")
+                result_processor_process = mp.Process(
+                    target=self._result_processor,
+                    args=(self.on_complete, self._result_queue, 
+                          self.post_processing_tasks, # Pass counter
+                          processor_index, self.on_complete_concurrency, self.on_complete_batch,
+                          self.result_batch_size, self.result_batch_linger),
+                    name="ResultProcessorProcess" if processor_index == 0 else f"ResultProcessorProcess-{processor_index}"
+                )
+                result_processor_process.start()
+                self.result_processor_processes.append(result_processor_process)
+                self.logger.info(f"Result processor process {processor_index} started with PID {result_processor_process.pid}")
+            self.result_processor_process = self.result_processor_processes[0]
+
+        if self.task_batch_size > 1:
+            # Started after the processes, so that no process is forked while the thread holds a lock
+            self._batch_flusher = threading.Thread(
+                target=self._flush_task_batches_periodically,
+                args=(weakref.ref(self), self._stop_batch_flusher, self.task_batch_linger),
+                name="TaskBatchFlusher", daemon=True)
+            self._batch_flusher.start()
+
+    def _has_result_handler(self) -> bool:
+        return bool(self.on_complete or self.on_complete_batch)
+
+    def submit_task(self, task: Union[Dict[str, Any], List[Dict[str, Any]], str], fq_name: Optional[str] = None) -> bool:
+        """Submit a task, or a list of tasks, to the job graph fq_name.
+
+        Under max_queued, waits for room for each task, or with reject_when_full submits either
+        all of the tasks or none of them.
 
-    # TODO: add resource usage monitoring which returns False if resource use is too high.
-    def submit_task(self, task: Union[Dict[str, Any], List[Dict[str, Any]], str], fq_name: Optional[str] = None):
+        Returns:
+            bool: False if nothing was submitted, because task is None or reject_when_full rejected
+                the tasks, True otherwise.
+
+        Raises:
+            TimeoutError: If the jobs do not load in time, or there is no room under max_queued
+                within submit_timeout.
+        """
         # Wait for jobs to be loaded and the self._job_name_map to be populated
         if not self._jobs_loaded.wait(timeout=self.JOB_MAP_LOAD_TIME):
             # Check stderr from JobExecutorProcess for underlying errors
@@ -221,19 +519,84 @@ class FlowManagerMP(FlowManagerABC):
                 error_message += f"\nJobExecutorProcess stderr:\n{stderr_output}"
             self.logger.error(error_message)
             raise TimeoutError(error_message)
-
+        self._receive_fq_name_map(self.JOB_MAP_LOAD_TIME)
 
         if task is None:
             self.logger.warning("Received None task, skipping")
-            return
+            return False
 
         fq_name = self.check_fq_name_and_job_graph_map(fq_name, self._fq_name_map)
 
+        if self.max_queued is not None:
+            return self._submit_within_max_queued(task, fq_name)
+
         if isinstance(task, list):
-            for single_task in task:
-                self._submit_single_task(single_task, fq_name)
+            submitted = 0
+            try:
+                for single_task in task:
+                    self._submit_single_task(single_task, fq_name)
+                    submitted += 1
+            finally:
+                # The whole list is available now, so its last batches are not left to linger
+                self._flush_task_batches()
+                self._count_submitted(submitted)
         else:
             self._submit_single_task(task, fq_name)
+            self._count_submitted(1)
+        return True
+
+    def _submit_within_max_queued(self, task: Union[Dict[str, Any], List[Dict[str, Any]], str], fq_name: str) -> bool:
+        """Submit the tasks, counting each one as it is submitted so the room under max_queued stays exact."""
+        tasks = task if isinstance(task, list) else [task]
+        try:
+            if self.reject_when_full:
+                if not self._take_queue_room(len(tasks)):
+                    self.logger.debug(f"Rejected {len(tasks)} task(s), max_queued={self.max_queued} reached")
+                    return False
+                for single_task in tasks:
+                    self._submit_single_task(single_task, fq_name)
+                    self._count_submitted(1)
+            else:
+                for single_task in tasks:
+                    self._wait_for_queue_room()
+                    self._submit_single_task(single_task, fq_name)
+                    self._count_submitted(1)
+        finally:
+            if isinstance(task, list):
+                self._flush_task_batches()
+        return True
+
+    def _take_queue_room(self, count: int) -> bool:
+        """Take the permits for count tasks under max_queued without waiting, all of them or none."""
+        with self._admission_lock:
+            taken = 0
+            while taken < count and self._queue_room.acquire(block=False):
+                taken += 1
+            if taken == count:
+                return True
+            for _ in range(taken):
+                self._queue_room.release()
+            return False
+
+    def _wait_for_queue_room(self) -> None:
+        """Block until a worker starts a task and so makes room for one more under max_queued."""
+        deadline = None if self.submit_timeout is None else time.monotonic() + self.submit_timeout
+        while True:
+            wait = self.QUEUE_ROOM_CHECK_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(deadline - time.monotonic(), 0))
+            if self._queue_room.acquire(timeout=wait):
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out after {self.submit_timeout} seconds waiting for room "
+                                   f"under max_queued={self.max_queued}")
+            if not any(process.is_alive() for process in self.job_executor_processes):
+                raise RuntimeError("No job executor process is running to take the queued tasks")
+
+    def _count_submitted(self, count: int) -> None:
+        if count:
+            with self._tasks_submitted_lock:
+                self.tasks_submitted.increment(amount=count)
 
     def _submit_single_task(self, task: Union[Dict[str, Any], str], fq_name: str) -> None:
         """Process and submit a single task to the task queue.
@@ -248,12 +611,65 @@ class FlowManagerMP(FlowManagerABC):
         # Check the string based _fq_name_map to ensure the fq_name is valid
         # Once the task is sent to the separate process the job graph will be 
         # looked up by the job name
-        job_name = self._fq_name_map.get(task_obj.get_fq_name())
-        if job_name is None:
+        if task_obj.get_fq_name() not in self._fq_name_map:
             raise ValueError(f"Job not found for fq_name: {task_obj.get_fq_name()}")
-        self._task_queue.put(task_obj)
-        with self.tasks_submitted.get_lock():
-            self.tasks_submitted.value += 1
+        with self._routing_lock:
+            worker_index = self._route_task(task_obj)
+            self._tasks_routed[worker_index] += 1
+        if self.task_batch_size == 1:
+            self._task_queues[worker_index].put(task_obj)
+            return
+        with self._task_batches_lock:
+            batch = self._task_batches[worker_index]
+            batch.append(task_obj)
+            if len(batch) >= self.task_batch_size:
+                self._task_queues[worker_index].put(batch)
+                self._task_batches[worker_index] = []
+
+    def _flush_task_batches(self) -> None:
+        """Send every batch of tasks that is waiting, however many tasks it holds."""
+        with self._task_batches_lock:
+            for worker_index, batch in enumerate(self._task_batches):
+                if batch:
+                    self._task_queues[worker_index].put(batch)
+                    self._task_batches[worker_index] = []
+
+    @staticmethod
+    def _flush_task_batches_periodically(flowmanager_ref: 'weakref.ref[FlowManagerMP]',
+                                         stop: threading.Event, linger: float) -> None:
+        """Runs in the batch flusher thread, sending waiting batches every linger seconds.
+        Holds only a weak reference, so the FlowManagerMP can still be garbage collected."""
+        while not stop.wait(linger):
+            flowmanager = flowmanager_ref()
+            if flowmanager is None:
+                return
+            flowmanager._flush_task_batches()
+            del flowmanager
+
+    def _route_task(self, task: Task) -> int:
+        """Returns the index of the job executor process the task is sent to, called with _routing_lock held.
+
+        Args:
+            task: The task being submitted
+
+        Returns:
+            int: The index of a worker, according to the routing given in the constructor
+        """
+        if self.num_workers == 1:
+            return 0
+        if self.routing == self.ROUTING_LEAST_LOADED:
+            completed = self.tasks_completed.per_worker[:]
+            errors = self.job_errors.per_worker[:]
+            loads = [self._tasks_routed[i] - completed[i] - errors[i] for i in range(self.num_workers)]
+            return loads.index(min(loads))
+        if self.routing == self.ROUTING_KEY_HASH:
+            key = task.get(self.routing_key)
+            if key is not None:
+                # crc32 rather than hash, str hashes change with every interpreter run
+                return zlib.crc32(str(key).encode()) % self.num_workers
+        worker_index = self._next_worker
+        self._next_worker = (worker_index + 1) % self.num_workers
+        return worker_index
 
 
     def close_processes(self, timeout=10, check_interval=0.1):
@@ -267,19 +683,21 @@ class FlowManagerMP(FlowManagerABC):
         """
         self.logger.debug("Marking input as completed")
         self.logger.info("*** task_queue ended ***")
-        self._task_queue.put(None)
+        self._stop_batch_flusher.set()
+        self._flush_task_batches()
+        for task_queue in self._task_queues:
+            task_queue.put(None)
         
         caught_exception = None
         try:
+            if self._jobs_loaded.is_set():
+                # Take the job names even if nothing asked for them, so worker 0 can flush its queue and exit
+                self._receive_fq_name_map(self.JOB_MAP_LOAD_TIME)
             self.wait_for_completion(timeout=timeout, check_interval=check_interval)
         except Exception as e:
             self.logger.error(f"Exception caught during wait_for_completion: {str(e)}")
             caught_exception = e
         
-        # Send completion signal to result queue
-        self.logger.debug("Sending completion signal to result queue")
-        self._result_queue.put(None)
-        
         # Check for job errors that might not have been converted to exceptions yet
         if caught_exception is None and self.job_errors.value > 0:
             error_msg = f"Flow execution completed with {self.job_errors.value} error(s). Check logs for details."
@@ -288,42 +706,166 @@ class FlowManagerMP(FlowManagerABC):
         
         self._close_running_processes(caught_exception)
 
+    @staticmethod
+    def _is_async_on_complete(on_complete: Optional[Callable]) -> bool:
+        """True if on_complete is a coroutine function, or an object with an async __call__."""
+        return on_complete is not None and (inspect.iscoroutinefunction(on_complete) or
+                                            inspect.iscoroutinefunction(getattr(on_complete, '__call__', None)))
+
+    @staticmethod
+    def _read_queue_into_loop(source: 'mp.Queue', loop: asyncio.AbstractEventLoop, intake: asyncio.Queue,
+                              room: Optional[threading.Semaphore] = None, end_type: Optional[type] = None) -> None:
+        """Runs in a reader thread, blocking on source and handing each item to the event loop through
+        intake, so the loop sleeps while there is nothing to do instead of polling the queue.
+        Stops after a None item, or with end_type, after an end_type item.
+        With room, the thread waits for room before each get."""
+        while True:
+            if room:
+                room.acquire()
+            item = source.get()
+            try:
+                loop.call_soon_threadsafe(intake.put_nowait, item)
+            except RuntimeError:
+                # The event loop has already been closed
+                return
+            if isinstance(item, end_type) if end_type else item is None:
+                return
+
+    @staticmethod
+    async def _complete_results_async(on_complete: Callable[[Any], Awaitable[None]],
+                                      next_result: Callable[[], Awaitable[Any]],
+                                      count_result: Callable[[], None], concurrency: int, logger,
+                                      room: Optional[threading.Semaphore] = None) -> None:
+        """Await on_complete for up to concurrency results at once, until next_result returns
+        _END_OF_RESULTS. A result is only taken once there is room for it, so the rest wait in the queue.
+        room, the reader thread's, is released as each on_complete finishes."""
+        slots = asyncio.Semaphore(concurrency)
+        pending = set()
+
+        async def complete(result):
+            try:
+                await on_complete(result)
+            except Exception as e:
+                logger.error(f"Error processing result: {e}")
+                logger.info("Detailed stack trace:", exc_info=True)
+            finally:
+                slots.release()
+                if room:
+                    room.release()
+
+        while True:
+            await slots.acquire()
+            result = await next_result()
+            if result is FlowManagerMP._END_OF_RESULTS:
+                slots.release()
+                break
+            count_result()
+            completion = asyncio.create_task(complete(result))
+            pending.add(completion)
+            completion.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
     # Must be static because it's passed as a target to multiprocessing.Process
     # Instance methods can't be pickled properly for multiprocessing
-    # TODO: it may be necessary to put a flag to execute this using asyncio event loops
-    #          for example, when handing off to an async web service
     @staticmethod
-    def _result_processor(on_complete: Callable[[Any], None], result_queue: 'mp.Queue', 
-                          post_processing_counter: 'mp.Value'):
-        """Process that handles processing results as they arrive."""
+    def _result_processor(on_complete: Optional[Callable[[Any], None]], result_queue: 'mp.Queue', 
+                          post_processing_counter: PerWorkerCounter, processor_index: int = 0,
+                          on_complete_concurrency: int = 1,
+                          on_complete_batch: Optional[Callable[[List[Any]], None]] = None,
+                          result_batch_size: int = DEFAULT_RESULT_BATCH_SIZE,
+                          result_batch_linger: float = DEFAULT_RESULT_BATCH_LINGER):
+        """Process that handles processing results as they arrive.
+
+        There may be several of these processes taking results off the one queue, processor_index
+        is the slot this one counts in. Results are processed until an EndOfResults is received,
+        the parent sends one per processor once the job executor processes have exited. A coroutine
+        on_complete is awaited on an event loop, on_complete_concurrency results at a time.
+        on_complete_batch is called with batches of results, see ResultBatcher.
+        """
         logger = logging.getLogger('ResultProcessor')
-        logger.debug("Starting result processor")
+        logger.debug(f"Starting result processor {processor_index}")
+        batcher = ResultBatcher(on_complete_batch, result_batch_size, result_batch_linger,
+                                logger) if on_complete_batch else None
 
-        while True:
-            try:
-                result = result_queue.get()
-                if result is None:
-                    logger.debug("Received completion signal from result queue")
+        def count_result():
+            post_processing_counter.increment(processor_index)
+
+        if FlowManagerMP._is_async_on_complete(on_complete):
+            FlowManagerMP._async_result_processor(on_complete, result_queue, count_result,
+                                                  on_complete_concurrency, batcher, logger)
+        else:
+            while True:
+                try:
+                    result = result_queue.get(timeout=batcher.time_left() if batcher else None)
+                except queue.Empty:
+                    # The waiting batch is due
+                    batcher.flush()
+                    continue
+                if isinstance(result, EndOfResults):
                     break
-                
-                with post_processing_counter.get_lock():
-                    post_processing_counter.value += 1
-                
+                if result is None:
+                    logger.debug("Received a job executor completion signal from result queue")
+                    continue
+
+                count_result()
+
                 logger.debug(f"ResultProcessor received result: {result}")
-                try:
-                    # Handle both dictionary and non-dictionary results
-                    task_id = result.get('task', str(result)) if isinstance(result, dict) else str(result)
-                    logger.debug(f"Processing result for task {task_id}")
-                    on_complete(result)
-                    logger.debug(f"Finished processing result for task {task_id}")
-                except Exception as e:
-                    logger.error(f"Error processing result: {e}")
-                    logger.info("Detailed stack trace:", exc_info=True)
-            except queue.Empty:
-                continue
+                if on_complete:
+                    try:
+                        # Handle both dictionary and non-dictionary results
+                        task_id = result.get('task', str(result)) if isinstance(result, dict) else str(result)
+                        logger.debug(f"Processing result for task {task_id}")
+                        on_complete(result)
+                        logger.debug(f"Finished processing result for task {task_id}")
+                    except Exception as e:
+                        logger.error(f"Error processing result: {e}")
+                        logger.info("Detailed stack trace:", exc_info=True)
+                if batcher:
+                    batcher.add(result)
 
+        if batcher:
+            batcher.flush()
         logger.debug("Result processor shutting down")
 
+    @staticmethod
+    def _async_result_processor(on_complete: Callable[[Any], Awaitable[None]], result_queue: 'mp.Queue',
+                                count_result: Callable[[], None], on_complete_concurrency: int,
+                                batcher: Optional[ResultBatcher], logger) -> None:
+        async def process_results():
+            intake: asyncio.Queue = asyncio.Queue()
+            # The reader takes a result off result_queue only once an on_complete has finished, so the
+            # results this processor can't handle yet stay in the queue for the other processors
+            room = threading.Semaphore(on_complete_concurrency)
+            reader = threading.Thread(target=FlowManagerMP._read_queue_into_loop,
+                                      args=(result_queue, asyncio.get_running_loop(), intake, room, EndOfResults),
+                                      name="ResultQueueReader", daemon=True)
+            reader.start()
+
+            async def next_result():
+                while True:
+                    time_left = batcher.time_left() if batcher else None
+                    try:
+                        result = await asyncio.wait_for(intake.get(), time_left)
+                    except asyncio.TimeoutError:
+                        # The waiting batch is due
+                        batcher.flush()
+                        continue
+                    if isinstance(result, EndOfResults):
+                        return FlowManagerMP._END_OF_RESULTS
+                    if result is None:
+                        logger.debug("Received a job executor completion signal from result queue")
+                        room.release()
+                        continue
+                    if batcher:
+                        batcher.add(result)
+                    return result
+
+            await FlowManagerMP._complete_results_async(on_complete, next_result, count_result,
+                                                        on_complete_concurrency, logger, room)
+
+        asyncio.run(process_results())
+
     def _close_running_processes(self, exception=None):
         """Close all running processes.
         
@@ -337,41 +879,110 @@ class FlowManagerMP(FlowManagerABC):
         """
         self.logger.debug("Entering close running processes")
 
-        if self.on_complete and self.serial_processing:
+        if self._has_result_handler() and self.serial_processing:
             self._process_serial_results()
+        elif not self._has_result_handler():
+            # Nothing else will take the results that were not iterated
+            self._discard_results_until_workers_exit()
         
-        # Wait for job executor to finish
-        if self.job_executor_process and self.job_executor_process.is_alive():
-            self.logger.debug("Waiting for job executor process")
-            if self.EXECUTOR_SHUTDOWN_TIMEOUT != -1:
-                self.job_executor_process.join(timeout=self.EXECUTOR_SHUTDOWN_TIMEOUT)
-            else:
-                self.job_executor_process.join()
-            self.logger.debug("Job executor process completed")
-
-        # Wait for result processor to finish
-        if self.result_processor_process and self.result_processor_process.is_alive():
-            self.logger.debug("Waiting for result processor process")
-            if self.RESULT_PROCESSOR_SHUTDOWN_TIMEOUT != -1:
-                self.result_processor_process.join(timeout=self.RESULT_PROCESSOR_SHUTDOWN_TIMEOUT)
-            else:
-                self.result_processor_process.join()
-            self.logger.debug("Result processor process completed")
+        # Wait for job executors to finish
+        for job_executor_process in self.job_executor_processes:
+            if job_executor_process.is_alive():
+                self.logger.debug(f"Waiting for job executor process {job_executor_process.name}")
+                if self.EXECUTOR_SHUTDOWN_TIMEOUT != -1:
+                    job_executor_process.join(timeout=self.EXECUTOR_SHUTDOWN_TIMEOUT)
+                else:
+                    job_executor_process.join()
+                self.logger.debug("Job executor process completed")
+
+        # Wait for the result processors to finish
+        if any(p.is_alive() for p in self.result_processor_processes):
+            # The workers have exited, so these signals are queued after all their results.
+            # A processor stops at the first one it takes, so each processor gets one.
+            self.logger.debug("Sending end of results signals to result queue")
+            for _ in self.result_processor_processes:
+                self._result_queue.put(EndOfResults())
+            for result_processor_process in self.result_processor_processes:
+                self.logger.debug(f"Waiting for result processor process {result_processor_process.name}")
+                if self.RESULT_PROCESSOR_SHUTDOWN_TIMEOUT != -1:
+                    result_processor_process.join(timeout=self.RESULT_PROCESSOR_SHUTDOWN_TIMEOUT)
+                else:
+                    result_processor_process.join()
+            self.logger.debug("Result processor processes completed")
         
         self._cleanup(exception)
 
-    def _process_serial_results(self):
+    def _discard_results_until_workers_exit(self) -> None:
+        """Take the results left in the result queue and drop them, until every job executor process has
+        exited, so that no worker is left waiting for room under result_buffer_size or to flush its queue."""
+        deadline = None if self.EXECUTOR_SHUTDOWN_TIMEOUT == -1 else time.monotonic() + self.EXECUTOR_SHUTDOWN_TIMEOUT
+        discarded = 0
+        while any(p.is_alive() for p in self.job_executor_processes):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            try:
+                result = self._result_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if result is not None:
+                discarded += 1
+        if discarded:
+            self.logger.info(f"Discarded {discarded} result(s) that were not taken by iter_results")
+
+    def _next_serial_result(self, batcher: Optional[ResultBatcher] = None) -> Any:
+        """Blocks for the next result from the job executor processes, adding it to batcher if there is one.
+        Returns _END_OF_RESULTS once every worker has sent its completion signal, or no worker is left
+        alive to send it."""
         while True:
+            time_left = batcher.time_left() if batcher else None
             try:
                 self.logger.debug("Attempting to get result from queue")
-                result = self._result_queue.get(timeout=0.1)
-                if result is None:
-                    self.logger.debug("Received completion signal (None) from result queue")
-                    self.logger.info("No more results to process.")
+                result = self._result_queue.get(timeout=0.1 if time_left is None else min(0.1, time_left))
+            except queue.Empty:
+                if time_left == 0:
+                    # The waiting batch is due
+                    batcher.flush()
+                    continue
+                job_executor_is_alive = any(p.is_alive() for p in self.job_executor_processes)
+                self.logger.debug(f"Queue empty, job executor process alive status = {job_executor_is_alive}")
+                if not job_executor_is_alive:
+                    self.logger.debug("Job executor processes are not alive, breaking wait loop")
+                    return self._END_OF_RESULTS
+                continue
+            if result is None:
+                # Every job executor process sends a completion signal after its last result
+                self._serial_completion_signals += 1
+                self.logger.debug(f"Received completion signal (None) {self._serial_completion_signals}/{self.num_workers} from result queue")
+                if self._serial_completion_signals < self.num_workers:
+                    continue
+                self.logger.info("No more results to process.")
+                return self._END_OF_RESULTS
+            if batcher:
+                batcher.add(result)
+            return result
+
+    def _process_serial_results(self):
+        self._serial_completion_signals = 0
+        batcher = ResultBatcher(self.on_complete_batch, self.result_batch_size, self.result_batch_linger,
+                                self.logger) if self.on_complete_batch else None
+        try:
+            if self._is_async_on_complete(self.on_complete):
+                # The blocking gets run in a thread of the loop, so the awaited hand-offs overlap them
+                async def process_results():
+                    loop = asyncio.get_running_loop()
+                    await self._complete_results_async(
+                        self.on_complete, lambda: loop.run_in_executor(None, self._next_serial_result, batcher),
+                        self.post_processing_tasks.increment, self.on_complete_concurrency, self.logger)
+
+                asyncio.run(process_results())
+                return
+
+            while True:
+                result = self._next_serial_result(batcher)
+                if result is self._END_OF_RESULTS:
                     break
-                
-                with self.post_processing_tasks.get_lock():
-                    self.post_processing_tasks.value += 1
+
+                self.post_processing_tasks.increment()
 
                 if self.on_complete:
                     try:
@@ -383,13 +994,9 @@ class FlowManagerMP(FlowManagerABC):
                     except Exception as e:
                         self.logger.error(f"Error processing result: {e}")
                         self.logger.info("Detailed stack trace:", exc_info=True)
-            except queue.Empty:
-                job_executor_is_alive = self.job_executor_process and self.job_executor_process.is_alive()
-                self.logger.debug(f"Queue empty, job executor process alive status = {job_executor_is_alive}")
-                if not job_executor_is_alive:
-                    self.logger.debug("Job executor process is not alive, breaking wait loop")
-                    break
-                continue
+        finally:
+            if batcher:
+                batcher.flush()
 
     @staticmethod
     def _replace_pydantic_models(data: Any) -> Any:
@@ -397,7 +1004,7 @@ class FlowManagerMP(FlowManagerABC):
         logger = logging.getLogger('FlowManagerMP')
         logger.debug(f'Processing data type: {type(data)}')
 
-        if isinstance(data, dict):
+        if isinstance(data, (dict, ResultView)):
             return {k: FlowManagerMP._replace_pydantic_models(v) for k, v in data.items()}
         elif isinstance(data, list):
             return [FlowManagerMP._replace_pydantic_models(item) for item in data]
@@ -410,15 +1017,31 @@ class FlowManagerMP(FlowManagerABC):
     # Instance methods can't be pickled properly for multiprocessing
     @staticmethod
     def _async_worker(job_graph_map: Dict[str, JobABC], task_queue: 'mp.Queue', result_queue: 'mp.Queue', 
-                     job_name_map: 'mp.managers.DictProxy', jobs_loaded: 'mp.Event', 
+                     fq_name_map_queue: Optional['mp.Queue'], jobs_loaded: 'mp.Event', 
                      directories: list[str] = [],
-                     tasks_in_progress_counter: 'mp.Value' = None, 
-                     tasks_completed_counter: 'mp.Value' = None,
-                     job_errors_counter: 'mp.Value' = None): # Added job_errors_counter
-        """Process that handles making workflow calls using asyncio."""
+                     tasks_in_progress_counter: PerWorkerCounter = None, 
+                     tasks_completed_counter: PerWorkerCounter = None,
+                     job_errors_counter: PerWorkerCounter = None, # Added job_errors_counter
+                     worker_index: int = 0, workers_loaded: 'mp.Value' = None, num_workers: int = 1,
+                     max_in_flight: Optional[int] = None, resource_limits: Optional[ResourceLimits] = None,
+                     admission_stats: Optional[AdmissionStats] = None,
+                     tasks_submitted_counter: Optional[PerWorkerCounter] = None,
+                     tasks_done: Optional['mp.Event'] = None,
+                     queue_room: Optional['mp.Semaphore'] = None):
+        """Process that handles making workflow calls using asyncio.
+
+        There is one of these processes per worker, worker_index is the slot it counts in.
+        jobs_loaded is set by the last worker to load its jobs, so no task is routed to a
+        worker that is still loading. When the jobs are loaded from config, worker 0 sends
+        their names back on fq_name_map_queue. With max_in_flight or resource_limits, tasks
+        are taken off task_queue only as the admission window has room, so the unstarted
+        tasks wait in the parent. tasks_done is set whenever the completed and failed tasks of
+        all workers catch up with tasks_submitted_counter. Under max_queued, queue_room is
+        released once for each task started, making room for the next submitted task.
+        """
         # Get logger for AsyncWorker
         logger = logging.getLogger('AsyncWorker')
-        logger.debug("Starting async worker")
+        logger.debug(f"Starting async worker {worker_index}")
 
         # If job_map is empty, create it from SimpleJobLoader
         if not job_graph_map:
@@ -428,13 +1051,32 @@ class FlowManagerMP(FlowManagerABC):
             ConfigLoader.reload_configs()
             head_jobs = JobFactory.get_head_jobs_from_config()
             job_graph_map = {job.name: job for job in head_jobs}
-            # Update the shared job_name_map with each head job's complete set of reachable jobs
-            job_name_map.clear()
-            job_name_map.update({job.name: job.job_set_str() for job in head_jobs})
-            logger.info(f"Created job map with head jobs: {list(job_name_map.keys())}")
+            # Every worker loads the same jobs, the first one sends their names back
+            if worker_index == 0 and fq_name_map_queue is not None:
+                # Each head job's name with its complete set of reachable jobs
+                fq_name_map_queue.put({job.name: job.job_set_str() for job in head_jobs})
+                logger.info(f"Created job map with head jobs: {list(job_graph_map.keys())}")
+
+        # Signal that jobs are loaded once every worker has loaded them
+        if workers_loaded is None:
+            jobs_loaded.set()
+        else:
+            with workers_loaded.get_lock():
+                workers_loaded.value += 1
+                if workers_loaded.value == num_workers:
+                    jobs_loaded.set()
 
-        # Signal that jobs are loaded
-        jobs_loaded.set()
+        async def queue_result(item: Any) -> None:
+            """Put item in result_queue, waiting for room under result_buffer_size without blocking the loop,
+            so the other tasks keep running."""
+            backoff = FlowManagerMP.RESULT_QUEUE_FULL_MIN_BACKOFF
+            while True:
+                try:
+                    result_queue.put_nowait(item)
+                    return
+                except queue.Full:
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, FlowManagerMP.RESULT_QUEUE_FULL_MAX_BACKOFF)
 
         async def process_task(task: Task):
             """Process a single task and return its result"""
@@ -450,101 +1092,109 @@ class FlowManagerMP(FlowManagerABC):
                     if not fq_name:
                         raise ValueError("Task missing fq_name when multiple jobs are present")
                     job = job_graph_map[fq_name]
-                job_set = JobABC.job_set(job) #TODO: create a map of job to jobset in _async_worker
-                async with job_graph_context_manager(job_set):
+                async with job_graph_context_manager():
                     result = await job._execute(task)
                     processed_result = FlowManagerMP._replace_pydantic_models(result)
                     logger.debug(f"[TASK_TRACK] Completed task {task_id}, returned by job {processed_result[JobABC.RETURN_JOB]}")
                     
                     if tasks_completed_counter:
-                        with tasks_completed_counter.get_lock():
-                            tasks_completed_counter.value += 1
+                        tasks_completed_counter.increment(worker_index)
                     
-                    result_queue.put(processed_result)
+                    await queue_result(processed_result)
                     logger.debug(f"[TASK_TRACK] Result queued for task {task_id}")
             except Exception as e:
                 logger.error(f"[TASK_TRACK] Failed task {task_id}: {e}")
                 logger.info("Detailed stack trace:", exc_info=True)
                 if job_errors_counter: # Increment job_errors_counter
-                    with job_errors_counter.get_lock():
-                        job_errors_counter.value += 1
+                    job_errors_counter.increment(worker_index)
                 # Put the exception in the result queue to propagate error details
-                result_queue.put(e)
+                await queue_result(e)
                 logger.debug(f"[TASK_TRACK] Exception put in result queue for task {task_id}")
                 raise
 
+        admission = AdmissionController(resource_limits, max_in_flight) if max_in_flight or resource_limits else None
+        # Under admission control the reader holds one item at most until its tasks have all started
+        intake_room = threading.Semaphore(1) if admission else None
+
         async def queue_monitor():
             """Monitor the task queue and create tasks as they arrive"""
             logger.debug("Starting queue monitor")
             tasks = set()
-            pending_tasks = []
             tasks_created = 0
             tasks_completed_local = 0 # Renamed to avoid confusion with shared counter
             end_signal_received = False
+            all_tasks_done = asyncio.Event()
+            monitor = None
+            if resource_limits:
+                on_sample = (lambda a: admission_stats.publish(worker_index, a)) if admission_stats else None
+                monitor = asyncio.create_task(admission.monitor(on_sample))
 
-            while not end_signal_received or tasks:
-                # Get all available tasks from the queue
-                while True:
-                    try:
-                        task = task_queue.get_nowait()
-                        if task is None:
-                            logger.info("Received end signal in task queue")
-                            end_signal_received = True
-                            break
-                        
-                        if tasks_in_progress_counter:
-                            with tasks_in_progress_counter.get_lock():
-                                tasks_in_progress_counter.value += 1
-                        
-                        pending_tasks.append(task)
-                    except queue.Empty:
-                        break
-
-                # Create tasks in batch if we have any pending
-                if pending_tasks:
-                    logger.debug(f"Creating {len(pending_tasks)} new tasks")
-                    new_tasks = {asyncio.create_task(process_task(pending_tasks[i])) for i in range(len(pending_tasks))}
-                    tasks.update(new_tasks)
-                    tasks_created += len(new_tasks)
-                    logger.debug(f"Total tasks created: {tasks_created}")
-                    pending_tasks.clear()
-
-                # Clean up completed tasks
-                done_tasks = {t for t in tasks if t.done()}
-                if done_tasks:
-                    for done_task in done_tasks:
-                        try:
-                            # Check if task raised an exception
-                            exc = done_task.exception()
-                            if exc:
-                                logger.error(f"Task failed with exception: {exc}")
-                                logger.info("Detailed stack trace:", exc_info=True)
-                        except asyncio.InvalidStateError:
-                            pass  # Task was cancelled or not done
-                    tasks_completed_local += len(done_tasks)
-                    logger.debug(f"Cleaned up {len(done_tasks)} completed tasks. Total completed locally: {tasks_completed_local}")
-                    logger.debug(f"Active tasks remaining: {len(tasks)}")
-                tasks.difference_update(done_tasks)
-
+            def on_task_done(done_task: asyncio.Task):
+                nonlocal tasks_completed_local
+                tasks.discard(done_task)
+                if admission:
+                    admission.release()
+                tasks_completed_local += 1
+                if not done_task.cancelled():
+                    # Retrieve the exception so asyncio does not report it as never retrieved
+                    exc = done_task.exception()
+                    if exc:
+                        logger.error(f"Task failed with exception: {exc}")
                 # Log task stats periodically
-                if tasks_completed_local != 0 and tasks_completed_local % 5 == 0:
+                if tasks_completed_local % 5 == 0:
                     if should_log_task_stats(queue_monitor, tasks_created, tasks_completed_local):
                         logger.info(f"Tasks stats - Created: {tasks_created}, Completed Locally: {tasks_completed_local}, Active: {len(tasks)}")
+                if end_signal_received and not tasks:
+                    all_tasks_done.set()
+                if tasks_done is not None and (tasks_completed_counter.value + job_errors_counter.value
+                                               >= tasks_submitted_counter.value):
+                    # The last task submitted so far is done, wake wait_for_completion
+                    tasks_done.set()
+
+            intake: asyncio.Queue = asyncio.Queue()
+            reader = threading.Thread(target=FlowManagerMP._read_queue_into_loop,
+                                      args=(task_queue, asyncio.get_running_loop(), intake, intake_room),
+                                      name="TaskQueueReader", daemon=True)
+            reader.start()
 
-                # A short pause to reduce CPU usage and avoid a busy-wait state.             
-                await asyncio.sleep(0.0001)
+            while not end_signal_received:
+                item = await intake.get()
+                if item is None:
+                    logger.info("Received end signal in task queue")
+                    end_signal_received = True
+                    break
+
+                # Tasks arrive one at a time or in batches, see task_batch_size
+                new_tasks = item if isinstance(item, list) else [item]
+                for new_task in new_tasks:
+                    if admission:
+                        await admission.acquire()
+                    asyncio_task = asyncio.create_task(process_task(new_task))
+                    tasks.add(asyncio_task)
+                    asyncio_task.add_done_callback(on_task_done)
+                    if tasks_in_progress_counter:
+                        tasks_in_progress_counter.increment(worker_index)
+                    if queue_room:
+                        queue_room.release()
+                if intake_room:
+                    intake_room.release()
+                tasks_created += len(new_tasks)
+                logger.debug(f"Created {len(new_tasks)} new tasks, total tasks created: {tasks_created}")
 
             # Wait for remaining tasks to complete
             if tasks:
                 logger.debug(f"Waiting for {len(tasks)} remaining tasks")
-                await asyncio.gather(*tasks)
+                await all_tasks_done.wait()
                 logger.debug("All remaining tasks completed")
+            if monitor:
+                monitor.cancel()
+                await asyncio.gather(monitor, return_exceptions=True)
 
             # Signal completion
             logger.debug("Sending completion signal to result queue")
             logger.debug(f"Final stats - Created: {tasks_created}, Completed Locally: {tasks_completed_local}")
             logger.info("*** result_queue ended ***")
-            result_queue.put(None)
+            await queue_result(None)
 
         # Run the event loop
         logger.debug("Creating event loop")
@@ -558,6 +1208,8 @@ class FlowManagerMP(FlowManagerABC):
             logger.error(f"Error in async worker: {e}\n{traceback.format_exc()}")
             logger.info("Detailed stack trace:", exc_info=True)
         finally:
+            FlowManagerMP.close_jobs(job_graph_map)
+            shutdown_process_pool()
             logger.info("Closing event loop")
             loop.close()
 
@@ -574,72 +1226,152 @@ class FlowManagerMP(FlowManagerABC):
         self.logger.debug("Waiting for jobs to be loaded before returning job names")
         if not self._jobs_loaded.wait(timeout=self.JOB_MAP_LOAD_TIME):
             raise TimeoutError("Timed out waiting for jobs to be loaded")
-        
+        self._receive_fq_name_map(self.JOB_MAP_LOAD_TIME)
+
         return list(self._fq_name_map.keys())
 
+    def iter_results(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Yields the result of each completed task as soon as it is queued by a worker, until every
+        submitted task has completed or errored, including tasks submitted while iterating.
+
+        Results are taken straight off the result queue, so at most result_buffer_size results are
+        held at any time, and the results not iterated by close_processes are discarded. Failed tasks
+        are not yielded, they are logged by the workers and counted in get_stats()['errors']. Not
+        available with on_complete or on_complete_batch, which are handed the results instead.
+
+        Args:
+            timeout (Optional[float], optional): Maximum time in seconds to wait for each result,
+                None to wait indefinitely. Defaults to None.
+
+        Raises:
+            RuntimeError: If results are handed to on_complete or on_complete_batch, or are already being iterated.
+            TimeoutError: If no result arrives within timeout.
+        """
+        if self._has_result_handler():
+            raise RuntimeError("Results are handed to on_complete or on_complete_batch, they can't also be iterated")
+        if self._iterating_results:
+            raise RuntimeError("Results are already being iterated")
+        self._iterating_results = True
+        try:
+            while self._results_received < self.tasks_submitted.value:
+                try:
+                    result = self._result_queue.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"Timed out waiting for a result after {timeout} seconds") from None
+                if result is None:
+                    # A worker's completion signal, only sent when the workers are shut down
+                    continue
+                self._results_received += 1
+                if isinstance(result, Exception):
+                    continue
+                yield result
+        finally:
+            self._iterating_results = False
+
     def wait_for_completion(self, timeout=10, check_interval=0.1):
         """
-        Periodically logs the status of task processing counters.
-        Exits when all submitted tasks have been processed by worker processes.
+        Waits until all submitted tasks have been processed by worker processes, logging the
+        task processing counters at most every STATS_LOG_INTERVAL.
+        A worker sets _tasks_done whenever it finishes the last task submitted so far, so the
+        wait is woken as soon as that happens rather than polling the counters.
         Note: This does not guarantee that post-processing (if any) is complete.
-              `wait_for_completion` ensures all stages, including post-processing, are finished.
+              `close_processes` ensures all stages, including post-processing, are finished.
 
         Args:
-            interval (float, optional): The polling interval in seconds. Defaults to 1.0.
-            timeout (Optional[float], optional): Maximum time in seconds to poll. 
-                                                 If None, polls indefinitely until completion or KeyboardInterrupt. 
-                                                 Defaults to None.
+            timeout (Optional[float], optional): Maximum time in seconds to wait. 
+                                                 If None, waits indefinitely until completion or KeyboardInterrupt. 
+                                                 Defaults to 10.
+            check_interval (float, optional): How long to wait for tasks to be counted when none
+                                              were submitted. Defaults to 0.1.
 
         Raises:
             RuntimeError: If raise_on_error is True and there are errors, raises an exception
         """
-        start_time = time.time()
-        self.logger.info("Starting to poll for task processing updates...")
+        start_time = time.monotonic()
+        self.logger.info("Waiting for task processing updates...")
         try:
             while True:
-                submitted = self.tasks_submitted.value
-                in_progress = self.tasks_in_progress.value
-                completed = self.tasks_completed.value
-                post_processing = self.post_processing_tasks.value
-                errors = self.job_errors.value # Get job_errors value
+                # Cleared before the counters are read, so a task finishing after the read sets it again
+                self._tasks_done.clear()
+                stats = self.get_stats()
+                submitted = stats['submitted']
+                in_progress = stats['in_progress']
+                completed = stats['completed']
+                post_processing = stats['post_processing']
+                errors = stats['errors']
 
-                self.logger.info(
+                self._log_stats(
                     f"Task Stats: \nErrors={errors}, Submitted={submitted}, In Progress={in_progress}, "
                     f"Completed={completed}, Post-Processing={post_processing}" # Added Errors to log
                 )
 
+                elapsed = time.monotonic() - start_time
                 # Break if all submitted tasks are completed by workers OR if no tasks were submitted at all
-                if (submitted > 0 and (completed + errors) >= submitted) or (submitted == 0 and time.time() - start_time > check_interval): 
+                if (submitted > 0 and (completed + errors) >= submitted) or (submitted == 0 and elapsed > check_interval): 
                     if submitted == 0:
-                        self.logger.info("No tasks were submitted. Completing poll early.")
+                        self.logger.info("No tasks were submitted. Completing wait early.")
                     else:
                         self.logger.info("All submitted tasks have been processed by workers.")
-                        if self.on_complete:
+                        if self._has_result_handler():
                             # Log current post-processing status but don't wait here.
-                            # wait_for_completion will ensure post-processing finishes.
+                            # close_processes will ensure post-processing finishes.
                             self.logger.info(
                                 f"Worker processing complete. Current post-processing: {post_processing}/{completed}. "
-                                "Final post-processing will be handled by wait_for_completion."
+                                "Final post-processing will be handled by close_processes."
                             )
                     break 
                 
                 # Break if timeout is reached
-                if timeout is not None and (time.time() - start_time) > timeout:
-                    self.logger.warning(f"Polling timed out after {timeout} seconds.")
+                if timeout is not None and elapsed > timeout:
+                    self.logger.warning(f"Waiting timed out after {timeout} seconds.")
                     break
-                
-                time.sleep(check_interval)
+
+                # Woken at least every STATS_LOG_INTERVAL to log the stats
+                wait = self.STATS_LOG_INTERVAL if submitted else check_interval - elapsed
+                if timeout is not None:
+                    wait = min(wait, timeout - elapsed)
+                self._tasks_done.wait(max(0, wait) + 0.001)
         except KeyboardInterrupt:
-            self.logger.info("Polling interrupted by user.")
+            self.logger.info("Waiting interrupted by user.")
         finally:
             errors = self.job_errors.value
-            self.logger.info("Finished polling for updates.")
+            self.logger.info("Finished waiting for updates.")
             
             # If raise_on_error is True and there are errors, raise an exception
             if self.get_raise_on_error() and errors > 0:
                 raise RuntimeError(f"Flow execution completed with {errors} error(s). Check logs for details.")
 
 
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns a snapshot of the task counters, summed over the processes that count them.
+
+        The counters are read from the last stage of a task's life to the first, so as every
+        counter only grows, a snapshot never shows more tasks at a stage than reached the
+        stage before it, e.g. completed + errors never exceeds in_progress or submitted.
+
+        Returns:
+            Dict[str, Any]: 'submitted', 'in_progress' (started by a worker), 'completed',
+                'errors' and 'post_processing' task counts, 'throttled_workers', the number of
+                workers holding back intake under resource_limits, and 'admission_windows',
+                the most tasks each worker will run at once now, None for no cap.
+        """
+        post_processing = self.post_processing_tasks.value
+        completed = self.tasks_completed.value
+        errors = self.job_errors.value
+        in_progress = self.tasks_in_progress.value
+        submitted = self.tasks_submitted.value
+        return {
+            'submitted': submitted,
+            'in_progress': in_progress,
+            'completed': completed,
+            'errors': errors,
+            'post_processing': post_processing,
+            'throttled_workers': sum(self.admission_stats.throttled[:]),
+            'admission_windows': [None if window < 0 else window for window in self.admission_stats.windows[:]]
+        }
+
     @classmethod
     def instance(cls, dsl=None, on_complete=None, serial_processing=False) -> 'FlowManagerMP':
         """
@@ -0,0 +1,104 @@
+"""
+A FlowManager that runs its tasks on the caller's event loop.
+
+FlowManager runs its tasks on a private event loop in a thread of its own, so every task
+submitted from an asyncio application hops to that thread and its result hops back through
+a done callback and a lock. AsyncFlowManager has no loop or thread of its own: it binds to
+the running loop the first time a task is submitted, and submit_async awaits the job graph
+directly on that loop, returning the result of its tail job.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Union
+
+from flow4ai.flowmanager import FlowManager
+
+
+class AsyncFlowManager(FlowManager):
+    """
+    FlowManager bound to the running event loop of the code that submits its tasks.
+
+    Takes the same arguments as FlowManager, except for loops, which must be 1. submit_async is the main way in. submit_task also
+    schedules tasks on the bound loop, returning an asyncio.Task per task when called on the loop,
+    and their results are kept for pop_results as usual, but the
+    blocking wait_for_completion, iter_results and execute must not be called on the bound loop,
+    as they would block the very loop the tasks run on, use results or run them in an executor.
+    """
+
+    def _start_loop(self):
+        # Bound to the caller's loop on first use, see _bind_loop
+        if self.loops != 1:
+            raise ValueError(f"AsyncFlowManager runs its tasks on the caller's event loop, loops must be 1, got {self.loops!r}")
+
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop):
+        shard = self._shards[0]
+        if shard.loop is loop:
+            return
+        if shard.loop is not None and not shard.loop.is_closed():
+            raise RuntimeError("AsyncFlowManager is bound to another event loop")
+        shard.loop = loop
+        shard.result_buffer_room = None  # created again on the new loop
+        # The caller's loop is only sampled under resource_limits, loop_lags is None otherwise
+        if shard.admission:
+            shard.start_monitor()
+
+    def _schedule(self, coro, shard):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            # Submitted from another thread, e.g. an executor
+            if self.loop is None:
+                coro.close()
+                raise RuntimeError("AsyncFlowManager is not bound to an event loop, submit from a coroutine first")
+            return asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self._bind_loop(loop)
+        return loop.create_task(coro)
+
+    async def submit_async(self, task: Union[Dict[str, Any], str], fq_name: Optional[str] = None) -> Any:
+        """
+        Runs a task through its job graph on the running loop and returns the result of the tail job.
+
+        Unlike submit_task, the result is returned rather than kept for pop_results, and an error is
+        raised to the caller rather than kept. Tasks are still counted in get_counts, and on_complete
+        is still called with the result.
+
+        Args:
+            task: The task to run
+            fq_name: The fully qualified name of the job graph, optional if there is only one
+
+        Returns:
+            The result of the job graph's tail job
+        """
+        self._bind_loop(asyncio.get_running_loop())
+        fq_name = self.check_fq_name_and_job_graph_map(fq_name)
+        job, task_obj = self._create_task(task, fq_name)
+        with self._data_lock:
+            self.submitted_count += 1
+        try:
+            result = await self._run_job(job, task_obj, self._shards[0])
+            if self.on_complete:
+                with self._data_lock:
+                    self.post_processing_count += 1
+                self.on_complete(result)
+        except Exception as e:
+            self.logger.error(f"Error processing result: {e}")
+            self.logger.info("Detailed stack trace:", exc_info=True)
+            with self._data_lock:
+                self.error_count += 1
+                self._counts_changed.notify_all()
+            raise
+        with self._data_lock:
+            self.completed_count += 1
+            self._counts_changed.notify_all()
+        return result
+
+    def close(self):
+        """Release the resources held by the jobs and stop sampling resources, the bound loop is left running.
+        The AsyncFlowManager can't be used after it is closed."""
+        self.close_jobs(self.job_graph_map)
+        monitor = self._shards[0].monitor
+        if monitor:
+            monitor.cancel()
+        self.result_store.close()
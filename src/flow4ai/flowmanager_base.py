@@ -5,8 +5,11 @@ This module provides the abstract base class that defines the common interface
 for all Flow Manager implementations in the Flow4AI framework.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Collection, Dict, List, Union
+from typing import (Any, AsyncIterator, Collection, Dict, Iterator, List,
+                    Optional, Union)
 
 from .dsl import DSLComponent, JobsDict
 from .dsl_graph import PrecedenceGraph, dsl_to_precedence_graph
@@ -14,6 +17,8 @@ from .f4a_graph import validate_graph
 from .job import SPLIT_STR, JobABC
 from .job_loader import JobFactory
 
+_END_OF_ITERATION = object()  # Returned by next() in FlowManagerABC.results when iter_results is exhausted
+
 
 class FlowManagerABC(ABC):
     """
@@ -27,6 +32,7 @@ class FlowManagerABC(ABC):
     
     # Class variable for controlling error handling behavior
     RAISE_ON_ERROR = False
+    STATS_LOG_INTERVAL = 1.0  # Seconds between task stats logged at INFO while waiting for completion
     
     @abstractmethod
     def __init__(self, *args, **kwargs):
@@ -73,7 +79,7 @@ class FlowManagerABC(ABC):
         pass
         
     @abstractmethod
-    def submit_task(self, task: Union[Dict[str, Any], List[Dict[str, Any]]], fq_name: str = None) -> None:
+    def submit_task(self, task: Union[Dict[str, Any], List[Dict[str, Any]]], fq_name: str = None) -> Any:
         """
         Submit a task or list of tasks to be processed by the job graph. Must be implemented by subclasses.
         
@@ -87,7 +93,7 @@ class FlowManagerABC(ABC):
                    Required if multiple job graphs are registered.
                    
         Returns:
-            None
+            Implementation dependent, see the implementations.
             
         Raises:
             ValueError: If fq_name is required but not provided, or if the specified job graph cannot be found.
@@ -375,14 +381,38 @@ class FlowManagerABC(ABC):
         else:
             raise TypeError(f"dsl must be either Dict[str, Any], DSLComponent instance, or Collection of DSLComponent instances, got {type(dsl)}")
 
+    @staticmethod
+    def close_jobs(job_graph_map: Dict[str, JobABC]) -> None:
+        """
+        Calls close on every job of the job graphs in job_graph_map, releasing resources
+        such as the thread pools of wrapped functions.
+
+        Args:
+            job_graph_map: Head jobs keyed by fully qualified name
+        """
+        for head_job in job_graph_map.values():
+            for job in head_job.get_plan().jobs:
+                job.close()
+
+    def _log_stats(self, message: str) -> None:
+        """Logs task stats at INFO at most once per STATS_LOG_INTERVAL, and at DEBUG in between."""
+        now = time.monotonic()
+        if now - getattr(self, '_stats_logged_at', float('-inf')) >= self.STATS_LOG_INTERVAL:
+            self._stats_logged_at = now
+            self.logger.info(message)
+        else:
+            self.logger.debug(message)
+
     @abstractmethod
     def wait_for_completion(self, timeout=10, check_interval=1):
         """
         Wait for all submitted tasks to complete within the specified timeout.
+
+        Implementations are woken as the last task completes, rather than polling.
         
         Args:
             timeout: Maximum time in seconds to wait for completion.
-            check_interval: Time in seconds between completion checks.
+            check_interval: Implementation dependent, see the implementations.
             
         Returns:
             bool: True if all tasks completed, False if timeout occurred.
@@ -391,6 +421,43 @@ class FlowManagerABC(ABC):
             TimeoutError: If timeout is reached before all tasks complete (implementation dependent).
         """
         pass
+
+    @abstractmethod
+    def iter_results(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Yield the result of each task as soon as it completes, until all submitted tasks are done.
+
+        Args:
+            timeout: Maximum time in seconds to wait for each result, None to wait indefinitely.
+
+        Raises:
+            TimeoutError: If no result arrives within timeout.
+        """
+        pass
+
+    async def results(self, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """
+        Async version of iter_results, for `async for result in flowmanager.results()`.
+
+        Each result is waited for in the default executor of the running loop, which stays free meanwhile.
+        """
+        iterator = self.iter_results(timeout)
+        loop = asyncio.get_running_loop()
+        next_result = None
+        try:
+            while True:
+                next_result = loop.run_in_executor(None, next, iterator, _END_OF_ITERATION)
+                # Shielded, so if the iteration is cancelled the wait in the executor runs on to the end
+                result = await asyncio.shield(next_result)
+                if result is _END_OF_ITERATION:
+                    return
+                yield result
+        finally:
+            if next_result is not None and not next_result.done():
+                # The iterator can only be closed once the executor is done with it
+                next_result.add_done_callback(lambda _: iterator.close())
+            else:
+                iterator.close()
         
     def check_fq_name_and_job_graph_map(self, fq_name, job_map=None):
         """
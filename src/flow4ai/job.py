@@ -3,10 +3,17 @@ import uuid
 from abc import ABC, ABCMeta, abstractmethod
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from typing import Any, Dict, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union
+
+from opentelemetry import trace
 
 from . import f4a_logging as logging
-from .utils.otel_wrapper import trace_function
+from .job_plan import ExecutionPlan, compile_job_graph
+from .process_pool import run_job_in_process
+from .result_view import ResultView, to_plain_result
+from .utils.otel_wrapper import (TRACE_MODE_FULL, TRACE_MODE_SAMPLED,
+                                 TracerFactory, add_trace_mode_listener,
+                                 get_trace_mode, sample_trace, trace_function)
 
 SPLIT_STR = "$$"
 
@@ -41,11 +48,22 @@ def traced_job(cls: Type) -> Type:
         traced_execute = _mark_traced(traced_execute)
         # Store original as executeNoTrace
         cls.executeNoTrace = original_execute
-        # Replace execute with traced version
-        cls._execute = traced_execute
+        cls.executeTraced = traced_execute
+        # Replace execute with traced version, unless tracing is not in full mode
+        _install_execute(cls)
     return cls
 
 
+def _install_execute(cls: Type, mode: Optional[str] = None) -> None:
+    """
+    Installs the traced _execute in the full tracing mode and the untraced _execute otherwise,
+    so that no tracing wrapper runs at all when tracing is off. In the sampled mode _execute
+    creates the spans of the tasks it samples itself.
+    """
+    mode = get_trace_mode() if mode is None else mode
+    cls._execute = cls.executeTraced if mode == TRACE_MODE_FULL else cls.executeNoTrace
+
+
 class JobMeta(ABCMeta):
     """Metaclass that automatically applies the traced_job decorator to JobABC only."""
     def __new__(mcs, name, bases, namespace):
@@ -107,21 +125,66 @@ class Task(dict):
         return f"Task(id={self.task_id}, fq_name={fq_name}, data={task_preview})"
 
 class JobState:
+  """The inputs received by one job while running one task.
+
+  JobStates are recycled between tasks through the state pool of the graph's ExecutionPlan,
+  see _acquire_job_states, so reset() must return a JobState to its freshly created state.
+  """
+  __slots__ = ('inputs',)
+
   def __init__(self):
       self.inputs: Dict[str, Dict[str, Any]] = {}
-      self.input_event = asyncio.Event()
-      self.execution_started = False
 
-job_graph_context : ContextVar[dict] = ContextVar('job_graph_context')
+  def reset(self) -> None:
+      self.inputs.clear()
+
+class JobGraphContext:
+  """The value of job_graph_context while a task runs through a job graph.
+
+  Attributes:
+      plan: The ExecutionPlan of the graph being executed, set by JobABC._execute.
+      states: The JobState of each job, indexed by the job's node id in the plan.
+      context: The context shared by all jobs of the graph for one task, see JobABC.get_context.
+  """
+  __slots__ = ('plan', 'states', 'context')
+
+  def __init__(self):
+      self.plan: Optional[ExecutionPlan] = None
+      self.states: Optional[List[JobState]] = None
+      self.context: Dict[str, Any] = {JobABC.SAVED_RESULTS: {}}
+
+  def job_state(self, job_name: str) -> JobState:
+      return self.states[self.plan.index[job_name]]
+
+job_graph_context : ContextVar[JobGraphContext] = ContextVar('job_graph_context')
+
+# The most JobState lists kept for reuse per ExecutionPlan, bounds the memory held by idle pools
+# after a burst of concurrent tasks.
+JOB_STATE_POOL_SIZE = 256
+
+def _acquire_job_states(plan: ExecutionPlan) -> List[JobState]:
+  """Take a list of reset JobStates, indexed by node id, from the plan's pool or create one."""
+  pool = plan.state_pool
+  if pool:
+      return pool.pop()
+  return [JobState() for _ in range(len(plan))]
+
+def _release_job_states(plan: ExecutionPlan, states: List[JobState]) -> None:
+  """Reset a list of JobStates and return it to the plan's pool."""
+  pool = plan.state_pool
+  if len(pool) < JOB_STATE_POOL_SIZE:
+      for state in states:
+          state.reset()
+      pool.append(states)
 
 @asynccontextmanager
-async def job_graph_context_manager(job_set: set['JobABC']):
-  """Create a new context for job execution, with a new JobState."""
-  new_state = {}
-  for job in job_set:
-      new_state[job.name] = JobState()
-  new_state[JobABC.CONTEXT] = {}
-  new_state[JobABC.CONTEXT][JobABC.SAVED_RESULTS] = {}
+async def job_graph_context_manager():
+  """Create a new context for job execution.
+
+  The JobState of each job is not created here, JobABC._execute takes them from the
+  ExecutionPlan's pool of recycled JobStates for as long as the task runs.
+  """
+  new_state = JobGraphContext()
   token = job_graph_context.set(new_state)
   try:
       yield new_state
@@ -142,6 +205,8 @@ class JobABC(ABC, metaclass=JobMeta):
     RETURN_JOB='RETURN_JOB'
     CONTEXT='CONTEXT'
     SAVED_RESULTS='SAVED_RESULTS'
+    # properties["executor"] value that runs the job in the process pool, see process_pool.py
+    EXECUTOR_PROCESS='process'
 
     def __init__(self, name: Optional[str] = None, properties: Dict[str, Any] = {}):
         """
@@ -150,17 +215,52 @@ class JobABC(ABC, metaclass=JobMeta):
         Args:
             name (Optional[str], optional): Must be a unique identifier for this job within the context of a FlowManager.
                                             If not provided, a unique name will be auto-generated.
-            properties (Dict[str, Any], optional): configuration properties passed in by jobs.yaml
+            properties (Dict[str, Any], optional): configuration properties passed in by jobs.yaml,
+                "executor": "process" runs this job's run method in a process pool for CPU-bound work
         """
         self.name:str = self._getUniqueName() if name is None else name
         self.save_result: bool = bool(properties.get("save_result", False))
+        self.run_in_process: bool = properties.get("executor") == JobABC.EXECUTOR_PROCESS
         self.properties:Dict[str, Any] = properties
         self.expected_inputs:set[str] = set()
         self.next_jobs:list[JobABC] = [] 
+        self.plan:Optional[ExecutionPlan] = None
         self.timeout = 3000
         self.logger = logging.getLogger(self.__class__.__name__)
         self.global_ctx = None
 
+    @property
+    def name(self) -> str:
+        return self.__dict__['name']
+
+    @name.setter
+    def name(self, name: str) -> None:
+        # Kept in the instance dict so the job's fields still show its name, e.g. in traces
+        self.__dict__['name'] = name
+        self._parsed_name: Optional[Dict[str, str]] = None
+
+    def _get_parsed_name(self) -> Dict[str, str]:
+        """Returns parse_job_loader_name of this job's name, parsed once and cached until the name is changed."""
+        parsed = self._parsed_name
+        if parsed is None:
+            parsed = self._parsed_name = JobABC.parse_job_loader_name(self.name)
+        return parsed
+
+    @property
+    def graph_name(self) -> str:
+        """The graph name part of this job's name, as returned by parse_graph_name."""
+        return self._get_parsed_name().get("graph_name", "UNSUPPORTED NAME FORMAT")
+
+    @property
+    def param_name(self) -> str:
+        """The parameter name part of this job's name, as returned by parse_param_name."""
+        return self._get_parsed_name().get("param_name", "UNSUPPORTED NAME FORMAT")
+
+    @property
+    def short_job_name(self) -> str:
+        """The short job name part of this job's name, as returned by parse_job_name."""
+        return self._get_parsed_name().get("job_name", "UNSUPPORTED NAME FORMAT")
+
     def __or__(self, other):
         """Implements the | operator for parallel composition"""
         # Import DSL classes inline to avoid circular imports
@@ -299,24 +399,55 @@ class JobABC(ABC, metaclass=JobMeta):
     @classmethod
     def job_set(cls, job) -> set['JobABC']:
         """
-        Returns a set of all unique job instances in the job graph by recursively traversing
-        all possible paths through next_jobs.
+        Returns a set of all unique job instances in the job graph by traversing
+        all possible paths through next_jobs, visiting each job only once.
+
+        Prefer job.get_plan().job_set in code that runs per task, the plan holds
+        the job set computed once when the graph was created.
         
         Returns:
             set[JobABC]: A set containing all unique job instances in the graph
         """
         result = {job}  # Start with current job instance
-        
-        # Base case: if no next jobs, return current set
-        if not job.next_jobs:
-            return result
-            
-        # Recursive case: add all jobs from each path
-        for job in job.next_jobs:
-            result.update(cls.job_set(job))
-            
+        to_visit = [job]
+        while to_visit:
+            for next_job in to_visit.pop().next_jobs:
+                if next_job not in result:
+                    result.add(next_job)
+                    to_visit.append(next_job)
         return result
 
+    def compile_plan(self) -> ExecutionPlan:
+        """
+        Compiles the job graph headed by this job into an ExecutionPlan and caches it on this job.
+        Called by JobFactory.create_job_graph once next_jobs and expected_inputs have been set,
+        the plan must be recompiled if the graph is changed afterwards.
+
+        Returns:
+            ExecutionPlan: The compiled plan used by _execute to run tasks through the graph
+        """
+        self.plan = compile_job_graph(self)
+        return self.plan
+
+    def get_plan(self) -> ExecutionPlan:
+        """
+        Returns the ExecutionPlan of the job graph headed by this job, compiling it on first use
+        if the graph was not created by JobFactory.create_job_graph.
+
+        Returns:
+            ExecutionPlan: The compiled plan for this job graph
+        """
+        plan = self.plan
+        if plan is None:
+            plan = self.compile_plan()
+        return plan
+
+    def close(self) -> None:
+        """
+        Releases resources the job holds between tasks, such as thread pools. Called by the
+        flow managers when they shut down. Does nothing by default.
+        """
+
     def __repr__(self):
         next_jobs_str = [job.name for job in self.next_jobs]
         expected_inputs_str = [input_name for input_name in self.expected_inputs]
@@ -326,12 +457,19 @@ class JobABC(ABC, metaclass=JobMeta):
                 f"properties: {self.properties}")
 
     async def _execute(self, task: Union[Task, None]) -> Dict[str, Any]:
-        """ Responsible for executing the job graph, maintaining state of the graph
-        by updating the JobState object and propagating the tail results back up the graph
-        when a tail job is reached.
+        """ Responsible for executing the job graph headed by this job, maintaining state of the graph
+        by updating the JobState objects and returning the result of the tail job.
 
         This is a classic dataflow execution model, where computation proceeds based on data 
-        availability rather than a predetermined sequence.
+        availability rather than a predetermined sequence. The graph is run against its compiled
+        ExecutionPlan: each job that finishes hands its result to its next jobs and decrements their
+        count of outstanding inputs, and a job is started by the predecessor that delivers its last input.
+        One chain of jobs runs inline, other jobs that become ready at the same time run concurrently.
+
+        As before, a join job's timeout bounds how long it waits for its inputs, counted from its
+        first input. Nothing awaits the inputs, a timer is started when a join gets its first input
+        and cancelled when it gets its last, if it fires the task is cancelled and a TimeoutError
+        raised. Jobs that are running are not bounded, however long they run.
 
         WARNING: DO NOT OVERRIDE THIS METHOD IN CUSTOM JOB CLASSES.
         This method is part of the core Flow4AI execution flow and handles critical operations
@@ -341,127 +479,175 @@ class JobABC(ABC, metaclass=JobMeta):
 
         Can only be used within a job_graph_context set up with:
            ```python
-            async with job_graph_context_manager(job_set):
+            async with job_graph_context_manager():
                         result = await job._execute(task)
             ```
-        The recursive nature of the algorithm means that results flow upwards, with the head job appearing
-        to return the result of the tail job.
 
         Args:
-            task (Union[Task, None]): the input to the first (head) job of the job graph, is None in child jobs.
+            task (Union[Task, None]): the input to the first (head) job of the job graph.
 
         Returns:
-            Dict[str, Any]: The output of the job graph execution
+            Dict[str, Any]: The output of the tail job of the job graph
+
+        Raises:
+            TimeoutError: If a join job waits for its inputs for longer than its timeout
         """
-        job_state_dict:dict = job_graph_context.get()
-        job_state = job_state_dict.get(self.name)
-        if self.is_head_job() and  isinstance(task, dict):
-            job_state.inputs.update(task)
-            self.get_context()[JobABC.TASK_PASSTHROUGH_KEY] = task
-        elif task is None:
-            pass 
-        else:
-            job_state.inputs[self.name] = task
+        plan = self.plan if self.plan is not None else self.compile_plan()
+        graph_context: JobGraphContext = job_graph_context.get()
+        context = graph_context.context
+        states = _acquire_job_states(plan)
+        outer_plan, outer_states = graph_context.plan, graph_context.states
+        graph_context.plan, graph_context.states = plan, states
+        if isinstance(task, dict):
+            states[plan.head_id].inputs.update(task)
+            context[JobABC.TASK_PASSTHROUGH_KEY] = task
+        elif task is not None:
+            states[plan.head_id].inputs[self.name] = task
+
+        # Decide once, at the head job, whether this task is traced, every job of the task follows
+        tracer = None
+        task_span = None
+        if sample_trace():
+            tracer = TracerFactory.get_tracer()
+            if get_trace_mode() == TRACE_MODE_SAMPLED:
+                # There is no tracing wrapper in the sampled mode, so the task's span is created here
+                task_span = tracer.start_span(f"{JobABC.__module__}.JobABC._execute", attributes={"job.name": self.name})
+        span_context = trace.set_span_in_context(task_span) if task_span is not None else None
+
+        jobs = plan.jobs
+        successors = plan.successors
+        remaining = list(plan.pred_counts)
+        saved_results = context[JobABC.SAVED_RESULTS]
+        tail_results: Dict[int, Dict[str, Any]] = {}
+        branches: set = set()
+        # Timers of the join jobs that have some but not all of their inputs
+        join_deadlines: Dict[int, asyncio.TimerHandle] = {}
+        timed_out_id: Optional[int] = None
+        current_task = asyncio.current_task()
+        loop = asyncio.get_running_loop()
+
+        def on_join_deadline(node_id: int) -> None:
+            nonlocal timed_out_id
+            timed_out_id = node_id
+            current_task.cancel()
+
+        async def run_job(job: JobABC, node_id: int) -> Any:
+            if job.run_in_process:
+                return await run_job_in_process(job, task, states[node_id].inputs, context)
+            return await job.run(task)
+
+        async def run_branch(node_id: int) -> None:
+            # Run a chain of jobs, continuing inline with the first next job that becomes
+            # ready and starting a concurrent branch for any others.
+            while True:
+                job = jobs[node_id]
+                if tracer is None:
+                    result = await run_job(job, node_id)
+                else:
+                    span_name = f"{type(job).__module__}.{type(job).__qualname__}.run"
+                    with tracer.start_as_current_span(span_name, context=span_context,
+                                                      attributes={"job.name": job.name}):
+                        result = await run_job(job, node_id)
+                job.logger.debug(f"Job {job.name} finished running")
+
+                if job.save_result:
+                    saved_results[job.name] = to_plain_result(result)
+
+                if not isinstance(result, (dict, ResultView)):
+                    result = {'result': result}
+
+                # Clear state for potential reuse
+                states[node_id].inputs.clear()
+
+                next_ids = successors[node_id]
+                if not next_ids:
+                    # Store the job name that returns the result
+                    result = to_plain_result(dict(result))
+                    result[JobABC.RETURN_JOB] = job.name
+                    tail_results[node_id] = result
+                    return
+
+                ready_id = None
+                for next_id in next_ids:
+                    # add result data from this job as an input to the next job, the next jobs
+                    # share the result and only copy it if they change it, the name of the job
+                    # that returned it is the key of the input
+                    states[next_id].inputs[job.name] = ResultView(result)
+                    remaining[next_id] -= 1
+                    if remaining[next_id] == 0:
+                        deadline = join_deadlines.pop(next_id, None)
+                        if deadline is not None:
+                            deadline.cancel()
+                        if ready_id is None:
+                            ready_id = next_id
+                        else:
+                            branches.add(asyncio.ensure_future(run_branch(next_id)))
+                    elif next_id not in join_deadlines and jobs[next_id].timeout is not None:
+                        join_deadlines[next_id] = loop.call_at(loop.time() + jobs[next_id].timeout,
+                                                               on_join_deadline, next_id)
+                if ready_id is None:
+                    return
+                node_id = ready_id
 
-        if self.expected_inputs:
-            if job_state.execution_started:
-                return None
-            
-            job_state.execution_started = True
-            try:
-                await asyncio.wait_for(job_state.input_event.wait(), self.timeout)
-            except asyncio.TimeoutError:
-                job_state.execution_started = False
-                raise TimeoutError(
-                    f"Timeout waiting for inputs in {self.name}. "
-                    f"Expected: {self.expected_inputs}, "
-                    f"Received: {list(job_state.inputs.keys())}"
-                )
-
-        result = await self.run(task)
-        self.logger.debug(f"Job {self.name} finished running")
-
-        if self.save_result:
-            saved_results = self.get_context()[JobABC.SAVED_RESULTS]
-            saved_results[self.name] = result
-
-        if not isinstance(result, dict):
-            result = {'result': result}
-
-        # Clear state for potential reuse
-        job_state.inputs.clear()
-        job_state.input_event.clear()
-        job_state.execution_started = False
-
-        # Store the job name that returns the result
-        result[JobABC.RETURN_JOB] = self.name
-
-        # If this is a tail job, return immediately
-        if not self.next_jobs:
-            self.logger.debug(f"Tail Job {self.name} returning result: {result}")
-            task = self.get_context()[JobABC.TASK_PASSTHROUGH_KEY]
-            result[JobABC.TASK_PASSTHROUGH_KEY] = task
-            saved_results = self.get_context().get(JobABC.SAVED_RESULTS, {})
-            if saved_results:
-                result[JobABC.SAVED_RESULTS] = {JobABC.parse_job_name(k): v for k, v in saved_results.items()}
-            return result
-
-        # Check if any child jobs are ready to execute once given this result as input
-        executing_jobs = []
-        for next_job in self.next_jobs:
-            input_data = result.copy()
-            # add result data from this job as an input to the next job
-            await next_job.receive_input(self.name, input_data)
-            next_job_inputs = job_state_dict.get(next_job.name).inputs
-            # if the next job has all its inputs add coroutine to list to execute
-            if next_job.expected_inputs.issubset(set(next_job_inputs.keys())):
-                the_task = self.get_task()
-                executing_jobs.append(next_job._execute(task=the_task))
-
-        # If there are any child jobs ready to execute, execute them, else return None 
-        if executing_jobs:
-            # await for all futures to return results
-            child_results = await asyncio.gather(*executing_jobs)
-            not_none_results = [r for r in child_results if r is not None]
-            if not_none_results:
-                # Return the first valid result.
-                # The recursive nature of the algorithm means that results flow upwards, with the head job appearing
-                # to return the result of the tail job, so returning the first valid result will return the tail job
-                # result up the stack.
-                first_valid_result = not_none_results[0]
-                self.logger.debug(f"Job {self.name} propagating first valid result: {first_valid_result}")
-                return first_valid_result
-
-        # If no child jobs executed or no valid result found, return None
+        try:
+            await run_branch(plan.head_id)
+            while branches:
+                done, _ = await asyncio.wait(branches, return_when=asyncio.FIRST_EXCEPTION)
+                branches.difference_update(done)
+                for branch in done:
+                    if branch.exception() is not None:
+                        raise branch.exception()
+        except asyncio.CancelledError:
+            if timed_out_id is None:
+                raise
+            if hasattr(current_task, 'uncancel'):
+                current_task.uncancel()
+            timed_out_job = jobs[timed_out_id]
+            raise TimeoutError(
+                f"Timeout waiting for inputs in {timed_out_job.name}. "
+                f"Expected: {timed_out_job.expected_inputs}, "
+                f"Received: {list(states[timed_out_id].inputs.keys())}"
+            )
+        finally:
+            for deadline in join_deadlines.values():
+                deadline.cancel()
+            if task_span is not None:
+                task_span.end()
+            graph_context.plan, graph_context.states = outer_plan, outer_states
+            if branches:
+                # Cancelled branches may still touch their JobStates, so they are not recycled
+                for branch in branches:
+                    branch.cancel()
+            else:
+                _release_job_states(plan, states)
+
+        for tail_id in plan.tail_ids:
+            if tail_id in tail_results:
+                result = tail_results[tail_id]
+                self.logger.debug(f"Tail Job {plan.names[tail_id]} returning result")
+                result[JobABC.TASK_PASSTHROUGH_KEY] = context.get(JobABC.TASK_PASSTHROUGH_KEY)
+                if saved_results:
+                    short_names = plan.short_names
+                    result[JobABC.SAVED_RESULTS] = {short_names[k]: v for k, v in saved_results.items()}
+                return result
+
+        # If no tail job was reached, return None
         return None
 
     async def receive_input(self, from_job: str, data: Dict[str, Any]) -> None:
         """Receive input from a predecessor job"""
-        job_state_dict:dict = job_graph_context.get()
-        job_state = job_state_dict.get(self.name)
+        job_state = job_graph_context.get().job_state(self.name)
         job_state.inputs[from_job] = data
-        if self.expected_inputs.issubset(set(job_state.inputs.keys())):
-            job_state.input_event.set()
 
     def job_set_str(self) -> set[str]:
         """
-        Returns a set of all unique job names in the job graph by recursively traversing
+        Returns a set of all unique job names in the job graph by traversing
         all possible paths through next_jobs.
         
         Returns:
             set[str]: A set containing all unique job names in the graph
         """
-        result = {self.name}  # Start with current job's name
-        
-        # Base case: if no next jobs, return current set
-        if not self.next_jobs:
-            return result
-            
-        # Recursive case: add all jobs from each path
-        for job in self.next_jobs:
-            result.update(job.job_set_str())
-            
-        return result
+        return {job.name for job in JobABC.job_set(self)}
 
     def is_head_job(self) -> bool:
         """
@@ -477,12 +663,10 @@ class JobABC(ABC, metaclass=JobMeta):
         Returns an object that can be used to store context across jobs in a graph for a single coroutine.
            can only be used within a job_graph_context set up with:
            ```python
-            async with job_graph_context_manager(job_set):
+            async with job_graph_context_manager():
                         result = await job._execute(task)
         """
-        job_state_dict:dict = job_graph_context.get()
-        context = job_state_dict[JobABC.CONTEXT]
-        return context
+        return job_graph_context.get().context
 
     def _get_long_name_inputs(self) -> Dict[str, Any]:
         """
@@ -491,8 +675,7 @@ class JobABC(ABC, metaclass=JobMeta):
         Returns:
             Dict[str, Any]: Returns the inputs to this job with long fully qualified job names as keys
         """
-        job_state_dict:dict = job_graph_context.get()
-        jobstate:JobState = job_state_dict[self.name]
+        jobstate:JobState = job_graph_context.get().job_state(self.name)
         inputs: Dict[str, Dict[str, Any]] = jobstate.inputs
         return inputs   
     
@@ -500,12 +683,24 @@ class JobABC(ABC, metaclass=JobMeta):
         """
         Returns the inputs to this job with short job names as keys.
 
+        The result of each predecessor job is shared with the predecessor's other next jobs,
+        each input is a ResultView of it that only copies the result if this job changes it.
+
         Returns:
             Dict[str, Dict[str, Any]]: The inputs to this job.
         """
-        inputs: Dict[str, Dict[str, Any]] = self._get_long_name_inputs()
-        inputs_with_short_job_name = {JobABC.parse_job_name(k): v for k, v in inputs.items()}
-        self.logger.debug(f"Returning inputs: {inputs_with_short_job_name}")
+        graph_context: JobGraphContext = job_graph_context.get()
+        plan = graph_context.plan
+        inputs: Dict[str, Dict[str, Any]] = graph_context.states[plan.index[self.name]].inputs
+        # Inputs from other jobs are keyed by job name, the head job's inputs are keyed by the task's keys
+        short_names = plan.short_names
+        inputs_with_short_job_name = {
+            short_names[k] if k in short_names else JobABC.parse_job_name(k): v
+            for k, v in inputs.items()
+        }
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Formatting the inputs costs more than the rest of this method for a wide join
+            self.logger.debug(f"Returning inputs: {inputs_with_short_job_name}")
         return inputs_with_short_job_name
 
     def get_task(self) -> Union[Dict[str, Any], Task]:
@@ -539,5 +734,7 @@ class JobABC(ABC, metaclass=JobMeta):
         """Execute the job on the given task. Must be implemented by subclasses."""
         pass
 
+add_trace_mode_listener(lambda mode: _install_execute(JobABC, mode))
+
 # SimpleJob and SimpleJobFactory have been moved to tests/test_utils/simple_job.py
 # They are only used for testing purposes and not for production code.
@@ -269,6 +269,7 @@ class JobFactory:
         """
         Takes the below inputs and creates a job graph by adding next_jobs and expected_inputs fields to each job in 
         the job_instances dictionary, default head and tail jobs are added to the graph, if necessary.
+        The finished graph is compiled into the ExecutionPlan held by the head job.
 
         graph_definition: dict[str, Any] = {
             "A": {"next": ["B", "C"]},
@@ -347,7 +348,11 @@ class JobFactory:
         #                    if not config['next'])
         # nodes[head_job_name].final_node = nodes[final_job_name]
 
-        return nodes[head_job_name]
+        # 5) Compile the graph once into the flat execution plan used to run every task
+        head_job = nodes[head_job_name]
+        head_job.compile_plan()
+
+        return head_job
 
     @classmethod
     def add_default_head(cls, graph_definition, head_jobs, job_instances, nodes):
@@ -0,0 +1,111 @@
+"""
+Compiles a job graph into a flat execution plan.
+
+A job graph is a set of JobABC instances linked through their next_jobs lists.
+Walking those lists for every task is wasted work because the graph does not
+change once it has been created by JobFactory.create_job_graph, so the graph
+is flattened once into an ExecutionPlan that the executor in JobABC._execute
+runs tasks against.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+
+class ExecutionPlan:
+    """
+    A job graph flattened into topological order.
+
+    Every job in the graph is given an integer node id, which is its position in
+    the topological order, so node 0 is always the head job.
+
+    Attributes:
+        jobs: The job instances, indexed by node id.
+        job_set: The job instances as a set, as returned by JobABC.job_set.
+        names: The fully qualified job names, indexed by node id.
+        index: Maps a job name to its node id.
+        short_names: Maps a job name to its short job name, as returned by JobABC.parse_job_name.
+        pred_counts: The number of predecessor jobs of each node, i.e. the number of
+            inputs a node must receive before it can run.
+        successors: The node ids of the next jobs of each node, in next_jobs order.
+        head_id: The node id of the head job.
+        tail_ids: The node ids of the tail jobs, in topological order.
+        state_pool: Lists of reset JobStates, indexed by node id, recycled between tasks by JobABC._execute.
+    """
+    __slots__ = ('jobs', 'job_set', 'names', 'index', 'short_names', 'pred_counts', 'successors', 'head_id',
+                 'tail_ids', 'state_pool')
+
+    def __init__(self, jobs: List[Any], successors: List[Tuple[int, ...]]):
+        self.jobs: Tuple[Any, ...] = tuple(jobs)
+        self.job_set: FrozenSet[Any] = frozenset(jobs)
+        self.names: Tuple[str, ...] = tuple(job.name for job in jobs)
+        self.index: Dict[str, int] = {name: node_id for node_id, name in enumerate(self.names)}
+        self.short_names: Dict[str, str] = {job.name: job.short_job_name for job in jobs}
+        self.successors: Tuple[Tuple[int, ...], ...] = tuple(successors)
+        pred_counts = [0] * len(jobs)
+        for next_ids in successors:
+            for next_id in next_ids:
+                pred_counts[next_id] += 1
+        self.pred_counts: Tuple[int, ...] = tuple(pred_counts)
+        self.head_id: int = 0
+        self.tail_ids: Tuple[int, ...] = tuple(node_id for node_id, next_ids in enumerate(successors) if not next_ids)
+        self.state_pool: List[List[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __repr__(self) -> str:
+        edges = {self.names[node_id]: [self.names[next_id] for next_id in next_ids]
+                 for node_id, next_ids in enumerate(self.successors)}
+        return f"ExecutionPlan(head={self.names[self.head_id]}, edges={edges})"
+
+
+def compile_job_graph(head_job) -> ExecutionPlan:
+    """
+    Compile the job graph reachable from head_job into an ExecutionPlan.
+
+    Args:
+        head_job: The head job of a graph whose next_jobs have already been set,
+            normally by JobFactory.create_job_graph.
+
+    Returns:
+        ExecutionPlan: The compiled plan, with head_job as node 0.
+
+    Raises:
+        ValueError: If the graph contains a cycle, or if head_job is not the only
+            job without predecessors.
+    """
+    # Collect every reachable job once, however many paths lead to it.
+    reachable = [head_job]
+    seen = {id(head_job)}
+    for job in reachable:
+        for next_job in job.next_jobs:
+            if id(next_job) not in seen:
+                seen.add(id(next_job))
+                reachable.append(next_job)
+
+    in_degree = {id(job): 0 for job in reachable}
+    for job in reachable:
+        for next_job in job.next_jobs:
+            in_degree[id(next_job)] += 1
+
+    if in_degree[id(head_job)] != 0:
+        raise ValueError(f"Job graph contains a cycle through head job {head_job.name}")
+
+    # Kahn's algorithm, visiting successors in next_jobs order so the plan is deterministic.
+    order = []
+    ready = [head_job]
+    while ready:
+        job = ready.pop(0)
+        order.append(job)
+        for next_job in job.next_jobs:
+            in_degree[id(next_job)] -= 1
+            if in_degree[id(next_job)] == 0:
+                ready.append(next_job)
+
+    if len(order) != len(reachable):
+        unresolved = [job.name for job in reachable if in_degree[id(job)] > 0]
+        raise ValueError(f"Job graph contains a cycle involving jobs: {unresolved}")
+
+    node_ids = {id(job): node_id for node_id, job in enumerate(order)}
+    successors = [tuple(node_ids[id(next_job)] for next_job in job.next_jobs) for job in order]
+    return ExecutionPlan(order, successors)
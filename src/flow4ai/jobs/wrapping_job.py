@@ -1,5 +1,11 @@
+import asyncio
+import contextvars
+import functools
 import inspect
-from typing import Any, Callable, Dict, List, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from flow4ai.job import JobABC
 from flow4ai.job import Task
@@ -7,11 +13,17 @@ from flow4ai.job import Task
 
 class WrappingJob(JobABC):
     FN_CONTEXT='j_ctx'
+    # Executor policies for running a synchronous callable, see __init__
+    EXECUTOR_INLINE='inline'
+    EXECUTOR_THREAD='thread'
+    _pool_lock = threading.Lock()  # creates the dedicated thread pools, shared as they are rarely created
 
     def __init__(
         self,
         callable_obj: Callable,
-        name: str = None
+        name: str = None,
+        executor: Union[str, int, None] = None,
+        properties: Dict[str, Any] = {}
     ):
         """
         Initialize a wrapper for a callable object.
@@ -19,8 +31,17 @@ class WrappingJob(JobABC):
         Args:
             callable_obj: The function or method to wrap
             name: Identifier for this callable in parameter dictionaries
+            executor: Where a synchronous callable is run, overrides properties["executor"]:
+                "inline" (the default) calls it directly on the event loop,
+                "thread" runs it in the event loop's shared thread pool,
+                an int runs it in a thread pool of that many threads dedicated to this job, shut
+                down by close, and
+                "process" runs the job in the process pool, the callable must then be picklable.
+                Async callables are always awaited on the event loop, or in the pool process.
+            properties: configuration properties, as for any JobABC
         Raises:
             TypeError: If callable_obj is not actually callable
+            ValueError: If executor is not a valid executor policy
         """
 
         is_callable = callable(callable_obj)
@@ -28,9 +49,80 @@ class WrappingJob(JobABC):
         if not is_callable: #and not isinstance(callable_obj, (JobABC, Parallel, Serial))
             raise TypeError(f"WrappingJob will only wrap a callable, error due to {type(callable_obj).__name__}")
         self.callable = callable_obj
-        super().__init__(name)
+        super().__init__(name, properties)
         self.default_args = []
         self.default_kwargs = {}
+        self.executor = self._validate_executor(
+            executor if executor is not None else properties.get("executor", self.EXECUTOR_INLINE))
+        self.run_in_process = self.executor == self.EXECUTOR_PROCESS
+        self._compile_signature()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._metrics = {
+            "calls": 0,
+            "offloaded_calls": 0,
+            "loop_blocking_time": 0.0,
+            "max_loop_blocking_time": 0.0
+        }
+
+    def _compile_signature(self) -> None:
+        """
+        Inspects the callable's signature once, when it is wrapped, rather than for every task:
+        the parameter names, whether it takes the context parameter, and the type
+        converter of each parameter with a type annotation.
+        """
+        try:
+            self._signature: Optional[inspect.Signature] = inspect.signature(self.callable)
+        except (ValueError, TypeError):
+            # Raised again by run, where it was raised before signatures were cached
+            self._signature = None
+            return
+        parameters = self._signature.parameters
+        self._param_names: List[str] = list(parameters.keys())
+        self._requires_params: bool = bool(parameters)
+        self._accepts_context: bool = self.FN_CONTEXT in parameters
+        self._requires_non_context_params: bool = any(name != self.FN_CONTEXT for name in parameters)
+        # The annotation of each parameter, by position and by name, if it is a type that can convert a value
+        self._positional_converters: List[Optional[type]] = [
+            param.annotation if isinstance(param.annotation, type) and param.annotation is not inspect.Parameter.empty
+            else None
+            for param in parameters.values()
+        ]
+        self._keyword_converters: Dict[str, type] = {
+            name: converter for name, converter in zip(self._param_names, self._positional_converters)
+            if converter is not None
+        }
+
+    @classmethod
+    def _validate_executor(cls, executor: Union[str, int]) -> Union[str, int]:
+        if executor in (cls.EXECUTOR_INLINE, cls.EXECUTOR_THREAD, cls.EXECUTOR_PROCESS):
+            return executor
+        if isinstance(executor, int) and not isinstance(executor, bool) and executor > 0:
+            return executor
+        raise ValueError(f"Invalid executor {executor!r}, expected '{cls.EXECUTOR_INLINE}', "
+                         f"'{cls.EXECUTOR_THREAD}', '{cls.EXECUTOR_PROCESS}' or a positive number of threads")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Returns the execution metrics of the wrapped callable.
+
+        Returns:
+            Dict[str, Any]: The executor policy, the number of calls and of calls offloaded to a
+                thread pool, and the total and maximum time in seconds that calls blocked the event loop
+        """
+        return {"executor": self.executor, **self._metrics}
+
+    def close(self) -> None:
+        """Shuts down this job's dedicated thread pool, if it was started. Calls already running
+        are left to finish, a later call starts a new pool."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Thread pools can't be pickled, the dedicated pool is recreated on first use
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
 
     async def run(self, task: Union[Dict[str, Any], Task]) -> Dict[str, Any]:
         """
@@ -50,17 +142,12 @@ class WrappingJob(JobABC):
         # Process shorthand dot notation params (e.g., "job.param": value)
         params = self._process_shorthand_params(params)
 
-        # Check if the callable requires parameters
-        sig = inspect.signature(self.callable)
-        requires_params = bool(sig.parameters)
-        
-        # Check if the only parameter required is 'context' which is auto-provided
-        requires_non_context_params = False
-        if requires_params:
-            non_context_params = [param for param in sig.parameters if param != self.FN_CONTEXT]
-            requires_non_context_params = bool(non_context_params)
+        if self._signature is None:
+            inspect.signature(self.callable)
+        requires_params = self._requires_params
+        requires_non_context_params = self._requires_non_context_params
 
-        parsed_name = JobABC.parse_job_name(self.name)
+        parsed_name = self.short_job_name
         short_name = self.name if parsed_name == "UNSUPPORTED NAME FORMAT" else parsed_name
         # Only check for parameters if the callable requires non-context parameters
         if requires_non_context_params and short_name not in params:
@@ -73,7 +160,7 @@ class WrappingJob(JobABC):
             callable_params = self._create_callable_params(params[short_name])
 
         # Add context to the kwargs if the callable accepts it
-        if self.FN_CONTEXT in sig.parameters:
+        if self._accepts_context:
             callable_params["kwargs"][self.FN_CONTEXT] = {}
             callable_params["kwargs"][self.FN_CONTEXT]["global"] = self.global_ctx
             callable_params["kwargs"][self.FN_CONTEXT]["task"] = params
@@ -172,9 +259,8 @@ class WrappingJob(JobABC):
         Raises:
             ValueError: If parameters don't match the callable's signature
         """
-        sig = inspect.signature(self.callable)
         try:
-            sig.bind(*args, **kwargs)
+            self._signature.bind(*args, **kwargs)
         except TypeError as e:
             raise ValueError(f"Invalid parameters for {self.name}: {e}")
 
@@ -189,58 +275,36 @@ class WrappingJob(JobABC):
         Returns:
             Tuple containing converted args and kwargs
         """
-        sig = inspect.signature(self.callable)
-
-        # Convert positional args
-        converted_args = []
-        for i, arg in enumerate(args):
-            # Skip conversion if we have more args than parameters
-            if i >= len(sig.parameters):
-                converted_args.append(arg)
-                continue
-
-            param_name = list(sig.parameters.keys())[i]
-            param = sig.parameters[param_name]
-
-            # Skip if no annotation or if annotation is not a type
-            if param.annotation == inspect.Parameter.empty or not isinstance(param.annotation, type):
-                converted_args.append(arg)
-                continue
-
-            try:
-                # Only convert if needed and possible
-                if not isinstance(arg, param.annotation) and arg is not None:
-                    converted_args.append(param.annotation(arg))
-                else:
-                    converted_args.append(arg)
-            except (ValueError, TypeError):
-                # If conversion fails, use original value
-                converted_args.append(arg)
+        # Convert positional args, skipping conversion if we have more args than parameters
+        positional_converters = self._positional_converters
+        converted_args = [
+            self._convert(arg, positional_converters[i]) if i < len(positional_converters) else arg
+            for i, arg in enumerate(args)
+        ]
 
         # Convert kwargs
-        converted_kwargs = {}
-        for name, value in kwargs.items():
-            if (name in sig.parameters and
-                sig.parameters[name].annotation != inspect.Parameter.empty and
-                isinstance(sig.parameters[name].annotation, type)):
-
-                try:
-                    # Only convert if needed and possible
-                    if not isinstance(value, sig.parameters[name].annotation) and value is not None:
-                        converted_kwargs[name] = sig.parameters[name].annotation(value)
-                    else:
-                        converted_kwargs[name] = value
-                except (ValueError, TypeError):
-                    # If conversion fails, use original value
-                    converted_kwargs[name] = value
-            else:
-                converted_kwargs[name] = value
+        keyword_converters = self._keyword_converters
+        if not keyword_converters:
+            return converted_args, dict(kwargs)
+        converted_kwargs = {name: self._convert(value, keyword_converters.get(name)) for name, value in kwargs.items()}
 
         return converted_args, converted_kwargs
 
+    @staticmethod
+    def _convert(value: Any, converter: Optional[type]) -> Any:
+        """Converts value with the parameter's type annotation, if it has one and the value is not already of that type."""
+        if converter is None or value is None or isinstance(value, converter):
+            return value
+        try:
+            return converter(value)
+        except (ValueError, TypeError):
+            # If conversion fails, use original value
+            return value
+
     async def _execute_callable(self, args: List[Any], kwargs: Dict[str, Any]) -> Any:
         """
-        Execute the callable with the given parameters.
+        Execute the callable with the given parameters, using this job's executor policy
+        if the callable is synchronous.
 
         Args:
             args: Positional arguments to pass
@@ -249,7 +313,32 @@ class WrappingJob(JobABC):
         Returns:
             Result of the callable execution
         """
-        result = self.callable(*args, **kwargs)
+        metrics = self._metrics
+        metrics["calls"] += 1
+        # A job with the process executor is already running in a pool process, see process_pool.py
+        if (self.executor in (self.EXECUTOR_INLINE, self.EXECUTOR_PROCESS)
+                or inspect.iscoroutinefunction(self.callable)):
+            start = time.perf_counter()
+            result = self.callable(*args, **kwargs)
+            blocked = time.perf_counter() - start
+            metrics["loop_blocking_time"] += blocked
+            if blocked > metrics["max_loop_blocking_time"]:
+                metrics["max_loop_blocking_time"] = blocked
+        else:
+            metrics["offloaded_calls"] += 1
+            if self.executor == self.EXECUTOR_THREAD:
+                pool = None  # the event loop's default executor is shared by all jobs
+            else:
+                pool = self._pool
+                if pool is None:
+                    # A job can run on several event loop threads at once, see FlowManager's loops
+                    with WrappingJob._pool_lock:
+                        if self._pool is None:
+                            self._pool = ThreadPoolExecutor(max_workers=self.executor, thread_name_prefix=self.name)
+                        pool = self._pool
+            # Run in a copy of the current context so the callable still sees the job's context variables
+            call = functools.partial(contextvars.copy_context().run, self.callable, *args, **kwargs)
+            result = await asyncio.get_running_loop().run_in_executor(pool, call)
 
         # Check if the result is a coroutine (from an async function)
         if inspect.iscoroutine(result):
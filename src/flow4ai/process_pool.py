@@ -0,0 +1,134 @@
+"""
+Process pool used to run CPU-bound jobs off the event loop.
+
+All the jobs of a job graph run on one event loop, so a job doing CPU-heavy work
+holds up every other task in that loop. A job whose properties set
+"executor": "process" (or a function wrapped with wrap(fn, executor="process"))
+has its run method executed in this pool instead, while the rest of the graph
+stays on the loop.
+
+The job, its task, its inputs and the graph context are pickled with pickle
+protocol 5 and run in a minimal job graph context in the child process, so
+get_inputs, get_task and get_context work as usual. Changes made to the context
+in the child are not sent back. The pool is created on first use, in the process
+that runs the graph, and shut down by shutdown_process_pool.
+"""
+
+import asyncio
+import copy
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from . import f4a_logging as logging
+
+logger = logging.getLogger(__name__)
+
+PICKLE_PROTOCOL = 5
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_pid: Optional[int] = None
+# Jobs on several event loop threads, see FlowManager's loops, may start the pool at once
+_pool_lock = threading.Lock()
+
+# The event loop of a pool process, reused for every job run in that process
+_child_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Returns the process pool of this process, creating it on first use.
+
+    The number of worker processes is set by the FLOW4AI_PROCESS_POOL_SIZE
+    environment variable, it defaults to the number of CPUs.
+    """
+    global _pool, _pool_pid
+    pool = _pool
+    # A pool inherited through fork belongs to the parent process and can't be used
+    if pool is not None and _pool_pid == os.getpid():
+        return pool
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            max_workers = os.getenv('FLOW4AI_PROCESS_POOL_SIZE')
+            _pool = ProcessPoolExecutor(max_workers=int(max_workers) if max_workers else None)
+            _pool_pid = os.getpid()
+            logger.info(f"Started process pool with {_pool._max_workers} workers")
+        return _pool
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Shuts down the process pool of this process, if it was started."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        pool, owned = _pool, _pool_pid == os.getpid()
+        _pool = None
+        _pool_pid = None
+    if pool is not None and owned:
+        logger.info("Shutting down process pool")
+        pool.shutdown(wait=wait)
+
+
+def _reset_pool_lock_after_fork() -> None:
+    # A thread of the parent may have held the lock when it forked, e.g. a FlowManagerMP worker
+    global _pool_lock
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_lock_after_fork)
+
+
+async def run_job_in_process(job, task: Any, inputs: Dict[str, Any], context: Dict[str, Any]) -> Any:
+    """
+    Runs job.run(task) in the process pool.
+
+    Args:
+        job: The job to run, it is sent without its next jobs or plan
+        task: The task passed to run
+        inputs: The job's inputs, keyed by the long names of its predecessors
+        context: The context of the job graph for this task
+
+    Returns:
+        The result returned by job.run in the pool process
+
+    Raises:
+        TypeError: If the job, task, inputs or context can't be pickled
+    """
+    shipped_job = copy.copy(job)
+    shipped_job.next_jobs = []
+    shipped_job.plan = None
+    try:
+        payload = pickle.dumps((shipped_job, task, dict(inputs), dict(context)), protocol=PICKLE_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise TypeError(f"Job {job.name} runs with executor 'process' but could not be pickled: {e}") from e
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(get_process_pool(), _run_job, payload)
+    return pickle.loads(result)
+
+
+def _run_job(payload: bytes) -> bytes:
+    """Runs a pickled job in a pool process and returns its pickled result."""
+    # Imported here, this module is imported by job.py
+    from .job import JobGraphContext, JobState, job_graph_context
+    from .job_plan import ExecutionPlan
+
+    global _child_loop
+    job, task, inputs, context = pickle.loads(payload)
+
+    graph_context = JobGraphContext()
+    graph_context.plan = ExecutionPlan([job], [()])
+    state = JobState()
+    state.inputs.update(inputs)
+    graph_context.states = [state]
+    graph_context.context = context
+
+    if _child_loop is None:
+        _child_loop = asyncio.new_event_loop()
+    token = job_graph_context.set(graph_context)
+    try:
+        result = _child_loop.run_until_complete(job.run(task))
+    finally:
+        job_graph_context.reset(token)
+    return pickle.dumps(result, protocol=PICKLE_PROTOCOL)
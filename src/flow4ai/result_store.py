@@ -0,0 +1,185 @@
+"""
+Stores for the results FlowManager keeps until pop_results is called.
+
+Results are stored by kind, COMPLETED for the results of completed tasks and ERRORS for
+the errors of failed ones, each under the fully qualified name of its job graph, and are
+handed back grouped by that name, oldest first.
+
+- MemoryResultStore holds results in memory, optionally as a ring buffer that drops the
+  oldest results once it holds max_results of a kind. It is the default, unbounded.
+- SpillResultStore holds up to max_in_memory results of a kind in memory and appends the
+  rest to a spill file, pickled one after another, read back only when they are popped.
+- DropResultStore drops completed results, for when on_complete or iter_results handles
+  every result, and keeps only the latest errors.
+"""
+
+import pickle
+import tempfile
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from typing import IO, Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from . import f4a_logging as logging
+
+logger = logging.getLogger(__name__)
+
+COMPLETED = "completed"
+ERRORS = "errors"
+KINDS = (COMPLETED, ERRORS)
+
+
+def _group(entries: Iterable[Tuple[str, Any]]) -> Dict[str, List[Any]]:
+    grouped = defaultdict(list)
+    for fq_name, entry in entries:
+        grouped[fq_name].append(entry)
+    return dict(grouped)
+
+
+class ResultStore(ABC):
+    """
+    Holds the results of a FlowManager until they are popped.
+
+    FlowManager calls add and pop while holding its own lock, so a store need not be thread safe.
+    """
+
+    def __init__(self):
+        self.dropped = {kind: 0 for kind in KINDS}
+
+    @abstractmethod
+    def add(self, kind: str, fq_name: str, entry: Any) -> None:
+        """Store a COMPLETED result or an ERRORS entry of the job graph fq_name."""
+
+    @abstractmethod
+    def pop(self, kind: str) -> Dict[str, List[Any]]:
+        """Remove and return every stored entry of kind, grouped by fq_name, oldest first."""
+
+    @abstractmethod
+    def count(self, kind: str) -> int:
+        """The number of entries of kind stored."""
+
+    def close(self) -> None:
+        """Release any resources held by the store, called when its FlowManager is closed."""
+
+    def _drop(self, kind: str) -> None:
+        if not self.dropped[kind]:
+            logger.warning(f"{self.__class__.__name__} is full, dropping the oldest {kind} results")
+        self.dropped[kind] += 1
+
+
+class MemoryResultStore(ResultStore):
+    """
+    Holds results in memory.
+
+    Args:
+        max_results (Optional[int]): The most entries of each kind held, the oldest are dropped
+            and counted in dropped to make room for new ones. None for no limit. Defaults to None.
+    """
+
+    def __init__(self, max_results: Optional[int] = None):
+        super().__init__()
+        if max_results is not None and (not isinstance(max_results, int) or max_results < 1):
+            raise ValueError(f"max_results must be a positive integer or None, got {max_results!r}")
+        self.max_results = max_results
+        self._entries: Dict[str, Deque[Tuple[str, Any]]] = {kind: deque() for kind in KINDS}
+
+    def add(self, kind: str, fq_name: str, entry: Any) -> None:
+        entries = self._entries[kind]
+        if self.max_results is not None and len(entries) >= self.max_results:
+            entries.popleft()
+            self._drop(kind)
+        entries.append((fq_name, entry))
+
+    def pop(self, kind: str) -> Dict[str, List[Any]]:
+        entries, self._entries[kind] = self._entries[kind], deque()
+        return _group(entries)
+
+    def count(self, kind: str) -> int:
+        return len(self._entries[kind])
+
+
+class SpillResultStore(ResultStore):
+    """
+    Holds up to max_in_memory entries of each kind in memory and spills the rest to disk.
+
+    Spilled entries are appended to a temporary file per kind, which the operating system
+    removes once it is closed, and are only read back when popped. An entry that can't be
+    pickled is kept in memory instead.
+
+    Args:
+        max_in_memory (int): The most entries of each kind held in memory. Defaults to 1000.
+        spill_dir (Optional[str]): The directory of the spill files, None for the system's
+            temporary directory. Defaults to None.
+    """
+
+    def __init__(self, max_in_memory: int = 1000, spill_dir: Optional[str] = None):
+        super().__init__()
+        if not isinstance(max_in_memory, int) or max_in_memory < 0:
+            raise ValueError(f"max_in_memory must be a non-negative integer, got {max_in_memory!r}")
+        self.max_in_memory = max_in_memory
+        self.spill_dir = spill_dir
+        self._entries: Dict[str, List[Tuple[str, Any]]] = {kind: [] for kind in KINDS}
+        self._spill_files: Dict[str, IO[bytes]] = {}
+        self._spilled = {kind: 0 for kind in KINDS}
+
+    def add(self, kind: str, fq_name: str, entry: Any) -> None:
+        if len(self._entries[kind]) < self.max_in_memory:
+            self._entries[kind].append((fq_name, entry))
+            return
+        try:
+            record = pickle.dumps((fq_name, entry), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Keeping a {kind} result of {fq_name} in memory, it can't be spilled: {e}")
+            self._entries[kind].append((fq_name, entry))
+            return
+        if kind not in self._spill_files:
+            self._spill_files[kind] = tempfile.TemporaryFile(prefix=f"flow4ai_{kind}_", dir=self.spill_dir)
+        self._spill_files[kind].write(record)
+        self._spilled[kind] += 1
+
+    def _read_spilled(self, kind: str) -> List[Tuple[str, Any]]:
+        spill_file = self._spill_files.get(kind)
+        if spill_file is None or not self._spilled[kind]:
+            return []
+        spill_file.seek(0)
+        # Each record is a complete pickle, so they are read back one after another
+        records = [pickle.load(spill_file) for _ in range(self._spilled[kind])]
+        spill_file.seek(0)
+        spill_file.truncate()
+        self._spilled[kind] = 0
+        return records
+
+    def pop(self, kind: str) -> Dict[str, List[Any]]:
+        # Entries are only spilled once memory is full, so the ones in memory are the older ones,
+        # except for unpicklable entries kept in memory, which end up ahead of spilled ones
+        entries, self._entries[kind] = self._entries[kind], []
+        return _group(entries + self._read_spilled(kind))
+
+    def count(self, kind: str) -> int:
+        return len(self._entries[kind]) + self._spilled[kind]
+
+    def close(self) -> None:
+        """Close and so remove the spill files."""
+        for spill_file in self._spill_files.values():
+            spill_file.close()
+        self._spill_files.clear()
+        self._spilled = {kind: 0 for kind in KINDS}
+
+
+class DropResultStore(MemoryResultStore):
+    """
+    Drops completed results, counting them in dropped, for a FlowManager whose results are all
+    handled by on_complete or iter_results. Errors are kept, so pop_results and execute still
+    report them, up to max_errors of the latest.
+
+    Args:
+        max_errors (int): The most errors held. Defaults to 1000.
+    """
+
+    def __init__(self, max_errors: int = 1000):
+        super().__init__(max_results=max_errors)
+
+    def add(self, kind: str, fq_name: str, entry: Any) -> None:
+        if kind == COMPLETED:
+            self.dropped[COMPLETED] += 1
+            return
+        super().add(kind, fq_name, entry)
@@ -0,0 +1,118 @@
+"""
+Copy-on-write views of job results passed as inputs to the next jobs.
+
+A job's result used to be shallow copied once for every next job, so that a job
+changing its inputs could not affect the inputs of its siblings. With wide fan-outs
+of large results that copying is measurable, so instead every next job is given its
+own ResultView of the one shared result, and a view only copies the result the first
+time the job changes it.
+
+get_inputs hands a job its views, so reading inputs copies nothing. A view is a
+Mapping rather than a dict, and unpickles as a plain dict. A result leaving the job
+graph, and each of its top level values, is made a plain dict if it is a view, see
+to_plain_result, so a job returning its inputs, or one of them, still returns plain
+dicts. Views nested deeper in a result are left as they are, as finding them would
+mean walking the whole result for every task.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator
+
+
+class ResultView(MutableMapping):
+    """
+    A view of a job result that copies the result on the first write.
+
+    Reads go to the shared result. Any change made through the view, with __setitem__,
+    __delitem__ or the methods built on them, is made to a shallow private copy, so the
+    shared result and other views never see it.
+    """
+    __slots__ = ('_data', '_owned')
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data: Dict[str, Any] = data
+        self._owned: bool = False
+
+    def _writable(self) -> Dict[str, Any]:
+        if not self._owned:
+            self._data = dict(self._data)
+            self._owned = True
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._writable()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._writable()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    def clear(self) -> None:
+        self._data = {}
+        self._owned = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns this view's own plain dict of the result, copying the shared result the
+        first time. Later calls return the same dict, and changes to it are changes to the view.
+        """
+        return self._writable()
+
+    def copy(self) -> Dict[str, Any]:
+        """Returns a plain dict copy of the result, like dict.copy."""
+        return dict(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ResultView):
+            return self._data == other._data
+        return self._data == other
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+    def __reduce__(self):
+        # Unpickles as a plain dict, results sent to other processes must not depend on this class
+        return (dict, (self._data,))
+
+
+def to_plain_result(result: Any) -> Any:
+    """
+    Returns result as a plain dict if it is a ResultView, with any of its top level values
+    that are views replaced by plain dicts, in place. Only the top level is looked at, so
+    the cost is the number of keys of the result, not the size of its values.
+
+    Args:
+        result: A job result
+
+    Returns:
+        The result as a plain dict if it was a view, otherwise the result itself
+    """
+    if isinstance(result, ResultView):
+        result = result.copy()
+    if isinstance(result, dict):
+        for key, value in result.items():
+            if isinstance(value, ResultView):
+                result[key] = value.copy()
+    return result
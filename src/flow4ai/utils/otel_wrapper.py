@@ -1,10 +1,11 @@
 import inspect
+import itertools
 import json
 import os
 from functools import wraps
 from importlib import resources
 from threading import Lock
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import yaml
 from opentelemetry import trace
@@ -15,10 +16,104 @@ from opentelemetry.sdk.trace.export import (BatchSpanProcessor,
                                             ConsoleSpanExporter, SpanExporter,
                                             SpanExportResult)
 
+from .. import f4a_logging as logging
+
+logger = logging.getLogger(__name__)
+
 # Explicitly define exports
-__all__ = ['TracerFactory', 'trace_function', 'AsyncFileExporter']
+__all__ = ['TracerFactory', 'trace_function', 'AsyncFileExporter', 'get_trace_mode', 'set_trace_mode',
+           'get_trace_sample_rate', 'sample_trace', 'add_trace_mode_listener',
+           'TRACE_MODE_OFF', 'TRACE_MODE_SAMPLED', 'TRACE_MODE_FULL']
 DEFAULT_OTEL_CONFIG = "otel_config.yaml"
 
+# Tracing modes of job graph execution:
+#   off      no tracing wrapper is installed and no spans are created
+#   sampled  1 in sample_rate tasks is traced, the decision is made when the head job starts a task
+#            and applies to every job of that task
+#   full     every task is traced, with detailed tracing of JobABC._execute
+TRACE_MODE_OFF = "off"
+TRACE_MODE_SAMPLED = "sampled"
+TRACE_MODE_FULL = "full"
+TRACE_MODES = (TRACE_MODE_OFF, TRACE_MODE_SAMPLED, TRACE_MODE_FULL)
+DEFAULT_TRACE_SAMPLE_RATE = 100
+
+_trace_mode: str = TRACE_MODE_FULL
+_trace_sample_rate: int = DEFAULT_TRACE_SAMPLE_RATE
+_trace_sample_counter = itertools.count()
+_trace_mode_listeners: List[Callable[[str], None]] = []
+
+
+def get_trace_mode() -> str:
+    """Returns the tracing mode, one of TRACE_MODES."""
+    return _trace_mode
+
+
+def get_trace_sample_rate() -> int:
+    """Returns N, where 1 in N tasks is traced in the sampled tracing mode."""
+    return _trace_sample_rate
+
+
+def set_trace_mode(mode: str, sample_rate: Optional[int] = None) -> None:
+    """Set the tracing mode, which is initially read from the FLOW4AI_TRACE_MODE environment
+    variable and FLOW4AI_TRACE_SAMPLE_RATE for the sampled mode.
+
+    The mode is set for this process only. FlowManagerMP worker processes that are already
+    running keep their mode, set the environment variables before they start instead.
+
+    Args:
+        mode: "off", "sampled" or "full"
+        sample_rate: Trace 1 in sample_rate tasks in the sampled mode, unchanged if None
+    Raises:
+        ValueError: If the mode or sample rate is not valid
+    """
+    global _trace_mode, _trace_sample_rate
+    if mode not in TRACE_MODES:
+        raise ValueError(f"Unsupported trace mode {mode!r}, expected one of {TRACE_MODES}")
+    if sample_rate is not None:
+        if sample_rate < 1:
+            raise ValueError(f"Trace sample rate must be at least 1, got {sample_rate}")
+        _trace_sample_rate = int(sample_rate)
+    _trace_mode = mode
+    for listener in _trace_mode_listeners:
+        listener(mode)
+
+
+def add_trace_mode_listener(listener: Callable[[str], None]) -> None:
+    """Register a function called with the new mode whenever the tracing mode is set."""
+    _trace_mode_listeners.append(listener)
+
+
+def sample_trace() -> bool:
+    """Decide whether the next task is traced, according to the tracing mode."""
+    if _trace_mode == TRACE_MODE_FULL:
+        return True
+    if _trace_mode == TRACE_MODE_OFF:
+        return False
+    return next(_trace_sample_counter) % _trace_sample_rate == 0
+
+
+def _set_trace_mode_from_env() -> None:
+    """Set the tracing mode from the environment, a bad value is logged and the default used,
+    so a typo in the environment can't stop flow4ai from being imported."""
+    mode = os.getenv('FLOW4AI_TRACE_MODE', TRACE_MODE_FULL).strip().lower()
+    if mode not in TRACE_MODES:
+        logger.warning(f"Ignoring FLOW4AI_TRACE_MODE={mode!r}, expected one of {TRACE_MODES}, "
+                       f"using {TRACE_MODE_FULL!r}")
+        mode = TRACE_MODE_FULL
+    sample_rate = os.getenv('FLOW4AI_TRACE_SAMPLE_RATE', str(DEFAULT_TRACE_SAMPLE_RATE))
+    try:
+        sample_rate = int(sample_rate)
+        if sample_rate < 1:
+            raise ValueError(sample_rate)
+    except ValueError:
+        logger.warning(f"Ignoring FLOW4AI_TRACE_SAMPLE_RATE={sample_rate!r}, expected a positive integer, "
+                       f"using {DEFAULT_TRACE_SAMPLE_RATE}")
+        sample_rate = DEFAULT_TRACE_SAMPLE_RATE
+    set_trace_mode(mode, sample_rate)
+
+
+_set_trace_mode_from_env()
+
 class AsyncFileExporter(SpanExporter):
     """Asynchronous file exporter for OpenTelemetry spans with log rotation support."""
     
@@ -0,0 +1,149 @@
+"""
+    Tests resource aware admission:
+        - the AdmissionController window caps the running tasks and moves AIMD style
+        - event loop lag, RSS and open file descriptors are sampled and compared to their limits
+        - FlowManager and FlowManagerMP report the throttle state in get_stats
+"""
+
+import asyncio
+import time
+
+from flow4ai.admission import (AdmissionController, ResourceLimits,
+                               sample_process_resources)
+from flow4ai.flowmanager import FlowManager
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC
+
+
+class SleepJob(JobABC):
+    def __init__(self):
+        super().__init__("Sleep Job")
+
+    async def run(self, task) -> dict:
+        await asyncio.sleep(0.01)
+        return {"task_id": task["task_id"]}
+
+
+def test_window_caps_running_tasks():
+    admission = AdmissionController(max_window=2)
+    running = 0
+    max_running = 0
+
+    async def run_task():
+        nonlocal running, max_running
+        await admission.acquire()
+        try:
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+        finally:
+            admission.release()
+
+    async def main():
+        await asyncio.gather(*(run_task() for _ in range(10)))
+
+    asyncio.run(main())
+    assert max_running == 2
+    assert admission.in_flight == 0
+
+
+def test_aimd_window():
+    admission = AdmissionController(ResourceLimits(max_loop_lag=0.1), max_window=100)
+    assert admission.window == AdmissionController.INITIAL_WINDOW
+
+    # Slow start doubles the window until a limit is hit
+    admission.adjust(None, None, loop_lag=0.0)
+    assert admission.window == 2 * AdmissionController.INITIAL_WINDOW
+    admission.adjust(None, None, loop_lag=0.0)
+    admission.adjust(None, None, loop_lag=0.0)
+    assert admission.window == 100
+
+    admission.adjust(None, None, loop_lag=1.0)
+    assert admission.window == 50
+    assert admission.throttled
+    admission.adjust(None, None, loop_lag=1.0)
+    assert admission.window == 25
+
+    # Then grows back by a step at a time
+    admission.adjust(None, None, loop_lag=0.0)
+    assert admission.window == 25 + AdmissionController.INCREASE_STEP
+    assert not admission.throttled
+    for _ in range(20):
+        admission.adjust(None, None, loop_lag=0.0)
+    assert admission.window == 100
+
+
+def test_window_without_max_follows_running_tasks():
+    admission = AdmissionController(ResourceLimits(max_rss_mb=1))
+    admission.in_flight = 100
+    for _ in range(10):
+        admission.adjust(rss=0, open_fds=None, loop_lag=0.0)
+    assert admission.window == 200
+    admission.adjust(rss=2**30, open_fds=None, loop_lag=0.0)
+    assert admission.window == 100
+    # An idle loop doesn't keep a window that would let the next burst in at once
+    admission.in_flight = 0
+    admission.adjust(rss=0, open_fds=None, loop_lag=0.0)
+    assert admission.window == AdmissionController.INITIAL_WINDOW
+
+
+def test_limits_exceeded():
+    limits = ResourceLimits(max_rss_mb=10, max_loop_lag=0.5, max_open_fds=100)
+    assert not limits.exceeded(rss=5 * 2**20, open_fds=50, loop_lag=0.1)
+    assert limits.exceeded(rss=11 * 2**20, open_fds=50, loop_lag=0.1)
+    assert limits.exceeded(rss=5 * 2**20, open_fds=101, loop_lag=0.1)
+    assert limits.exceeded(rss=5 * 2**20, open_fds=50, loop_lag=0.6)
+    # Signals that can't be read are not checked
+    assert not limits.exceeded(rss=None, open_fds=None, loop_lag=0.1)
+
+
+def test_sample_process_resources():
+    rss, open_fds = sample_process_resources()
+    assert rss > 0
+    assert open_fds > 0
+
+
+def test_monitor_backs_off_on_loop_lag():
+    admission = AdmissionController(ResourceLimits(max_loop_lag=0.05, sample_interval=0.01), max_window=100)
+
+    async def main():
+        monitor = asyncio.create_task(admission.monitor())
+        await asyncio.sleep(0.02)
+        time.sleep(0.2)  # blocks the loop
+        await asyncio.sleep(0.001)
+        monitor.cancel()
+
+    asyncio.run(main())
+    assert admission.window < 100
+    assert admission.throttled
+
+
+def test_flowmanager_throttles_and_completes():
+    # Any process is over 1 MB, so admission stays throttled to the smallest window
+    fm = FlowManager(SleepJob(), resource_limits=ResourceLimits(max_rss_mb=1, sample_interval=0.01))
+    try:
+        time.sleep(0.05)
+        for i in range(20):
+            fm.submit_task({"task_id": i})
+        assert fm.wait_for_completion(timeout=10)
+        stats = fm.get_stats()
+        assert stats["completed"] == 20
+        assert stats["throttled"]
+        assert stats["admission_window"] == AdmissionController.MIN_WINDOW
+    finally:
+        fm.close()
+
+
+def test_flowmanagerMP_reports_throttled_workers():
+    results = []
+    flowmanagerMP = FlowManagerMP(SleepJob(), results.append, serial_processing=True, num_workers=2,
+                                  resource_limits=ResourceLimits(max_rss_mb=1, sample_interval=0.01))
+    time.sleep(0.2)
+    stats = flowmanagerMP.get_stats()
+    assert stats["throttled_workers"] == 2
+    assert stats["admission_windows"] == [AdmissionController.MIN_WINDOW] * 2
+    flowmanagerMP.submit_task([{"task_id": i} for i in range(20)])
+    flowmanagerMP.close_processes()
+
+    assert sorted(r["task_id"] for r in results) == list(range(20))
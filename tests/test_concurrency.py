@@ -120,11 +120,10 @@ graph_definition1 = {
 @pytest.mark.asyncio
 async def test_simple_graph():
     head_job:JobABC = JobFactory.create_job_graph(graph_definition1, jobs)
-    job_set = JobABC.job_set(head_job)
     # Create 50 tasks to run concurrently
     tasks = []
     for _ in range(50):
-      async with job_graph_context_manager(job_set):
+      async with job_graph_context_manager():
         task = asyncio.create_task(head_job._execute(Task({'1': {},'2': {}})))
         tasks.append(task)
     
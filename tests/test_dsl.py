@@ -1265,6 +1265,103 @@ class TestWrappingJob:
 
 
 
+    @pytest.mark.asyncio
+    async def test_wrapping_job_executor_policies(self):
+        """Test that sync callables run on the loop thread inline and in pool threads when offloaded."""
+        import threading
+
+        def thread_name(x):
+            return {"x": x, "thread": threading.current_thread().name}
+
+        inline_job = wrap(thread_name)
+        shared_job = wrap(thread_name, executor="thread")
+        dedicated_job = wrap(thread_name, executor=2)
+        named_jobs = wrap({"named_a": thread_name, "named_b": thread_name}, executor="thread")
+        properties_job = WrappingJob(thread_name, "props", properties={"executor": 1})
+
+        assert inline_job.executor == "inline"
+        assert shared_job.executor == "thread"
+        assert dedicated_job.executor == 2
+        assert all(job.executor == "thread" for job in named_jobs.values())
+        assert properties_job.executor == 1
+
+        loop_thread = threading.current_thread().name
+        for job in [inline_job, shared_job, dedicated_job, properties_job]:
+            job.get_task = MagicMock(return_value={job.name: {"x": 1}})
+            result = await job.run({})
+            assert result["x"] == 1
+            if job is inline_job:
+                assert result["thread"] == loop_thread
+            else:
+                assert result["thread"] != loop_thread
+        assert dedicated_job._pool is not None and dedicated_job._pool._max_workers == 2
+        pool = dedicated_job._pool
+        dedicated_job.close()
+        assert dedicated_job._pool is None and pool._shutdown
+        result = await dedicated_job.run({})
+        assert result["thread"] != loop_thread, "a closed job starts a new pool when it runs again"
+        dedicated_job.close()
+
+        inline_metrics = inline_job.get_metrics()
+        assert inline_metrics["calls"] == 1 and inline_metrics["offloaded_calls"] == 0
+        assert inline_metrics["loop_blocking_time"] >= inline_metrics["max_loop_blocking_time"] > 0
+        shared_metrics = shared_job.get_metrics()
+        assert shared_metrics["executor"] == "thread"
+        assert shared_metrics["offloaded_calls"] == 1 and shared_metrics["loop_blocking_time"] == 0
+
+    @pytest.mark.asyncio
+    async def test_wrapping_job_compiles_signature_once(self):
+        """Test that the signature is inspected when wrapping and the cached converters are applied on every run."""
+        from unittest.mock import patch
+
+        def scale(value: float, factor: int = 2, j_ctx=None):
+            return {"value": value * factor, "types": (type(value).__name__, type(factor).__name__)}
+
+        job = WrappingJob(scale, "scale")
+        assert job._param_names == ["value", "factor", "j_ctx"]
+        assert job._accepts_context and job._requires_non_context_params
+        assert job._keyword_converters == {"value": float, "factor": int}
+
+        job.get_inputs = MagicMock(return_value={})
+        with patch("flow4ai.jobs.wrapping_job.inspect.signature") as signature:
+            first = await job.run({"scale": {"value": "1.5", "factor": "3"}})
+            second = await job.run({"scale": {"args": ["2"]}})
+        signature.assert_not_called()
+        assert first == {"value": 4.5, "types": ("float", "int")}
+        assert second == {"value": 4.0, "types": ("float", "int")}
+
+    def test_wrapping_job_rejects_invalid_executor(self):
+        """Test that an unknown executor policy is rejected when the callable is wrapped."""
+        with pytest.raises(ValueError, match="Invalid executor"):
+            wrap(lambda: 1, executor="gpu")
+        with pytest.raises(ValueError, match="Invalid executor"):
+            WrappingJob(lambda: 1, "zero_threads", executor=0)
+
+    def test_wrap_callable_named_executor(self):
+        """Test that a callable passed as executor is wrapped under that name, not taken as an executor policy."""
+        def run_order():
+            return "ran"
+
+        job = wrap(executor=run_order)
+        assert isinstance(job, WrappingJob)
+        assert job.name == "executor" and job.callable is run_order
+        assert job.executor == WrappingJob.EXECUTOR_INLINE
+
+        jobs = wrap(executor=run_order, report=lambda: 1)
+        assert set(jobs) == {"executor", "report"}
+
+    def test_flowmanager_run_closes_dedicated_pools(self):
+        """Test that the thread pools of wrapped functions are shut down with the FlowManager."""
+        from flow4ai.flowmanager import FlowManager
+
+        job = wrap(lambda x: x + 1, executor=2)
+        job.name = "increment"
+        errors, result = FlowManager.run(job, {"increment.x": 1}, "closes_pools")
+
+        assert errors == {} and result["result"] == 2
+        assert job._pool is None
+
+
 class TestComplexDSLExpressions:
     """Tests for complex, highly nested DSL expressions."""
     
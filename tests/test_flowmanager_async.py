@@ -0,0 +1,135 @@
+"""
+    Tests AsyncFlowManager, which runs tasks on the caller's event loop:
+        - submit_async runs the graph on the running loop and returns the tail result, or raises its error
+        - concurrent submit_async calls run concurrently and are counted
+        - submit_task schedules on the bound loop, with results for pop_results and results()
+        - it can be bound again once its loop is closed, but not used from two running loops
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from flow4ai.admission import ResourceLimits
+from flow4ai.dsl import wrap
+from flow4ai.flowmanager_async import AsyncFlowManager
+from flow4ai.job import JobABC
+
+
+class LoopJob(JobABC):
+    """Returns the thread it ran in and the loop it ran on."""
+
+    def __init__(self):
+        super().__init__("Loop Job")
+
+    async def run(self, task) -> dict:
+        await asyncio.sleep(task.get("delay", 0))
+        if task.get("fail"):
+            raise ValueError("failed on purpose")
+        return {"task_id": task["task_id"], "thread": threading.get_ident(), "loop": asyncio.get_running_loop()}
+
+
+def test_submit_async_runs_on_the_callers_loop():
+    handled = []
+    afm = AsyncFlowManager(LoopJob(), on_complete=handled.append)
+
+    async def main():
+        result = await afm.submit_async({"task_id": 1})
+        assert result["thread"] == threading.get_ident()
+        assert result["loop"] is asyncio.get_running_loop()
+        return result
+
+    try:
+        result = asyncio.run(main())
+        assert result["task_id"] == 1
+        assert handled == [result]
+        assert afm.get_counts() == {"submitted": 1, "completed": 1, "errors": 0, "post_processing": 1}
+        # The result is returned, not kept
+        assert afm.pop_results() == {"completed": {}, "errors": {}}
+        assert afm.thread is None
+    finally:
+        afm.close()
+
+
+def square(x):
+    return x ** 2
+
+
+def add_one(j_ctx):
+    return j_ctx["inputs"]["square"]["result"] + 1
+
+
+def test_submit_async_of_a_graph_returns_the_tail_result():
+    jobs = wrap({"square": square, "add_one": add_one})
+    afm = AsyncFlowManager()
+    fq_name = afm.add_dsl(jobs["square"] >> jobs["add_one"], "pipeline")
+
+    async def main():
+        return await afm.submit_async({"square.x": 5}, fq_name)
+
+    try:
+        result = asyncio.run(main())
+        assert result["result"] == 26
+    finally:
+        afm.close()
+
+
+def test_submit_async_raises_errors_and_counts_them():
+    afm = AsyncFlowManager(LoopJob())
+
+    async def main():
+        return await asyncio.gather(*(afm.submit_async({"task_id": i, "fail": i == 3, "delay": 0.1})
+                                      for i in range(10)), return_exceptions=True)
+
+    try:
+        results = asyncio.run(main())
+        assert isinstance(results[3], ValueError)
+        assert sorted(r["task_id"] for r in results if isinstance(r, dict)) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        assert afm.get_counts() == {"submitted": 10, "completed": 9, "errors": 1, "post_processing": 0}
+    finally:
+        afm.close()
+
+
+def test_submit_task_runs_on_the_bound_loop():
+    afm = AsyncFlowManager(LoopJob())
+
+    async def main():
+        afm.submit_task([{"task_id": i, "delay": 0.01} for i in range(5)])
+        return sorted([result["task_id"] async for result in afm.results(timeout=5)])
+
+    try:
+        assert asyncio.run(main()) == list(range(5))
+    finally:
+        afm.close()
+
+
+def test_loop_binding():
+    afm = AsyncFlowManager(LoopJob(), resource_limits=ResourceLimits(max_loop_lag=1, sample_interval=0.01))
+
+    async def main():
+        return await afm.submit_async({"task_id": 0})
+
+    try:
+        asyncio.run(main())
+        # The first loop is closed, so the next one binds
+        asyncio.run(main())
+        assert afm.get_counts()["completed"] == 2
+
+        with pytest.raises(RuntimeError, match="not bound"):
+            AsyncFlowManager(LoopJob()).submit_task({"task_id": 0})
+
+        async def bound_forever():
+            await afm.submit_async({"task_id": 0})
+            ready.set()
+            await asyncio.sleep(0.5)
+
+        ready = threading.Event()
+        thread = threading.Thread(target=asyncio.run, args=(bound_forever(),))
+        thread.start()
+        ready.wait(5)
+        with pytest.raises(RuntimeError, match="another event loop"):
+            asyncio.run(main())
+        thread.join()
+    finally:
+        afm.close()
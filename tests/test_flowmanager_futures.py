@@ -0,0 +1,78 @@
+"""
+    Tests the futures returned by FlowManager.submit_task:
+        - a future per task, or a list of them for a list of tasks, resolving to the task's tail result
+        - a failed task's future raises its error
+        - with a DropResultStore the futures are the only place the results are kept
+"""
+
+import asyncio
+from concurrent.futures import Future
+
+import pytest
+
+from flow4ai.flowmanager import FlowManager
+from flow4ai.flowmanager_async import AsyncFlowManager
+from flow4ai.job import JobABC
+from flow4ai.result_store import DropResultStore
+
+
+class EchoJob(JobABC):
+    def __init__(self):
+        super().__init__("Echo Job")
+
+    async def run(self, task) -> dict:
+        await asyncio.sleep(0.01 * task.get("delay", 0))
+        if task.get("fail"):
+            raise ValueError("failed on purpose")
+        return {"task_id": task["task_id"]}
+
+
+def test_submit_task_returns_futures():
+    fm = FlowManager(EchoJob())
+    try:
+        future = fm.submit_task({"task_id": "single"})
+        assert isinstance(future, Future)
+        # Later tasks finish first, each future still resolves to its own task's result
+        futures = fm.submit_task([{"task_id": i, "delay": 10 - i} for i in range(10)])
+        assert [f.result(timeout=5)["task_id"] for f in futures] == list(range(10))
+        assert future.result(timeout=5)["task_id"] == "single"
+        assert fm.wait_for_completion()
+        assert sum(len(results) for results in fm.pop_results()["completed"].values()) == 11
+    finally:
+        fm.close()
+
+
+def test_failed_task_future_raises():
+    fm = FlowManager(EchoJob())
+    try:
+        future = fm.submit_task({"task_id": 0, "fail": True})
+        with pytest.raises(ValueError, match="failed on purpose"):
+            future.result(timeout=5)
+        assert fm.wait_for_completion()
+        assert len(next(iter(fm.pop_results()["errors"].values()))) == 1
+    finally:
+        fm.close()
+
+
+def test_futures_without_central_results():
+    fm = FlowManager(EchoJob(), result_store=DropResultStore())
+    try:
+        futures = fm.submit_task([{"task_id": i} for i in range(5)])
+        assert [f.result(timeout=5)["task_id"] for f in futures] == list(range(5))
+        assert fm.wait_for_completion()
+        assert fm.pop_results()["completed"] == {}
+    finally:
+        fm.close()
+
+
+def test_async_flowmanager_submit_task_returns_tasks():
+    afm = AsyncFlowManager(EchoJob())
+
+    async def main():
+        tasks = afm.submit_task([{"task_id": i} for i in range(3)])
+        return [result["task_id"] for result in await asyncio.gather(*tasks)]
+
+    try:
+        assert asyncio.run(main()) == [0, 1, 2]
+    finally:
+        afm.close()
@@ -0,0 +1,95 @@
+"""
+    Tests FlowManager with several event loops:
+        - with fq_name sharding each graph runs on a loop of its own, with round_robin a graph's tasks are spread
+        - a graph blocking its loop doesn't hold up a graph on another loop, and the lag shows in get_stats
+        - results are streamed from every loop, and close stops every loop thread
+"""
+
+import threading
+import time
+
+import pytest
+
+from flow4ai.flowmanager import FlowManager
+from flow4ai.flowmanager_async import AsyncFlowManager
+from flow4ai.job import JobABC
+
+
+class ThreadJob(JobABC):
+    """Blocks its loop for the task's block seconds, then returns the thread it ran in."""
+
+    async def run(self, task) -> dict:
+        time.sleep(task.get("block", 0))
+        return {"task_id": task["task_id"], "thread": threading.get_ident()}
+
+
+def test_fq_name_sharding_runs_each_graph_on_a_loop_of_its_own():
+    fm = FlowManager(loops=2)
+    try:
+        fq_names = [fm.add_dsl(ThreadJob(name), name) for name in ("graph_a", "graph_b")]
+        futures = {fq_name: fm.submit_task([{"task_id": i} for i in range(5)], fq_name) for fq_name in fq_names}
+        threads = {fq_name: {future.result(timeout=5)["thread"] for future in graph_futures}
+                   for fq_name, graph_futures in futures.items()}
+        assert all(len(graph_threads) == 1 for graph_threads in threads.values())
+        assert threads[fq_names[0]] != threads[fq_names[1]]
+    finally:
+        fm.close()
+
+
+def test_round_robin_sharding_spreads_a_graph_over_the_loops():
+    fm = FlowManager(ThreadJob("graph"), loops=3, loop_sharding="round_robin")
+    try:
+        futures = fm.submit_task([{"task_id": i} for i in range(6)])
+        assert len({future.result(timeout=5)["thread"] for future in futures}) == 3
+    finally:
+        fm.close()
+
+
+def test_a_blocked_loop_doesnt_hold_up_the_others():
+    fm = FlowManager(loops=2)
+    try:
+        blocking = fm.add_dsl(ThreadJob("blocking"), "blocking")
+        light = fm.add_dsl(ThreadJob("light"), "light")
+        blocked = fm.submit_task({"task_id": 0, "block": 0.5}, blocking)
+        start = time.perf_counter()
+        fm.submit_task({"task_id": 1}, light).result(timeout=5)
+        assert time.perf_counter() - start < 0.25
+        blocked.result(timeout=5)
+        time.sleep(0.05)  # for the blocked loop's late sample
+
+        stats = fm.get_stats()
+        assert all(lag is not None for lag in stats["loop_lags"])
+        blocked_lag, light_lag = stats["max_loop_lags"]
+        assert blocked_lag > 0.2
+        assert light_lag < 0.2
+    finally:
+        fm.close()
+
+
+def test_results_are_streamed_from_every_loop():
+    fm = FlowManager(ThreadJob("graph"), loops=2, loop_sharding="round_robin",
+                     stream_results=True, result_buffer_size=2)
+    try:
+        fm.submit_task([{"task_id": i} for i in range(20)])
+        results = list(fm.iter_results(timeout=5))
+    finally:
+        fm.close()
+    assert sorted(r["task_id"] for r in results) == list(range(20))
+    assert len({r["thread"] for r in results}) == 2
+
+
+def test_close_stops_every_loop_thread():
+    fm = FlowManager(ThreadJob("graph"), loops=3, loop_sharding="round_robin")
+    futures = fm.submit_task([{"task_id": i} for i in range(3)])
+    threads = {future.result(timeout=5)["thread"] for future in futures}
+    fm.close()
+    assert not [thread for thread in threading.enumerate() if thread.ident in threads]
+
+
+def test_invalid_loops():
+    with pytest.raises(ValueError, match="loops"):
+        FlowManager(loops=0)
+    with pytest.raises(ValueError, match="loop_sharding"):
+        FlowManager(loops=2, loop_sharding="random")
+    with pytest.raises(ValueError, match="loops must be 1"):
+        AsyncFlowManager(loops=2)
@@ -0,0 +1,105 @@
+"""
+    Tests FlowManagerMP with a coroutine on_complete:
+        - in the result processor and with serial_processing, results are handed off concurrently
+        - on_complete_concurrency caps the hand-offs awaited at once, and the results taken off the result queue
+        - a failing hand-off doesn't stop the others
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC
+
+NUM_TASKS = 10
+HAND_OFF_TIME = 0.2
+
+
+class EchoJob(JobABC):
+    def __init__(self):
+        super().__init__("Echo Job")
+
+    async def run(self, task) -> dict:
+        return {"task_id": task["task_id"]}
+
+
+async def slow_result_to_file(result):
+    """Module level async on_complete, so it can be pickled to the result processor."""
+    await asyncio.sleep(HAND_OFF_TIME)
+    if result["task_id"] == 0:
+        raise ValueError("hand-off failed on purpose")
+    with open(slow_result_to_file.path, "a") as f:
+        f.write(f"{result['task_id']}\n")
+
+
+def run_tasks(on_complete, **kwargs):
+    flowmanagerMP = FlowManagerMP(EchoJob(), on_complete, **kwargs)
+    start = time.perf_counter()
+    flowmanagerMP.submit_task([{"task_id": i} for i in range(NUM_TASKS)])
+    flowmanagerMP.close_processes()
+    return flowmanagerMP, time.perf_counter() - start
+
+
+@pytest.mark.parametrize("concurrency, min_time, max_time", [
+    # Well under the time the hand-offs would take one after another
+    (NUM_TASKS, 0, NUM_TASKS * HAND_OFF_TIME / 2),
+    (2, NUM_TASKS // 2 * HAND_OFF_TIME, None),
+])
+def test_result_processor_awaits_hand_offs_concurrently(tmp_path, concurrency, min_time, max_time):
+    slow_result_to_file.path = str(tmp_path / "results.txt")
+    flowmanagerMP, elapsed = run_tasks(slow_result_to_file, on_complete_concurrency=concurrency)
+
+    with open(slow_result_to_file.path) as f:
+        assert sorted(int(line) for line in f) == list(range(1, NUM_TASKS))
+    assert flowmanagerMP.post_processing_tasks.value == NUM_TASKS
+    assert elapsed >= min_time
+    if max_time is not None:
+        assert elapsed < max_time
+
+
+async def stalled_hand_off(result):
+    await asyncio.sleep(1)
+
+
+def test_result_processor_takes_no_more_results_than_it_can_hand_off():
+    num_tasks, concurrency = 6, 2
+    flowmanagerMP = FlowManagerMP(EchoJob(), stalled_hand_off, on_complete_concurrency=concurrency)
+    try:
+        flowmanagerMP.submit_task([{"task_id": i} for i in range(num_tasks)])
+        deadline = time.monotonic() + 5
+        while flowmanagerMP.tasks_completed.value < num_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.2)  # for the results to reach the queue, and the processor to take what it will
+        # The results taken but not handed off yet are the ones in on_complete, the rest wait in the queue
+        assert flowmanagerMP.post_processing_tasks.value == concurrency
+        assert flowmanagerMP._result_queue.qsize() == num_tasks - concurrency
+    finally:
+        flowmanagerMP.close_processes()
+    assert flowmanagerMP.post_processing_tasks.value == num_tasks
+
+
+def test_serial_processing_awaits_hand_offs_concurrently():
+    results = []
+    running = 0
+    max_running = 0
+
+    async def unpicklable_on_complete(result):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        results.append(result)
+
+    flowmanagerMP, _ = run_tasks(unpicklable_on_complete, serial_processing=True, on_complete_concurrency=3)
+
+    assert sorted(r["task_id"] for r in results) == list(range(NUM_TASKS))
+    assert max_running == 3
+    assert flowmanagerMP.post_processing_tasks.value == NUM_TASKS
+
+
+def test_invalid_on_complete_concurrency():
+    with pytest.raises(ValueError, match="on_complete_concurrency"):
+        FlowManagerMP(EchoJob(), on_complete_concurrency=0)
@@ -0,0 +1,108 @@
+"""
+    Tests the FlowManagerMP max_in_flight and max_queued limits:
+        - a worker never runs more than max_in_flight tasks at once
+        - submit_task waits for room under max_queued, times out, or rejects the tasks
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC
+
+
+class SlowJob(JobABC):
+    """Sleeps for the task's delay and returns the most tasks it saw running at once in its process."""
+    running = 0
+    max_running = 0
+
+    def __init__(self):
+        super().__init__("Slow Job")
+
+    async def run(self, task) -> dict:
+        SlowJob.running += 1
+        SlowJob.max_running = max(SlowJob.max_running, SlowJob.running)
+        try:
+            await asyncio.sleep(task.get("delay", 0.01))
+        finally:
+            SlowJob.running -= 1
+        return {"task_id": task["task_id"], "max_running": SlowJob.max_running}
+
+
+def test_max_in_flight_bounds_running_tasks():
+    results = []
+    flowmanagerMP = FlowManagerMP(SlowJob(), results.append, serial_processing=True, max_in_flight=3)
+    flowmanagerMP.submit_task([{"task_id": i} for i in range(30)])
+    flowmanagerMP.close_processes()
+
+    assert len(results) == 30
+    assert max(r["max_running"] for r in results) == 3
+
+
+def test_max_queued_blocks_until_there_is_room():
+    results = []
+    flowmanagerMP = FlowManagerMP(SlowJob(), results.append, serial_processing=True,
+                                  max_in_flight=2, max_queued=4, task_batch_size=1)
+    for i in range(20):
+        assert flowmanagerMP.submit_task({"task_id": i})
+        stats = flowmanagerMP.get_stats()
+        assert stats["submitted"] - stats["in_progress"] <= 4
+    flowmanagerMP.close_processes()
+
+    assert sorted(r["task_id"] for r in results) == list(range(20))
+
+
+def test_waiting_for_room_wakes_when_a_task_starts():
+    flowmanagerMP = FlowManagerMP(SlowJob(), max_in_flight=1, max_queued=1, task_batch_size=1)
+    try:
+        flowmanagerMP.submit_task({"task_id": 0, "delay": 0.3})  # started as soon as the worker takes it
+        while flowmanagerMP.get_stats()["in_progress"] < 1:
+            time.sleep(0.01)
+        flowmanagerMP.submit_task({"task_id": 1})  # fills max_queued until task 0 is done
+        start = time.monotonic()
+        waiting = threading.Thread(target=flowmanagerMP.submit_task, args=({"task_id": 2},))
+        waiting.start()
+        time.sleep(0.1)
+        # The waiting submitter blocks without holding the lock that reject_when_full takes
+        assert waiting.is_alive()
+        assert not flowmanagerMP._admission_lock.locked()
+        waiting.join(timeout=5)
+        assert not waiting.is_alive()
+        assert 0.2 < time.monotonic() - start < 0.3 + FlowManagerMP.QUEUE_ROOM_CHECK_INTERVAL
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_max_queued_submit_timeout():
+    flowmanagerMP = FlowManagerMP(SlowJob(), max_in_flight=1, max_queued=1, submit_timeout=0.05)
+    try:
+        with pytest.raises(TimeoutError, match="max_queued=1"):
+            for i in range(5):
+                flowmanagerMP.submit_task({"task_id": i, "delay": 0.5})
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_reject_when_full():
+    results = []
+    flowmanagerMP = FlowManagerMP(SlowJob(), results.append, serial_processing=True,
+                                  max_in_flight=1, max_queued=2, reject_when_full=True)
+    # A list that can never fit is rejected whole
+    assert not flowmanagerMP.submit_task([{"task_id": i} for i in range(3)])
+    assert flowmanagerMP.get_stats()["submitted"] == 0
+
+    accepted = [i for i in range(10) if flowmanagerMP.submit_task({"task_id": i, "delay": 0.2})]
+    flowmanagerMP.close_processes()
+
+    assert 2 <= len(accepted) < 10
+    assert sorted(r["task_id"] for r in results) == accepted
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError, match="max_in_flight"):
+        FlowManagerMP(SlowJob(), max_in_flight=0)
+    with pytest.raises(ValueError, match="max_queued"):
+        FlowManagerMP(SlowJob(), max_queued=-1)
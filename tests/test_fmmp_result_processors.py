@@ -0,0 +1,149 @@
+"""
+    Tests FlowManagerMP result hand-off with several result processors and on_complete_batch:
+        - every result is handed off once whatever the number of result processors
+        - coroutine on_complete results are spread over the result processors
+        - batches hold at most result_batch_size results, and a partial batch is handed off after the linger time
+        - with serial_processing, results are batched in this process
+        - a coroutine on_complete and on_complete_batch work together
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC
+
+NUM_TASKS = 50
+
+
+class EchoJob(JobABC):
+    def __init__(self):
+        super().__init__("Echo Job")
+
+    async def run(self, task) -> dict:
+        return {"task_id": task["task_id"]}
+
+
+def result_to_file(result):
+    """Module level on_complete, so it can be pickled to the result processors."""
+    with open(result_to_file.path, "a") as f:
+        f.write(f"{result['task_id']} {os.getpid()}\n")
+
+
+async def async_result_to_file(result):
+    result_to_file(result)
+
+
+async def slow_async_result_to_file(result):
+    await asyncio.sleep(0.2)
+    result_to_file(result)
+
+
+def batch_to_file(batch):
+    """Module level on_complete_batch, one line per batch."""
+    if batch[0]["task_id"] == -1:
+        raise ValueError("batch failed on purpose")
+    with open(batch_to_file.path, "a") as f:
+        f.write(" ".join(str(result["task_id"]) for result in batch) + "\n")
+
+
+def read_batches(path):
+    with open(path) as f:
+        return [[int(task_id) for task_id in line.split()] for line in f]
+
+
+@pytest.mark.parametrize("num_result_processors", [1, 3])
+def test_every_result_is_handed_off_once(tmp_path, num_result_processors):
+    result_to_file.path = str(tmp_path / "results.txt")
+    batch_to_file.path = str(tmp_path / "batches.txt")
+    flowmanagerMP = FlowManagerMP(EchoJob(), result_to_file, num_workers=2, on_complete_batch=batch_to_file,
+                                  result_batch_size=8, num_result_processors=num_result_processors)
+    assert len(flowmanagerMP.result_processor_processes) == num_result_processors
+    flowmanagerMP.submit_task([{"task_id": i} for i in range(NUM_TASKS)])
+    flowmanagerMP.close_processes()
+
+    with open(result_to_file.path) as f:
+        assert sorted(int(line.split()[0]) for line in f) == list(range(NUM_TASKS))
+    batches = read_batches(batch_to_file.path)
+    assert sorted(task_id for batch in batches for task_id in batch) == list(range(NUM_TASKS))
+    assert max(len(batch) for batch in batches) <= 8
+    assert flowmanagerMP.post_processing_tasks.value == NUM_TASKS
+    assert not any(p.is_alive() for p in flowmanagerMP.result_processor_processes)
+
+
+@pytest.mark.parametrize("num_result_processors", [2, 3])
+def test_async_results_are_spread_over_the_result_processors(tmp_path, num_result_processors):
+    result_to_file.path = str(tmp_path / "results.txt")
+    num_tasks = 2 * num_result_processors
+    flowmanagerMP = FlowManagerMP(EchoJob(), slow_async_result_to_file, on_complete_concurrency=1,
+                                  num_result_processors=num_result_processors)
+    flowmanagerMP.submit_task([{"task_id": i} for i in range(num_tasks)])
+    flowmanagerMP.close_processes()
+
+    with open(result_to_file.path) as f:
+        lines = [line.split() for line in f]
+    assert sorted(int(task_id) for task_id, _ in lines) == list(range(num_tasks))
+    # Each processor takes a result only once it has handed off the last, so they share the results evenly
+    assert len({pid for _, pid in lines}) == num_result_processors
+    assert flowmanagerMP.post_processing_tasks.per_worker[:] == [2] * num_result_processors
+
+
+def test_partial_batch_is_handed_off_after_linger(tmp_path):
+    batch_to_file.path = str(tmp_path / "batches.txt")
+    flowmanagerMP = FlowManagerMP(EchoJob(), on_complete_batch=batch_to_file,
+                                  result_batch_size=100, result_batch_linger=0.05)
+    try:
+        flowmanagerMP.submit_task([{"task_id": i} for i in range(3)])
+        deadline = time.time() + 10
+        while not os.path.exists(batch_to_file.path) and time.time() < deadline:
+            time.sleep(0.01)
+        assert read_batches(batch_to_file.path) == [[0, 1, 2]]
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_serial_processing_batches_results():
+    results = []
+    batches = []
+    flowmanagerMP = FlowManagerMP(EchoJob(), results.append, serial_processing=True,
+                                  on_complete_batch=batches.append, result_batch_size=8)
+    flowmanagerMP.submit_task([{"task_id": -1}] + [{"task_id": i} for i in range(NUM_TASKS)])
+    flowmanagerMP.close_processes()
+
+    assert len(results) == NUM_TASKS + 1
+    assert sorted(r["task_id"] for batch in batches for r in batch) == list(range(-1, NUM_TASKS))
+    assert max(len(batch) for batch in batches) <= 8
+
+
+def test_failing_batch_does_not_stop_the_others(tmp_path):
+    batch_to_file.path = str(tmp_path / "batches.txt")
+    flowmanagerMP = FlowManagerMP(EchoJob(), on_complete_batch=batch_to_file, result_batch_size=1)
+    flowmanagerMP.submit_task([{"task_id": i} for i in range(-1, 5)])
+    flowmanagerMP.close_processes()
+
+    assert sorted(task_id for batch in read_batches(batch_to_file.path) for task_id in batch) == list(range(5))
+
+
+def test_invalid_result_options():
+    with pytest.raises(ValueError, match="num_result_processors"):
+        FlowManagerMP(EchoJob(), num_result_processors=0)
+    with pytest.raises(ValueError, match="result_batch_size"):
+        FlowManagerMP(EchoJob(), result_batch_size=0)
+    with pytest.raises(ValueError, match="result_batch_linger"):
+        FlowManagerMP(EchoJob(), result_batch_linger=0)
+
+
+def test_async_on_complete_with_batches(tmp_path):
+    result_to_file.path = str(tmp_path / "results.txt")
+    batch_to_file.path = str(tmp_path / "batches.txt")
+    flowmanagerMP = FlowManagerMP(EchoJob(), async_result_to_file, on_complete_batch=batch_to_file,
+                                  result_batch_size=8, num_result_processors=2)
+    flowmanagerMP.submit_task([{"task_id": i} for i in range(NUM_TASKS)])
+    flowmanagerMP.close_processes()
+
+    with open(result_to_file.path) as f:
+        assert sorted(int(line.split()[0]) for line in f) == list(range(NUM_TASKS))
+    assert sorted(task_id for batch in read_batches(batch_to_file.path) for task_id in batch) == list(range(NUM_TASKS))
@@ -0,0 +1,71 @@
+"""
+    Tests FlowManagerMP sending tasks to its workers in batches:
+        - full batches, partial batches sent after the linger time and batches left at shutdown all run
+        - a list of tasks is sent without waiting for the linger time
+        - task_batch_size=1 sends every task on its own
+"""
+
+import time
+
+import pytest
+
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC
+
+
+class EchoJob(JobABC):
+    def __init__(self):
+        super().__init__("Echo Job")
+
+    async def run(self, task) -> dict:
+        return {"task_id": task["task_id"]}
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.mark.parametrize("task_batch_size", [1, 7, 100])
+def test_every_task_runs_with_each_batch_size(task_batch_size):
+    results = []
+    flowmanagerMP = FlowManagerMP(EchoJob(), results.append, serial_processing=True, num_workers=2,
+                                  task_batch_size=task_batch_size)
+    for i in range(50):
+        flowmanagerMP.submit_task({"task_id": i})
+    flowmanagerMP.close_processes()
+
+    assert sorted(r["task_id"] for r in results) == list(range(50))
+    assert flowmanagerMP.tasks_submitted.value == 50
+    assert flowmanagerMP.tasks_completed.value == 50
+
+
+def test_partial_batch_is_sent_after_linger():
+    flowmanagerMP = FlowManagerMP(EchoJob(), task_batch_size=100, task_batch_linger=0.01)
+    try:
+        flowmanagerMP.submit_task({"task_id": 0})
+        assert wait_for(lambda: flowmanagerMP.tasks_completed.value == 1)
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_task_list_is_sent_without_linger():
+    # A linger far longer than the wait below, so only the flush at the end of the list can send the tasks
+    flowmanagerMP = FlowManagerMP(EchoJob(), task_batch_size=100, task_batch_linger=60)
+    try:
+        flowmanagerMP.submit_task([{"task_id": i} for i in range(10)])
+        assert flowmanagerMP.tasks_submitted.value == 10
+        assert wait_for(lambda: flowmanagerMP.tasks_completed.value == 10)
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_invalid_batch_options():
+    with pytest.raises(ValueError, match="task_batch_size"):
+        FlowManagerMP(EchoJob(), task_batch_size=0)
+    with pytest.raises(ValueError, match="task_batch_linger"):
+        FlowManagerMP(EchoJob(), task_batch_linger=0)
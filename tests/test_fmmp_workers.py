@@ -0,0 +1,206 @@
+"""
+    Tests FlowManagerMP with several job executor processes:
+        - tasks are spread over the workers by each routing mode
+        - the per worker counters add up to the totals
+        - results from every worker reach on_complete before shutdown completes
+"""
+
+import multiprocessing as mp
+import os
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC
+from flow4ai.job_loader import ConfigLoader
+
+NUM_WORKERS = 3
+NUM_TASKS = 30
+
+
+class PidJob(JobABC):
+    """Returns the pid of the worker that ran the task, fails tasks marked fail."""
+
+    def __init__(self):
+        super().__init__("Pid Job")
+
+    async def run(self, task) -> dict:
+        if task.get("fail"):
+            raise ValueError(f"Task {task['task_id']} failed on purpose")
+        return {"task_id": task["task_id"], "user": task.get("user"), "pid": os.getpid()}
+
+
+def result_to_file(result):
+    """Module level on_complete, so it can be pickled to the result processor."""
+    with open(result_to_file.path, "a") as f:
+        f.write(f"{result['task_id']}\n")
+
+
+def result_to_devnull(result):
+    """Module level on_complete that drops the result."""
+
+
+def run_tasks(tasks, **kwargs):
+    results = []
+    flowmanagerMP = FlowManagerMP(PidJob(), results.append, serial_processing=True,
+                                  num_workers=NUM_WORKERS, **kwargs)
+    for task in tasks:
+        flowmanagerMP.submit_task(task)
+    flowmanagerMP.close_processes()
+    return flowmanagerMP, results
+
+
+@pytest.mark.parametrize("routing", FlowManagerMP.ROUTINGS)
+def test_all_tasks_complete_with_each_routing(routing):
+    tasks = [{"task_id": i, "user": f"user_{i % 5}"} for i in range(NUM_TASKS)]
+    flowmanagerMP, results = run_tasks(tasks, routing=routing, routing_key="user")
+
+    assert sorted(r["task_id"] for r in results) == list(range(NUM_TASKS))
+    assert flowmanagerMP.tasks_completed.value == NUM_TASKS
+    assert sum(flowmanagerMP.tasks_completed.per_worker[:]) == NUM_TASKS
+    assert flowmanagerMP.job_errors.value == 0
+
+
+def test_round_robin_uses_every_worker():
+    tasks = [{"task_id": i} for i in range(NUM_TASKS)]
+    flowmanagerMP, results = run_tasks(tasks, routing=FlowManagerMP.ROUTING_ROUND_ROBIN)
+
+    assert flowmanagerMP.tasks_completed.per_worker[:] == [NUM_TASKS // NUM_WORKERS] * NUM_WORKERS
+    assert len({r["pid"] for r in results}) == NUM_WORKERS
+
+
+class YieldingRoundRobinFlowManagerMP(FlowManagerMP):
+    """Yields to the other submitting threads in the middle of every round robin step, and records
+    the worker each task is routed to, in routing order."""
+
+    def __init__(self, *args, **kwargs):
+        self.routed = []
+        super().__init__(*args, **kwargs)
+
+    @property
+    def _next_worker(self):
+        value = self.__dict__["_next_worker"]
+        time.sleep(0.0001)
+        return value
+
+    @_next_worker.setter
+    def _next_worker(self, value):
+        self.__dict__["_next_worker"] = value
+
+    def _route_task(self, task):
+        worker_index = super()._route_task(task)
+        self.routed.append(worker_index)
+        return worker_index
+
+
+def test_round_robin_from_concurrent_submitters():
+    num_threads, tasks_per_thread = 4, 60
+    results = []
+    flowmanagerMP = YieldingRoundRobinFlowManagerMP(PidJob(), results.append, serial_processing=True,
+                                                    num_workers=NUM_WORKERS, routing=FlowManagerMP.ROUTING_ROUND_ROBIN)
+
+    def submit(thread_index):
+        for i in range(tasks_per_thread):
+            flowmanagerMP.submit_task({"task_id": thread_index * tasks_per_thread + i})
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    flowmanagerMP.close_processes()
+
+    num_tasks = num_threads * tasks_per_thread
+    assert len(results) == num_tasks
+    assert flowmanagerMP.routed == [i % NUM_WORKERS for i in range(num_tasks)]
+    assert flowmanagerMP._tasks_routed == [num_tasks // NUM_WORKERS] * NUM_WORKERS
+
+
+def test_key_hash_sends_a_key_to_one_worker():
+    tasks = [{"task_id": i, "user": f"user_{i % 5}"} for i in range(NUM_TASKS)]
+    _, results = run_tasks(tasks, routing=FlowManagerMP.ROUTING_KEY_HASH, routing_key="user")
+
+    pids_by_user = defaultdict(set)
+    for result in results:
+        pids_by_user[result["user"]].add(result["pid"])
+    assert all(len(pids) == 1 for pids in pids_by_user.values())
+
+
+def test_errors_are_counted_across_workers():
+    tasks = [{"task_id": i, "fail": i % 3 == 0} for i in range(NUM_TASKS)]
+    flowmanagerMP = FlowManagerMP(PidJob(), num_workers=NUM_WORKERS)
+    for task in tasks:
+        flowmanagerMP.submit_task(task)
+    with pytest.raises(RuntimeError, match="10 error"):
+        flowmanagerMP.close_processes()
+
+    assert flowmanagerMP.job_errors.value == NUM_TASKS // 3
+    assert flowmanagerMP.tasks_completed.value == NUM_TASKS - NUM_TASKS // 3
+
+
+def test_result_processor_waits_for_every_worker(tmp_path):
+    result_to_file.path = str(tmp_path / "results.txt")
+    flowmanagerMP = FlowManagerMP(PidJob(), result_to_file, num_workers=NUM_WORKERS)
+    for i in range(NUM_TASKS):
+        flowmanagerMP.submit_task({"task_id": i})
+    flowmanagerMP.close_processes()
+
+    with open(result_to_file.path) as f:
+        assert sorted(int(line) for line in f) == list(range(NUM_TASKS))
+    assert flowmanagerMP.post_processing_tasks.value == NUM_TASKS
+
+
+def test_stats_snapshots_are_consistent():
+    flowmanagerMP = FlowManagerMP(PidJob(), result_to_devnull, num_workers=NUM_WORKERS)
+    for i in range(NUM_TASKS):
+        flowmanagerMP.submit_task({"task_id": i, "fail": i % 10 == 0})
+        stats = flowmanagerMP.get_stats()
+        assert stats["submitted"] >= stats["in_progress"] >= stats["completed"] + stats["errors"]
+        assert stats["completed"] + stats["errors"] >= stats["post_processing"]
+    with pytest.raises(RuntimeError):
+        flowmanagerMP.close_processes()
+
+    assert flowmanagerMP.get_stats() == {"submitted": NUM_TASKS, "in_progress": NUM_TASKS,
+                                         "completed": NUM_TASKS - 3, "errors": 3, "post_processing": NUM_TASKS,
+                                         "throttled_workers": 0, "admission_windows": [None] * NUM_WORKERS}
+
+
+def test_invalid_worker_options():
+    with pytest.raises(ValueError, match="num_workers"):
+        FlowManagerMP(PidJob(), num_workers=0)
+    with pytest.raises(ValueError, match="Invalid routing"):
+        FlowManagerMP(PidJob(), routing="random")
+
+
+def test_job_names_are_a_local_snapshot():
+    flowmanagerMP = FlowManagerMP(PidJob(), num_workers=NUM_WORKERS)
+    try:
+        # Only the job executors run, no manager server process
+        assert sorted(p.name for p in mp.active_children()) == sorted(p.name for p in flowmanagerMP.job_executor_processes)
+        assert len(flowmanagerMP.get_fq_names()) == 1
+        assert flowmanagerMP._fq_name_map_version == 1
+        with pytest.raises(TypeError):
+            flowmanagerMP._fq_name_map["other"] = "other"
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_jobs_loaded_from_config_by_every_worker():
+    ConfigLoader._set_directories([os.path.join(os.path.dirname(__file__), "test_configs/test_concurrency_by_returns")])
+    results = []
+    flowmanagerMP = FlowManagerMP(on_complete=results.append, serial_processing=True, num_workers=NUM_WORKERS)
+    fq_names = flowmanagerMP.get_fq_names()
+
+    # Every worker has loaded its jobs by the time the job names are available
+    assert flowmanagerMP._workers_loaded.value == NUM_WORKERS
+    # Worker 0 sent the job names back once
+    assert flowmanagerMP._fq_name_map_version == 1
+    for fq_name in fq_names:
+        for _ in range(NUM_WORKERS):
+            flowmanagerMP.submit_task({"task": "Test task"}, fq_name=fq_name)
+    flowmanagerMP.close_processes()
+
+    assert len(results) == len(fq_names) * NUM_WORKERS
@@ -2,6 +2,8 @@ import asyncio
 import time
 from typing import Any, Dict
 
+import pytest
+
 from flow4ai.flowmanagerMP import FlowManagerMP
 from flow4ai.job import JobABC, Task, job_graph_context_manager
 from flow4ai.job_loader import JobFactory
@@ -178,8 +180,7 @@ graph_definition_complex = {
 
 async def execute_graph(graph_definition: dict, jobs: dict, data: dict) -> Any:
     head_job = JobFactory.create_job_graph(graph_definition, jobs)
-    job_set = JobABC.job_set(head_job)
-    async with job_graph_context_manager(job_set):
+    async with job_graph_context_manager():
         final_result = await head_job._execute(Task(data))
     return final_result
 
@@ -442,3 +443,127 @@ def test_execute_multiple_head_nodes():
     
     # Verify the RETURN_JOB is D
     assert final_result['RETURN_JOB'] == 'D'
+
+
+def test_create_job_graph_compiles_plan():
+    """
+    Test that create_job_graph compiles the graph into a flat ExecutionPlan with the head
+    job as node 0, predecessor counts matching expected_inputs and successors in topological order.
+    """
+    head_job = JobFactory.create_job_graph(graph_definition_complex, jobs)
+    plan = head_job.plan
+
+    assert plan is not None
+    assert len(plan) == 10
+    assert plan.names[plan.head_id] == 'A'
+    assert [plan.names[tail_id] for tail_id in plan.tail_ids] == ['J']
+    for node_id, job in enumerate(plan.jobs):
+        assert plan.index[job.name] == node_id
+        assert plan.pred_counts[node_id] == len(job.expected_inputs)
+        assert [plan.names[next_id] for next_id in plan.successors[node_id]] == [j.name for j in job.next_jobs]
+        # every edge points forward in the topological order
+        assert all(next_id > node_id for next_id in plan.successors[node_id])
+
+
+def test_compile_plan_rejects_cycle():
+    """Test that compiling a graph containing a cycle raises a ValueError."""
+    a, b, c = A('A'), B('B'), C('C')
+    a.next_jobs = [b]
+    b.next_jobs = [c]
+    c.next_jobs = [b]
+    with pytest.raises(ValueError, match="cycle"):
+        a.compile_plan()
+
+
+def test_plan_job_set_matches_job_set():
+    """Test that the job set cached in the plan matches JobABC.job_set and can create a job graph context."""
+    head_job = JobFactory.create_job_graph(graph_definition_complex, jobs)
+    plan = head_job.get_plan()
+    assert plan is head_job.get_plan(), "get_plan should return the cached plan"
+    assert plan.job_set == JobABC.job_set(head_job)
+
+    async def run_with_plan():
+        async with job_graph_context_manager():
+            return await head_job._execute(Task(data))
+
+    final_result = asyncio.run(run_with_plan())
+    assert final_result['RETURN_JOB'] == 'J'
+
+
+def test_job_states_are_recycled_between_tasks():
+    """Test that the JobStates used by a task are reset and returned to the plan's pool for the next task."""
+    head_job = JobFactory.create_job_graph(graph_definition_complex, jobs)
+    plan = head_job.get_plan()
+    plan.state_pool.clear()
+
+    async def run_with_plan():
+        async with job_graph_context_manager():
+            return await head_job._execute(Task(data))
+
+    first_result = asyncio.run(run_with_plan())
+    assert len(plan.state_pool) == 1
+    states = plan.state_pool[0]
+    assert len(states) == len(plan)
+    assert all(not state.inputs for state in states)
+
+    second_result = asyncio.run(run_with_plan())
+    assert len(plan.state_pool) == 1
+    assert plan.state_pool[0] is states, "the pooled JobStates should be reused"
+    assert second_result['RETURN_JOB'] == first_result['RETURN_JOB'] == 'J'
+
+
+class SleepJob(JobABC):
+  async def run(self, task: Dict[str, Any]) -> Any:
+    await asyncio.sleep(self.properties.get("sleep", 0))
+    return {}
+
+
+def test_join_timeout_raises_timeout():
+    """Test that a join waiting for its inputs for longer than its timeout cancels the task with a TimeoutError naming the join."""
+    sleep_jobs = {
+        'head': SleepJob('head'),
+        'slow': SleepJob('slow', {"sleep": 5}),
+        'fast': SleepJob('fast'),
+        'join': SleepJob('join')
+    }
+    head_job = JobFactory.create_job_graph({
+        'head': {'next': ['slow', 'fast']},
+        'slow': {'next': ['join']},
+        'fast': {'next': ['join']},
+        'join': {'next': []}
+    }, sleep_jobs)
+    sleep_jobs['join'].timeout = 0.1
+
+    async def run_with_plan():
+        async with job_graph_context_manager():
+            return await head_job._execute(Task({}))
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError, match="inputs in join"):
+        asyncio.run(run_with_plan())
+    assert time.perf_counter() - start < 2
+
+
+def test_join_timeout_does_not_bound_running_jobs():
+    """Test that timeouts only bound waiting for inputs, not jobs that run for longer."""
+    sleep_jobs = {
+        'head': SleepJob('head'),
+        'slow': SleepJob('slow', {"sleep": 0.3}),
+        'fast': SleepJob('fast'),
+        'join': SleepJob('join', {"sleep": 0.3})
+    }
+    head_job = JobFactory.create_job_graph({
+        'head': {'next': ['slow', 'fast']},
+        'slow': {'next': ['join']},
+        'fast': {'next': ['join']},
+        'join': {'next': []}
+    }, sleep_jobs)
+    for job in sleep_jobs.values():
+        job.timeout = 0.5
+
+    async def run_with_plan():
+        async with job_graph_context_manager():
+            return await head_job._execute(Task({}))
+
+    result = asyncio.run(run_with_plan())
+    assert result['RETURN_JOB'] == 'join'
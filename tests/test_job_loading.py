@@ -320,8 +320,7 @@ async def test_job_execution_graph(caplog):
     head_job = [job for job in head_jobs if 'four_stage_parameterized$$params1$$read_file$$' in job.name][0]
 
     # Execute the head job
-    job_set = JobABC.job_set(head_job)
-    async with job_graph_context_manager(job_set):
+    async with job_graph_context_manager():
         await asyncio.create_task(head_job._execute(Task({"task": "Test task"})))
 
     # Expected job names in the graph
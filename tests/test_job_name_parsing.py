@@ -67,3 +67,25 @@ def test_parse_job_loader_name():
         result = JobABC.parse_job_loader_name(invalid_case)
         assert result == {"parsing_message": "UNSUPPORTED NAME FORMAT"}, f"Failed for case: {invalid_case}"
 
+
+
+class NamedJob(JobABC):
+    async def run(self, task):
+        return {}
+
+
+def test_parsed_name_is_cached_until_renamed():
+    job = NamedJob("four_stage_parameterized$$params1$$read_file$$")
+    assert job.graph_name == "four_stage_parameterized"
+    assert job.param_name == "params1"
+    assert job.short_job_name == "read_file"
+    assert job._get_parsed_name() is job._get_parsed_name(), "the parsed name should be cached"
+
+    job.name = "three_stage_reasoning$$$$ask_llm_reasoning$$"
+    assert job.graph_name == "three_stage_reasoning"
+    assert job.param_name == ""
+    assert job.short_job_name == "ask_llm_reasoning"
+    assert vars(job)["name"] == "three_stage_reasoning$$$$ask_llm_reasoning$$"
+
+    job.name = "invalid_name"
+    assert job.short_job_name == "UNSUPPORTED NAME FORMAT"
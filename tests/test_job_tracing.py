@@ -1,4 +1,5 @@
 import inspect
+import os
 from typing import Any, Dict
 
 from flow4ai.job import JobABC, _has_own_traced_execute, _is_traced
@@ -254,3 +255,50 @@ def test_execute_no_trace_matches_original():
     # The source code should contain key implementation details
     assert "async def" in execute_source
     assert "_execute(self, task" in execute_source  # More flexible check that works with type hints
+
+
+def test_trace_modes_install_and_remove_wrapper():
+    """Test that the tracing wrapper is only installed in the full tracing mode and sampling picks 1 in N tasks."""
+    import pytest
+
+    from flow4ai.utils.otel_wrapper import (get_trace_mode,
+                                            get_trace_sample_rate,
+                                            sample_trace, set_trace_mode)
+
+    assert get_trace_mode() == "full"
+    saved_sample_rate = get_trace_sample_rate()
+    try:
+        set_trace_mode("off")
+        assert not _is_traced(JobABC._execute), "no wrapper should be installed when tracing is off"
+        assert JobABC._execute is JobABC.executeNoTrace
+        assert not any(sample_trace() for _ in range(10))
+
+        set_trace_mode("sampled", sample_rate=5)
+        assert JobABC._execute is JobABC.executeNoTrace
+        assert sum(sample_trace() for _ in range(50)) == 10
+
+        with pytest.raises(ValueError, match="Unsupported trace mode"):
+            set_trace_mode("verbose")
+        with pytest.raises(ValueError, match="sample rate"):
+            set_trace_mode("sampled", sample_rate=0)
+    finally:
+        set_trace_mode("full", sample_rate=saved_sample_rate)
+    assert _has_own_traced_execute(JobABC)
+    assert sample_trace()
+    assert get_trace_sample_rate() == saved_sample_rate
+
+
+def test_invalid_trace_mode_environment_falls_back_to_full():
+    """Test that a bad FLOW4AI_TRACE_MODE or FLOW4AI_TRACE_SAMPLE_RATE doesn't stop flow4ai from being imported."""
+    import subprocess
+    import sys
+
+    code = ("from flow4ai.utils.otel_wrapper import get_trace_mode, get_trace_sample_rate; "
+            "import flow4ai.job; print(get_trace_mode(), get_trace_sample_rate())")
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    for mode, rate, expected in [("Full", "100", "full 100"), ("verbose", "ten", "full 100"), ("SAMPLED", "7", "sampled 7")]:
+        env = dict(os.environ, FLOW4AI_TRACE_MODE=mode, FLOW4AI_TRACE_SAMPLE_RATE=rate,
+                   PYTHONPATH=os.pathsep.join([src_dir, os.environ.get("PYTHONPATH", "")]))
+        completed = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.split("\n")[-2] == expected
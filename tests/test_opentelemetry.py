@@ -239,16 +239,15 @@ def test_job_metaclass_tracing(trace_file, setup_file_exporter):
             task_data = task['task'] if isinstance(task, dict) else task
             return {"result": task_data}
             
-    async def run_job(job_set):
-        async with job_graph_context_manager(job_set):
+    async def run_job():
+        async with job_graph_context_manager():
             result = await job._execute(task)
             return result
     # Create and execute job
     job = TestJob("test")
     task = Task({"task": "test task"}, job.name)
-    job_set = JobABC.job_set(job)
 
-    result = asyncio.run(run_job(job_set))
+    result = asyncio.run(run_job())
     # Extract just the result field for comparison
     result_data = result.get("result") if isinstance(result, dict) else result
     assert result_data == "test task"
@@ -0,0 +1,1133 @@
+"""
+Microbenchmarks for the per-task overhead of the job graph execution machinery.
+
+These are skipped by default, run them with:
+
+    python3 -m pytest tests/test_perf_benchmarks.py -s --full-suite
+
+Each benchmark measures the old and the new way of doing the same piece of work
+side by side and prints the cost per task, so results are comparable on any machine.
+"""
+import asyncio
+import time
+import tracemalloc
+from typing import Any, Dict
+
+import pytest
+
+from flow4ai.job import (JobABC, JobState, Task, _acquire_job_states,
+                         _release_job_states, job_graph_context_manager)
+from flow4ai.job_loader import JobFactory
+from flow4ai.result_view import ResultView
+
+ITERATIONS = 2000
+
+
+class NoOpJob(JobABC):
+    async def run(self, task) -> Dict[str, Any]:
+        return {}
+
+
+def create_diamond_graph(num_diamonds: int) -> JobABC:
+    """
+    Create a graph of num_diamonds stacked diamonds, each head fanning out to two jobs
+    which join again, so the number of distinct paths doubles with every diamond:
+
+        J0 -> (L0, R0) -> J1 -> (L1, R1) -> J2 ...
+    """
+    graph_definition = {}
+    for i in range(num_diamonds):
+        graph_definition[f"J{i}"] = {"next": [f"L{i}", f"R{i}"]}
+        graph_definition[f"L{i}"] = {"next": [f"J{i + 1}"]}
+        graph_definition[f"R{i}"] = {"next": [f"J{i + 1}"]}
+    graph_definition[f"J{num_diamonds}"] = {"next": []}
+    jobs = {name: NoOpJob(name) for name in graph_definition}
+    return JobFactory.create_job_graph(graph_definition, jobs)
+
+
+def recursive_job_set(job) -> set:
+    """The job set traversal used before job sets were cached, which revisits shared sub-graphs."""
+    result = {job}
+    for next_job in job.next_jobs:
+        result.update(recursive_job_set(next_job))
+    return result
+
+
+def report(title: str, before: float, after: float) -> None:
+    print(f"\n{title}")
+    print(f"  before: {before * 1e6:10.2f} us/task")
+    print(f"  after:  {after * 1e6:10.2f} us/task")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+def time_per_task(fn, iterations: int = ITERATIONS) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def test_job_set_cache_benchmark():
+    """Per-task cost of getting the job set and creating the job graph context, recursive versus cached."""
+    head_job = create_diamond_graph(10)
+
+    async def create_context(get_job_set):
+        get_job_set()
+        async with job_graph_context_manager():
+            pass
+
+    loop = asyncio.new_event_loop()
+    try:
+        before = time_per_task(lambda: loop.run_until_complete(create_context(lambda: recursive_job_set(head_job))), 200)
+        after = time_per_task(lambda: loop.run_until_complete(create_context(lambda: head_job.get_plan().job_set)), 200)
+    finally:
+        loop.close()
+
+    report("job set + JobState creation per task, 10 stacked diamonds", before, after)
+    assert recursive_job_set(head_job) == head_job.get_plan().job_set
+    assert after < before
+
+
+def bytes_allocated_per_task(fn, iterations: int = ITERATIONS) -> float:
+    """Peak bytes traced by tracemalloc while running fn once, averaged over iterations."""
+    fn()  # warm up any caches and pools first
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - start
+    finally:
+        tracemalloc.stop()
+    return total / iterations
+
+
+def test_job_state_pool_allocation_benchmark():
+    """Bytes allocated per task for the JobStates of a graph, created per task versus recycled from the pool."""
+    head_job = create_diamond_graph(10)
+    plan = head_job.get_plan()
+
+    def create_states():
+        states = {name: JobState() for name in plan.names}
+        states[plan.names[0]].inputs['task'] = {}
+
+    def recycle_states():
+        states = _acquire_job_states(plan)
+        states[plan.head_id].inputs['task'] = {}
+        _release_job_states(plan, states)
+
+    before = bytes_allocated_per_task(create_states)
+    after = bytes_allocated_per_task(recycle_states)
+    print("\nJobState allocation per task, 10 stacked diamonds")
+    print(f"  before: {before:10.0f} bytes/task")
+    print(f"  after:  {after:10.0f} bytes/task")
+    assert after < before
+
+    async def execute():
+        async with job_graph_context_manager():
+            await head_job._execute(Task({}))
+
+    loop = asyncio.new_event_loop()
+    try:
+        per_task = bytes_allocated_per_task(lambda: loop.run_until_complete(execute()), 200)
+    finally:
+        loop.close()
+    print(f"  whole task through _execute: {per_task:10.0f} bytes/task")
+
+
+async def baseline_execute(job: JobABC, task, states: Dict[str, Any]):
+    """The recursive _execute used before execution plans: every job with inputs waits on its own
+    Event with asyncio.wait_for, each predecessor copies its result into the inputs of each next
+    job and sets the event of a next job with all its inputs, and ready next jobs are gathered."""
+    state = states[job.name]
+    if job.expected_inputs:
+        if state["started"]:
+            return None
+        state["started"] = True
+        await asyncio.wait_for(state["event"].wait(), job.timeout)
+    result = await job.run(task)
+    if not isinstance(result, dict):
+        result = {'result': result}
+    state["inputs"].clear()
+    state["event"].clear()
+    state["started"] = False
+    result[JobABC.RETURN_JOB] = job.name
+    if not job.next_jobs:
+        return result
+    executing_jobs = []
+    for next_job in job.next_jobs:
+        next_state = states[next_job.name]
+        next_state["inputs"][job.name] = result.copy()
+        if next_job.expected_inputs.issubset(next_state["inputs"].keys()):
+            next_state["event"].set()
+            executing_jobs.append(baseline_execute(next_job, task, states))
+    if executing_jobs:
+        child_results = await asyncio.gather(*executing_jobs)
+        not_none_results = [r for r in child_results if r is not None]
+        if not_none_results:
+            return not_none_results[0]
+    return None
+
+
+def test_fan_in_readiness_benchmark():
+    """Per-task cost of running 10 stacked fan-outs of 50 jobs, each joined again, through _execute,
+    the baseline Event and wait_for per join with a gather per fan-out versus the plan's
+    remaining-inputs counters with joins started by their last input."""
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    width, joins = 50, 10
+    graph_definition = {}
+    for j in range(joins):
+        graph_definition[f"J{j}"] = {"next": [f"M{j}_{i}" for i in range(width)]}
+        graph_definition.update({f"M{j}_{i}": {"next": [f"J{j + 1}"]} for i in range(width)})
+    graph_definition[f"J{joins}"] = {"next": []}
+    jobs = {name: NoOpJob(name) for name in graph_definition}
+    head_job = JobFactory.create_job_graph(graph_definition, jobs)
+    plan = head_job.get_plan()
+
+    async def execute_baseline():
+        states = {name: {"inputs": {}, "event": asyncio.Event(), "started": False} for name in jobs}
+        result = await baseline_execute(head_job, Task({}), states)
+        assert result[JobABC.RETURN_JOB] == f"J{joins}"
+
+    async def execute():
+        async with job_graph_context_manager():
+            result = await head_job._execute(Task({}))
+        assert result[JobABC.RETURN_JOB] == f"J{joins}"
+
+    # Spans would cost more than the scheduling being measured, and the baseline has none
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    loop = asyncio.new_event_loop()
+    try:
+        before = time_per_task(lambda: loop.run_until_complete(execute_baseline()), 200)
+        after = time_per_task(lambda: loop.run_until_complete(execute()), 200)
+    finally:
+        set_trace_mode(saved_trace_mode)
+        loop.close()
+
+    report(f"{joins} stacked fan-outs of {width} jobs joined again, {len(plan)} jobs per task", before, after)
+    assert after < before
+
+
+LARGE_RESULT = {f"chunk_{i}": "x" * 100 for i in range(1000)}
+
+
+class LargeResultJob(JobABC):
+    async def run(self, task) -> Dict[str, Any]:
+        return LARGE_RESULT
+
+
+class ReadInputsJob(JobABC):
+    async def run(self, task) -> Dict[str, Any]:
+        return {"keys": sum(len(value) for value in self.get_inputs().values())}
+
+
+def read_head_input(j_ctx):
+    return {"keys": len(j_ctx["inputs"]["head"])}
+
+
+def WrappedReadInputsJob(name):
+    from flow4ai.jobs.wrapping_job import WrappingJob
+    return WrappingJob(read_head_input, name)
+
+
+class CopiedResult(ResultView):
+    """Stands in for ResultView to give every next job its own shallow copy, as before views."""
+
+    def __new__(cls, data):
+        return dict(data)
+
+
+def test_result_propagation_benchmark(monkeypatch):
+    """Per-task cost of running a fan-out of a large result to 50 next jobs through _execute,
+    a copy of the result per next job versus a shared view, with next jobs that ignore their
+    inputs, next jobs that read them through get_inputs, and wrapped functions that read them
+    from j_ctx."""
+    import flow4ai.job
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    width = 50
+
+    def create_fan_out(next_job_class) -> JobABC:
+        names = {name: JobABC.create_FQName("bench", "", name) for name in ["head"] + [f"next_{i}" for i in range(width)]}
+        graph_definition = {names["head"]: {"next": [names[f"next_{i}"] for i in range(width)]}}
+        graph_definition.update({names[f"next_{i}"]: {"next": []} for i in range(width)})
+        jobs = {names["head"]: LargeResultJob(names["head"])}
+        jobs.update({names[f"next_{i}"]: next_job_class(names[f"next_{i}"]) for i in range(width)})
+        return JobFactory.create_job_graph(graph_definition, jobs)
+
+    # Spans would cost more than the propagation being measured
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    loop = asyncio.new_event_loop()
+    try:
+        for next_job_class, label in [(NoOpJob, "ignore"), (ReadInputsJob, "read"),
+                                      (WrappedReadInputsJob, "are wrapped functions that read")]:
+            head_job = create_fan_out(next_job_class)
+            plan = head_job.get_plan()
+
+            async def execute():
+                async with job_graph_context_manager():
+                    await head_job._execute(Task({}))
+
+            with monkeypatch.context() as patch:
+                patch.setattr(flow4ai.job, "ResultView", CopiedResult)
+                before = time_per_task(lambda: loop.run_until_complete(execute()), 200)
+            after = time_per_task(lambda: loop.run_until_complete(execute()), 200)
+            report(f"fan-out of a 1000 key result to {width} next jobs that {label} their inputs", before, after)
+            assert after < before
+    finally:
+        set_trace_mode(saved_trace_mode)
+        loop.close()
+
+
+def create_baseline_wrapping_job_class():
+    """WrappingJob with the run, _validate_params, _convert_param_types and _execute_callable it
+    had before signatures were compiled at wrap time, each inspecting the signature per call."""
+    import inspect
+
+    from flow4ai.jobs.wrapping_job import WrappingJob
+
+    class BaselineWrappingJob(WrappingJob):
+        async def run(self, task):
+            params = task if task else self.get_task()
+            params = self._process_shorthand_params(params)
+            sig = inspect.signature(self.callable)
+            requires_params = bool(sig.parameters)
+            requires_non_context_params = False
+            if requires_params:
+                non_context_params = [param for param in sig.parameters if param != self.FN_CONTEXT]
+                requires_non_context_params = bool(non_context_params)
+            parsed_name = JobABC.parse_job_name(self.name)
+            short_name = self.name if parsed_name == "UNSUPPORTED NAME FORMAT" else parsed_name
+            if requires_non_context_params and short_name not in params:
+                raise ValueError(f"No parameters found for callable '{short_name}'")
+            if not requires_params or short_name not in params:
+                callable_params = {"args": [], "kwargs": {}}
+            else:
+                callable_params = self._create_callable_params(params[short_name])
+            if self.FN_CONTEXT in sig.parameters:
+                callable_params["kwargs"][self.FN_CONTEXT] = {
+                    "global": self.global_ctx, "task": params, "inputs": self.get_inputs()}
+            self._validate_params(callable_params["args"], callable_params["kwargs"])
+            args, kwargs = self._convert_param_types(callable_params["args"], callable_params["kwargs"])
+            return await self._execute_callable(args, kwargs)
+
+        def _validate_params(self, args, kwargs):
+            sig = inspect.signature(self.callable)
+            try:
+                sig.bind(*args, **kwargs)
+            except TypeError as e:
+                raise ValueError(f"Invalid parameters for {self.name}: {e}")
+
+        def _convert_param_types(self, args, kwargs):
+            sig = inspect.signature(self.callable)
+            converted_args = []
+            for i, arg in enumerate(args):
+                if i >= len(sig.parameters):
+                    converted_args.append(arg)
+                    continue
+                param = sig.parameters[list(sig.parameters.keys())[i]]
+                if param.annotation == inspect.Parameter.empty or not isinstance(param.annotation, type):
+                    converted_args.append(arg)
+                    continue
+                try:
+                    if not isinstance(arg, param.annotation) and arg is not None:
+                        converted_args.append(param.annotation(arg))
+                    else:
+                        converted_args.append(arg)
+                except (ValueError, TypeError):
+                    converted_args.append(arg)
+            converted_kwargs = {}
+            for name, value in kwargs.items():
+                if (name in sig.parameters and
+                        sig.parameters[name].annotation != inspect.Parameter.empty and
+                        isinstance(sig.parameters[name].annotation, type)):
+                    try:
+                        if not isinstance(value, sig.parameters[name].annotation) and value is not None:
+                            converted_kwargs[name] = sig.parameters[name].annotation(value)
+                        else:
+                            converted_kwargs[name] = value
+                    except (ValueError, TypeError):
+                        converted_kwargs[name] = value
+                else:
+                    converted_kwargs[name] = value
+            return converted_args, converted_kwargs
+
+        async def _execute_callable(self, args, kwargs):
+            result = self.callable(*args, **kwargs)
+            if inspect.iscoroutine(result):
+                return await result
+            return result
+
+    return BaselineWrappingJob
+
+
+def test_wrapping_job_signature_cache_benchmark():
+    """Per-task cost of running a tiny wrapped function, with the baseline WrappingJob that inspected
+    its signature on every call versus the signature compiled once at wrap time."""
+    from flow4ai.jobs.wrapping_job import WrappingJob
+
+    def add(x: int, y: int) -> int:
+        return x + y
+
+    task = {"add": {"x": 1, "y": "2"}}
+    baseline_job = create_baseline_wrapping_job_class()(add, "add")
+    job = WrappingJob(add, "add")
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(baseline_job.run(task)) == loop.run_until_complete(job.run(task)) == 3
+        before = time_per_task(lambda: loop.run_until_complete(baseline_job.run(task)))
+        after = time_per_task(lambda: loop.run_until_complete(job.run(task)))
+    finally:
+        loop.close()
+
+    report("WrappingJob.run of a two argument function with type conversion", before, after)
+    assert after < before
+
+
+def test_get_inputs_short_names_benchmark():
+    """Per-call cost of get_inputs on a join with 50 predecessors, parsing every input name versus the plan's short names."""
+    from flow4ai.job import _acquire_job_states, job_graph_context
+
+    width = 50
+    names = {name: JobABC.create_FQName("bench", "", name) for name in
+             ["head", "join"] + [f"mid_{i}" for i in range(width)]}
+    graph_definition = {names["head"]: {"next": [names[f"mid_{i}"] for i in range(width)]}}
+    graph_definition.update({names[f"mid_{i}"]: {"next": [names["join"]]} for i in range(width)})
+    graph_definition[names["join"]] = {"next": []}
+    jobs = {fq_name: NoOpJob(fq_name) for fq_name in names.values()}
+    head_job = JobFactory.create_job_graph(graph_definition, jobs)
+    plan = head_job.get_plan()
+    join_job = jobs[names["join"]]
+
+    async def measure():
+        async with job_graph_context_manager() as graph_context:
+            graph_context.plan = plan
+            graph_context.states = _acquire_job_states(plan)
+            inputs = graph_context.job_state(join_job.name).inputs
+            for i in range(width):
+                inputs[names[f"mid_{i}"]] = {"value": i}
+            before = time_per_task(
+                lambda: {JobABC.parse_job_name(k): v for k, v in join_job._get_long_name_inputs().items()})
+            after = time_per_task(join_job.get_inputs)
+            assert join_job.get_inputs() == {JobABC.parse_job_name(k): v for k, v in inputs.items()}
+            return before, after
+
+    before, after = asyncio.run(measure())
+    report(f"get_inputs on a join of {width} predecessors", before, after)
+    assert after < before
+
+
+def test_trace_mode_benchmark():
+    """Per-job cost of running a graph in each tracing mode, spans are created but not exported."""
+    from opentelemetry.sdk.trace import TracerProvider
+
+    from flow4ai.utils.otel_wrapper import TracerFactory, set_trace_mode
+
+    head_job = create_diamond_graph(10)
+    plan = head_job.get_plan()
+    num_jobs = len(plan)
+
+    async def execute():
+        async with job_graph_context_manager():
+            await head_job._execute(Task({}))
+
+    saved_tracer = TracerFactory._instance
+    TracerFactory._instance = TracerProvider().get_tracer("benchmark")
+    loop = asyncio.new_event_loop()
+    per_job = {}
+    try:
+        for mode in ["full", "sampled", "off"]:
+            set_trace_mode(mode, sample_rate=100)
+            per_job[mode] = time_per_task(lambda: loop.run_until_complete(execute()), 500) / num_jobs
+    finally:
+        set_trace_mode("full")
+        loop.close()
+        TracerFactory._instance = saved_tracer
+
+    print(f"\nper job cost by tracing mode, {num_jobs} jobs per task")
+    for mode, cost in per_job.items():
+        print(f"  {mode:8} {cost * 1e6:10.2f} us/job")
+    assert per_job["off"] < per_job["full"]
+    assert per_job["sampled"] < per_job["full"]
+
+
+class CpuJob(JobABC):
+    """A job that keeps the event loop busy for about a millisecond."""
+
+    async def run(self, task) -> Dict[str, Any]:
+        total = 0
+        for i in range(20000):
+            total += i * i
+        return {"total": total}
+
+
+def discard_result(result):
+    """Module level on_complete, the result processor drains the results so the workers can exit."""
+
+
+def test_fmmp_worker_scaling_benchmark():
+    """Throughput of FlowManagerMP on a CPU-bound job with one job executor process versus several."""
+    import os
+
+    from flow4ai.flowmanagerMP import FlowManagerMP
+
+    num_tasks = 2000
+    num_workers = min(4, os.cpu_count() or 1)
+
+    def tasks_per_second(workers: int) -> float:
+        flowmanagerMP = FlowManagerMP(CpuJob("cpu"), discard_result, num_workers=workers)
+        start = time.perf_counter()
+        for i in range(num_tasks):
+            flowmanagerMP.submit_task({"task_id": i})
+        flowmanagerMP.close_processes(timeout=120)
+        assert flowmanagerMP.tasks_completed.value == num_tasks
+        return num_tasks / (time.perf_counter() - start)
+
+    before = tasks_per_second(1)
+    after = tasks_per_second(num_workers)
+    print(f"\nFlowManagerMP throughput on a CPU-bound job, {num_tasks} tasks")
+    print(f"  1 worker:  {before:10.0f} tasks/s")
+    print(f"  {num_workers} workers: {after:10.0f} tasks/s")
+    print(f"  speedup: {after / before:.1f}x")
+    if num_workers > 1:
+        assert after > before
+
+
+class TinyJob(JobABC):
+    async def run(self, task):
+        return {"task_id": task["task_id"]}
+
+
+def test_fmmp_task_batching_benchmark():
+    """Queue stress: submitting tiny tasks to FlowManagerMP one per queue put versus in batches."""
+    from flow4ai.flowmanagerMP import FlowManagerMP
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 20000
+
+    tasks = [{"task_id": i} for i in range(num_tasks)]
+
+    def tasks_per_second(task_batch_size: int) -> float:
+        flowmanagerMP = FlowManagerMP(TinyJob("tiny"), discard_result, task_batch_size=task_batch_size)
+        start = time.perf_counter()
+        # One submit_task call, so the time is spent on the queue rather than on looking up the graph name
+        flowmanagerMP.submit_task(tasks)
+        flowmanagerMP.close_processes(timeout=120)
+        assert flowmanagerMP.tasks_completed.value == num_tasks
+        return num_tasks / (time.perf_counter() - start)
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        before = tasks_per_second(1)
+        after = tasks_per_second(FlowManagerMP.DEFAULT_TASK_BATCH_SIZE)
+    finally:
+        set_trace_mode(saved_trace_mode)
+    print(f"\nFlowManagerMP throughput on a no-op job, {num_tasks} tasks")
+    print(f"  unbatched:        {before:10.0f} tasks/s")
+    print(f"  batches of {FlowManagerMP.DEFAULT_TASK_BATCH_SIZE}:  {after:10.0f} tasks/s")
+    print(f"  speedup: {after / before:.1f}x")
+    assert after > before
+
+
+class SleepJob(JobABC):
+    async def run(self, task):
+        await asyncio.sleep(0.5)
+        return {"task_id": task["task_id"]}
+
+
+def test_fmmp_idle_worker_cpu_benchmark():
+    """CPU used by an idle FlowManagerMP job executor process, and throughput with many tasks in flight."""
+    psutil = pytest.importorskip("psutil")
+
+    from flow4ai.flowmanagerMP import FlowManagerMP
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        flowmanagerMP = FlowManagerMP(SleepJob("sleep"), discard_result)
+        worker = psutil.Process(flowmanagerMP.job_executor_process.pid)
+        # Let the worker finish loading before measuring
+        time.sleep(0.5)
+        cpu_before = worker.cpu_times()
+        idle_seconds = 2.0
+        time.sleep(idle_seconds)
+        cpu_after = worker.cpu_times()
+        idle_cpu = (cpu_after.user + cpu_after.system - cpu_before.user - cpu_before.system) / idle_seconds
+
+        # Tasks that stay in flight together, so any per-tick cost that grows with the in-flight count shows
+        num_tasks = 10000
+        start = time.perf_counter()
+        flowmanagerMP.submit_task([{"task_id": i} for i in range(num_tasks)])
+        flowmanagerMP.close_processes(timeout=120)
+        elapsed = time.perf_counter() - start
+        assert flowmanagerMP.tasks_completed.value == num_tasks
+    finally:
+        set_trace_mode(saved_trace_mode)
+
+    print(f"\nIdle job executor process: {idle_cpu * 100:.1f}% of a core")
+    print(f"{num_tasks} tasks in flight together: {num_tasks / elapsed:10.0f} tasks/s")
+    assert idle_cpu < 0.02
+
+
+def test_fmmp_submit_rate_benchmark():
+    """submit_task calls per second checking fq_name against the local job name snapshot, versus the
+    Manager dict proxy it replaced, which cost a round trip to the manager process per lookup."""
+    import multiprocessing as mp
+
+    from flow4ai.flowmanagerMP import FlowManagerMP
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 5000
+
+    def submits_per_second(flowmanagerMP: FlowManagerMP) -> float:
+        start = time.perf_counter()
+        for i in range(num_tasks):
+            flowmanagerMP.submit_task({"task_id": i})
+        elapsed = time.perf_counter() - start
+        flowmanagerMP.close_processes(timeout=120)
+        return num_tasks / elapsed
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    manager = mp.Manager()
+    try:
+        flowmanagerMP = FlowManagerMP(TinyJob("tiny"), discard_result)
+        flowmanagerMP._fq_name_map = manager.dict(dict(flowmanagerMP._fq_name_map))
+        before = submits_per_second(flowmanagerMP)
+        after = submits_per_second(FlowManagerMP(TinyJob("tiny"), discard_result))
+    finally:
+        manager.shutdown()
+        set_trace_mode(saved_trace_mode)
+
+    print(f"\nFlowManagerMP submit_task rate, {num_tasks} tasks")
+    print(f"  Manager dict proxy: {before:10.0f} submits/s")
+    print(f"  local snapshot:     {after:10.0f} submits/s")
+    print(f"  speedup: {after / before:.1f}x")
+    assert after > before
+
+
+def test_shared_counter_increment_benchmark():
+    """Cost of counting a task: the lock free per process slot versus an mp.Value behind its lock."""
+    import multiprocessing as mp
+
+    from flow4ai.flowmanagerMP import PerWorkerCounter
+
+    num_increments = 200000
+    locked = mp.Value('i', 0)
+    lock_free = PerWorkerCounter(4)
+
+    def increment_locked():
+        with locked.get_lock():
+            locked.value += 1
+
+    def increment_lock_free():
+        lock_free.increment(2)
+
+    before = time_per_task(increment_locked, num_increments)
+    after = time_per_task(increment_lock_free, num_increments)
+    report("shared counter increment", before, after)
+    assert locked.value == lock_free.value
+    assert after < before
+
+
+def test_fmmp_bounded_memory_benchmark():
+    """Peak memory of the job executor process when far more tasks are submitted than it can run at once,
+    without limits versus with max_in_flight and max_queued."""
+    import threading
+
+    psutil = pytest.importorskip("psutil")
+
+    from flow4ai.flowmanagerMP import FlowManagerMP
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 50000
+
+    def peak_worker_rss(**limits) -> float:
+        flowmanagerMP = FlowManagerMP(TinyJob("tiny"), discard_result, **limits)
+        worker = psutil.Process(flowmanagerMP.job_executor_process.pid)
+        peak = worker.memory_info().rss
+        done = threading.Event()
+
+        def sample():
+            nonlocal peak
+            while not done.wait(0.01):
+                try:
+                    peak = max(peak, worker.memory_info().rss)
+                except psutil.NoSuchProcess:
+                    return
+
+        sampler = threading.Thread(target=sample)
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            flowmanagerMP.submit_task([{"task_id": i} for i in range(num_tasks)])
+            flowmanagerMP.close_processes(timeout=300)
+        finally:
+            done.set()
+            sampler.join()
+        assert flowmanagerMP.tasks_completed.value == num_tasks
+        print(f"  {limits or 'no limits'}: peak worker RSS {peak / 2**20:8.1f} MB, "
+              f"{num_tasks / (time.perf_counter() - start):8.0f} tasks/s")
+        return peak
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        print(f"\nFlowManagerMP job executor memory, {num_tasks} tasks submitted at once")
+        before = peak_worker_rss()
+        after = peak_worker_rss(max_in_flight=500, max_queued=2000)
+    finally:
+        set_trace_mode(saved_trace_mode)
+    assert after < before
+
+
+class MemoryHungryJob(JobABC):
+    """Holds a megabyte for a while, like a job buffering a large response."""
+
+    async def run(self, task):
+        buffer = bytearray(2**20)
+        await asyncio.sleep(0.05)
+        return {"size": len(buffer)}
+
+
+def test_resource_aware_admission_benchmark():
+    """Peak RSS of a FlowManager under a burst of memory hungry tasks, without versus with an RSS limit."""
+    import threading
+
+    from flow4ai.admission import ResourceLimits, sample_process_resources
+    from flow4ai.flowmanager import FlowManager
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 400
+    headroom_mb = 50
+
+    def peak_rss_mb(resource_limits) -> float:
+        fm = FlowManager(MemoryHungryJob("hungry"), resource_limits=resource_limits)
+        peak = sample_process_resources()[0]
+        done = threading.Event()
+
+        def sample():
+            nonlocal peak
+            while not done.wait(0.005):
+                peak = max(peak, sample_process_resources()[0])
+
+        sampler = threading.Thread(target=sample)
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            for i in range(num_tasks):
+                fm.submit_task({"task_id": i})
+            assert fm.wait_for_completion(timeout=60)
+        finally:
+            done.set()
+            sampler.join()
+            fm.close()
+        elapsed = time.perf_counter() - start
+        print(f"  {'RSS limit' if resource_limits else 'no limit '}: peak RSS {peak / 2**20:8.1f} MB, {elapsed:5.2f} s")
+        return peak
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        print(f"\nFlowManager peak RSS, a burst of {num_tasks} tasks holding 1 MB each")
+        limit_mb = sample_process_resources()[0] / 2**20 + headroom_mb
+        # With the limit first, as memory freed by the run without it may not be given back to the OS
+        after = peak_rss_mb(ResourceLimits(max_rss_mb=limit_mb, sample_interval=0.01))
+        before = peak_rss_mb(None)
+    finally:
+        set_trace_mode(saved_trace_mode)
+    assert after < before
+
+
+SINK_LATENCY = 0.01
+
+
+def slow_sink(result):
+    """A result hand-off that waits on a slow service, like an HTTP POST or a database write."""
+    time.sleep(SINK_LATENCY)
+
+
+async def slow_async_sink(result):
+    await asyncio.sleep(SINK_LATENCY)
+
+
+def test_async_on_complete_benchmark():
+    """FlowManagerMP throughput when every result is handed off to a slow sink, one at a time from a plain
+    on_complete versus concurrently from a coroutine on_complete."""
+    from flow4ai.flowmanagerMP import FlowManagerMP
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 500
+    tasks = [{"task_id": i} for i in range(num_tasks)]
+
+    def tasks_per_second(on_complete) -> float:
+        flowmanagerMP = FlowManagerMP(TinyJob("tiny"), on_complete)
+        start = time.perf_counter()
+        flowmanagerMP.submit_task(tasks)
+        flowmanagerMP.close_processes(timeout=120)
+        assert flowmanagerMP.post_processing_tasks.value == num_tasks
+        return num_tasks / (time.perf_counter() - start)
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        before = tasks_per_second(slow_sink)
+        after = tasks_per_second(slow_async_sink)
+    finally:
+        set_trace_mode(saved_trace_mode)
+    print(f"\nFlowManagerMP throughput with a {SINK_LATENCY * 1000:.0f} ms result sink, {num_tasks} tasks")
+    print(f"  plain on_complete:     {before:10.0f} tasks/s")
+    print(f"  coroutine on_complete: {after:10.0f} tasks/s")
+    print(f"  speedup: {after / before:.1f}x")
+    assert after > before
+
+
+def slow_bulk_sink(results):
+    """A bulk hand-off, like a multi-row insert, whose cost is per call rather than per result."""
+    time.sleep(SINK_LATENCY)
+
+
+def test_result_batching_benchmark():
+    """FlowManagerMP throughput with a slow result sink, called per result from one result processor,
+    per result from several result processors, and per batch from on_complete_batch."""
+    from flow4ai.flowmanagerMP import FlowManagerMP
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 500
+    tasks = [{"task_id": i} for i in range(num_tasks)]
+
+    def tasks_per_second(**kwargs) -> float:
+        flowmanagerMP = FlowManagerMP(TinyJob("tiny"), **kwargs)
+        start = time.perf_counter()
+        flowmanagerMP.submit_task(tasks)
+        flowmanagerMP.close_processes(timeout=120)
+        assert flowmanagerMP.post_processing_tasks.value == num_tasks
+        return num_tasks / (time.perf_counter() - start)
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        before = tasks_per_second(on_complete=slow_sink)
+        processors = tasks_per_second(on_complete=slow_sink, num_result_processors=4)
+        batched = tasks_per_second(on_complete_batch=slow_bulk_sink)
+    finally:
+        set_trace_mode(saved_trace_mode)
+    print(f"\nFlowManagerMP throughput with a {SINK_LATENCY * 1000:.0f} ms result sink, {num_tasks} tasks")
+    print(f"  on_complete, 1 result processor:  {before:10.0f} tasks/s")
+    print(f"  on_complete, 4 result processors: {processors:10.0f} tasks/s")
+    print(f"  on_complete_batch:                {batched:10.0f} tasks/s")
+    print(f"  speedup: {processors / before:.1f}x with 4 result processors, {batched / before:.1f}x batched")
+    assert processors > before
+    assert batched > before
+
+
+def test_execute_latency_benchmark():
+    """Latency of FlowManager.execute and FlowManagerMP.wait_for_completion for a single tiny task,
+    which polling added up to check_interval to."""
+    import statistics
+
+    from flow4ai.flowmanager import FlowManager
+    from flow4ai.flowmanagerMP import FlowManagerMP
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_requests = 200
+
+    def percentiles(latencies):
+        latencies = sorted(latencies)
+        return statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        fm = FlowManager()
+        try:
+            fq_name = fm.add_dsl(TinyJob("tiny"), "tiny")
+            latencies = []
+            for i in range(num_requests):
+                start = time.perf_counter()
+                fm.execute({"task_id": i}, fq_name=fq_name)
+                latencies.append(time.perf_counter() - start)
+        finally:
+            fm.close()
+        fm_p50, fm_p99 = percentiles(latencies)
+
+        flowmanagerMP = FlowManagerMP(TinyJob("tiny"), discard_result)
+        try:
+            latencies = []
+            for i in range(num_requests // 4):
+                start = time.perf_counter()
+                flowmanagerMP.submit_task({"task_id": i})
+                flowmanagerMP.wait_for_completion()
+                latencies.append(time.perf_counter() - start)
+        finally:
+            flowmanagerMP.close_processes()
+        mp_p50, mp_p99 = percentiles(latencies)
+    finally:
+        set_trace_mode(saved_trace_mode)
+
+    print(f"\nFlowManager.execute, {num_requests} requests: p50 {fm_p50 * 1000:.2f} ms/request, "
+          f"p99 {fm_p99 * 1000:.2f} ms/request")
+    print(f"FlowManagerMP submit_task and wait_for_completion, {num_requests // 4} requests: "
+          f"p50 {mp_p50 * 1000:.2f} ms/request, p99 {mp_p99 * 1000:.2f} ms/request")
+    # Well under the 0.1 s default check_interval the polling slept for
+    assert fm_p99 < 0.05
+    assert mp_p50 < 0.05
+
+
+class PayloadJob(JobABC):
+    """Returns a 20 KB payload, like a job returning a document or an embedding batch."""
+
+    async def run(self, task):
+        return {"task_id": task["task_id"], "payload": bytes(20 * 2**10)}
+
+
+def test_streaming_results_benchmark():
+    """Time to the first result and peak traced memory of a FlowManager consumer that handles 2000
+    results of 20 KB each, from pop_results after wait_for_completion versus from iter_results with
+    stream_results."""
+    from flow4ai.flowmanager import FlowManager
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 2000
+    tasks = [{"task_id": i} for i in range(num_tasks)]
+
+    def consume(stream: bool):
+        fm = FlowManager(PayloadJob("payload"), result_buffer_size=100, stream_results=stream)
+        try:
+            tracemalloc.start()
+            start = time.perf_counter()
+            first = None
+            handled = 0
+            fm.submit_task(tasks)
+            if stream:
+                results = fm.iter_results(timeout=60)
+            else:
+                assert fm.wait_for_completion(timeout=60)
+                results = (result for results in fm.pop_results()["completed"].values() for result in results)
+            for _ in results:
+                if first is None:
+                    first = time.perf_counter() - start
+                handled += 1
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            fm.close()
+        assert handled == num_tasks
+        return first, peak
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        first_before, peak_before = consume(stream=False)
+        first_after, peak_after = consume(stream=True)
+    finally:
+        set_trace_mode(saved_trace_mode)
+    print(f"\nFlowManager consumer of {num_tasks} results of 20 KB")
+    print(f"  pop_results:  first result after {first_before * 1000:8.1f} ms, peak {peak_before / 2**20:6.1f} MB")
+    print(f"  iter_results: first result after {first_after * 1000:8.1f} ms, peak {peak_after / 2**20:6.1f} MB")
+    assert first_after < first_before
+    assert peak_after < peak_before
+
+
+def test_result_store_benchmark():
+    """Memory held by a FlowManager with 3000 unpopped results of 20 KB each, in the default unbounded
+    MemoryResultStore versus a SpillResultStore, and the time pop_results takes to read them back."""
+    from flow4ai.flowmanager import FlowManager
+    from flow4ai.result_store import SpillResultStore
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 3000
+    tasks = [{"task_id": i} for i in range(num_tasks)]
+
+    def held_and_pop_time(result_store):
+        fm = FlowManager(PayloadJob("payload"), result_store=result_store)
+        try:
+            tracemalloc.start()
+            start_memory, _ = tracemalloc.get_traced_memory()
+            fm.submit_task(tasks)
+            assert fm.wait_for_completion(timeout=60)
+            held, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            start = time.perf_counter()
+            results = fm.pop_results()["completed"]
+            pop_time = time.perf_counter() - start
+            assert sum(len(graph_results) for graph_results in results.values()) == num_tasks
+        finally:
+            tracemalloc.stop()
+            fm.close()
+        return held - start_memory, pop_time
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        held_before, pop_before = held_and_pop_time(None)
+        held_after, pop_after = held_and_pop_time(SpillResultStore(max_in_memory=100))
+    finally:
+        set_trace_mode(saved_trace_mode)
+    print(f"\nFlowManager holding {num_tasks} unpopped results of 20 KB")
+    print(f"  MemoryResultStore: {held_before / 2**20:6.1f} MB held, pop_results {pop_before * 1000:7.1f} ms")
+    print(f"  SpillResultStore:  {held_after / 2**20:6.1f} MB held, pop_results {pop_after * 1000:7.1f} ms")
+    assert held_after < held_before / 4
+
+
+def test_submit_async_benchmark():
+    """Per-request latency of a tiny graph called from an asyncio service, through FlowManager.execute in
+    an executor thread, which hops to its loop thread and back, versus AsyncFlowManager.submit_async."""
+    import statistics
+
+    from flow4ai.flowmanager import FlowManager
+    from flow4ai.flowmanager_async import AsyncFlowManager
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_requests = 1000
+
+    async def threaded_requests(fm, fq_name):
+        loop = asyncio.get_running_loop()
+        latencies = []
+        for i in range(num_requests):
+            start = time.perf_counter()
+            await loop.run_in_executor(None, fm.execute, {"task_id": i}, None, None, fq_name)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    async def async_requests(afm):
+        latencies = []
+        for i in range(num_requests):
+            start = time.perf_counter()
+            await afm.submit_async({"task_id": i})
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        fm = FlowManager()
+        try:
+            fq_name = fm.add_dsl(TinyJob("tiny"), "tiny")
+            before = statistics.median(asyncio.run(threaded_requests(fm, fq_name)))
+        finally:
+            fm.close()
+        afm = AsyncFlowManager(TinyJob("tiny"))
+        try:
+            after = statistics.median(asyncio.run(async_requests(afm)))
+        finally:
+            afm.close()
+    finally:
+        set_trace_mode(saved_trace_mode)
+    print(f"\nMedian latency of {num_requests} requests from an asyncio service")
+    print(f"  FlowManager.execute in an executor: {before * 1e6:10.1f} us/request")
+    print(f"  AsyncFlowManager.submit_async:      {after * 1e6:10.1f} us/request")
+    print(f"  speedup: {before / after:.1f}x")
+    assert after < before
+
+
+def test_submit_task_futures_benchmark():
+    """Per-lookup cost of finding a task's result among 5000, by scanning pop_results for its
+    task_pass_through versus from the future submit_task returned."""
+    from flow4ai.flowmanager import FlowManager
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 5000
+    num_lookups = 200
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        fm = FlowManager(TinyJob("tiny"))
+        try:
+            tasks = [{"task_id": i} for i in range(num_tasks)]
+            futures = fm.submit_task(tasks)
+            assert fm.wait_for_completion(timeout=60)
+            results = fm.pop_results()["completed"]
+        finally:
+            fm.close()
+    finally:
+        set_trace_mode(saved_trace_mode)
+    wanted = range(0, num_tasks, num_tasks // num_lookups)
+
+    def scan():
+        for i in wanted:
+            next(result for graph_results in results.values() for result in graph_results
+                 if result["task_pass_through"]["task_id"] == i)
+
+    def from_futures():
+        for i in wanted:
+            futures[i].result()
+
+    before = time_per_task(scan, iterations=1) / num_lookups
+    after = time_per_task(from_futures, iterations=1) / num_lookups
+    report(f"Finding a task's result among {num_tasks}", before, after)
+    assert after < before
+
+
+class BlockingCallJob(JobABC):
+    """Makes a blocking call on the event loop that releases the GIL, like a synchronous client."""
+    async def run(self, task):
+        time.sleep(0.005)
+        return {"task_id": task["task_id"]}
+
+
+def test_multiple_loops_benchmark():
+    """FlowManager with one event loop versus several: the throughput of a graph making blocking calls
+    that release the GIL, spread round robin, and the latency of a tiny graph whose tasks arrive behind
+    those of such a graph, with each graph on a loop of its own."""
+    import statistics
+
+    from flow4ai.flowmanager import FlowManager
+    from flow4ai.utils.otel_wrapper import get_trace_mode, set_trace_mode
+
+    num_tasks = 200
+    num_requests = 50
+
+    def blocking_throughput(loops):
+        fm = FlowManager(BlockingCallJob("blocking"), loops=loops, loop_sharding="round_robin")
+        try:
+            start = time.perf_counter()
+            futures = fm.submit_task([{"task_id": i} for i in range(num_tasks)])
+            for future in futures:
+                future.result(timeout=60)
+            return (time.perf_counter() - start) / num_tasks
+        finally:
+            fm.close()
+
+    def tiny_latency(loops):
+        fm = FlowManager(loops=loops)
+        try:
+            blocking = fm.add_dsl(BlockingCallJob("blocking"), "blocking")
+            tiny = fm.add_dsl(TinyJob("tiny"), "tiny")
+            background = []
+            latencies = []
+            for i in range(num_requests):
+                # Each request arrives behind a few blocking tasks
+                background += fm.submit_task([{"task_id": i}] * 4, blocking)
+                start = time.perf_counter()
+                fm.submit_task({"task_id": i}, tiny).result(timeout=60)
+                latencies.append(time.perf_counter() - start)
+            for future in background:
+                future.result(timeout=60)
+            return statistics.median(latencies)
+        finally:
+            fm.close()
+
+    saved_trace_mode = get_trace_mode()
+    set_trace_mode("off")
+    try:
+        before, after = blocking_throughput(1), blocking_throughput(4)
+        before_latency, after_latency = tiny_latency(1), tiny_latency(2)
+    finally:
+        set_trace_mode(saved_trace_mode)
+
+    report(f"{num_tasks} tasks making 5 ms blocking calls, 1 loop vs 4", before, after)
+    print(f"\nTiny graph p50 latency beside a blocking graph, 1 loop: {before_latency * 1000:.2f} ms/request, "
+          f"2 loops: {after_latency * 1000:.2f} ms/request")
+    assert after < before
+    assert after_latency < before_latency
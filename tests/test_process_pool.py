@@ -0,0 +1,120 @@
+"""
+Tests for running CPU-bound jobs in the process pool with the "process" executor.
+"""
+import asyncio
+import os
+from typing import Any, Dict
+
+import pytest
+
+from flow4ai.dsl import wrap
+from flow4ai.flowmanager import FlowManager
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC, Task, job_graph_context_manager
+from flow4ai.job_loader import JobFactory
+from flow4ai.process_pool import shutdown_process_pool
+
+
+class PidJob(JobABC):
+    async def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        return {'pid': os.getpid(), 'inputs': self.get_inputs(), 'task': self.get_task()}
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def describe_process(j_ctx):
+    return {'pid': os.getpid(), 'words': j_ctx["inputs"]["count"]["result"]}
+
+
+def count_words_with_pid(text):
+    return {'words': len(text.split()), 'pid': os.getpid()}
+
+
+def describe_pool_process(j_ctx):
+    return {'worker_pid': os.getpid(), 'pool_pid': j_ctx["inputs"]["count"]["pid"]}
+
+
+def unpicklable():
+    return 1
+
+
+def process_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+@pytest.fixture(autouse=True)
+def process_pool():
+    yield
+    shutdown_process_pool()
+
+
+def test_process_job_runs_in_another_process():
+    """Test that only the job with the process executor runs in a pool process, with its inputs and task."""
+    fq = {name: JobABC.create_FQName('graph', '', name) for name in ['head', 'cpu', 'tail']}
+    jobs = {
+        fq['head']: PidJob(fq['head']),
+        fq['cpu']: PidJob(fq['cpu'], {"executor": "process"}),
+        fq['tail']: PidJob(fq['tail'])
+    }
+    assert jobs[fq['cpu']].run_in_process and not jobs[fq['head']].run_in_process
+    head_job = JobFactory.create_job_graph({
+        fq['head']: {'next': [fq['cpu']]},
+        fq['cpu']: {'next': [fq['tail']]},
+        fq['tail']: {'next': []}
+    }, jobs)
+
+    async def run_graph():
+        async with job_graph_context_manager():
+            return await head_job._execute(Task({'text': 'hello'}))
+
+    result = asyncio.run(run_graph())
+    cpu_result = result['inputs']['cpu']
+    assert result['pid'] == os.getpid()
+    assert cpu_result['pid'] != os.getpid()
+    assert cpu_result['inputs']['head']['pid'] == os.getpid()
+    assert cpu_result['task']['text'] == 'hello'
+
+
+def test_wrapped_function_with_process_executor():
+    """Test that a wrapped function can run in the process pool within a DSL executed by a FlowManager."""
+    jobs = wrap({"count": count_words}, executor="process")
+    dsl = jobs >> wrap({"describe": describe_process})
+    errors, result = FlowManager.run(dsl, {"count": {"text": "one two three"}}, "test_process_executor")
+    assert errors == {}
+    assert result["words"] == 3
+    assert result["pid"] == os.getpid()
+
+
+def test_process_pool_in_flowmanagerMP_worker():
+    """Test that a FlowManagerMP worker, which already runs its task queue reader thread, starts
+    a process pool of its own for process jobs and shuts it down when it exits."""
+    results = []
+    dsl = wrap({"count": count_words_with_pid}, executor="process") >> wrap({"describe": describe_pool_process})
+    flowmanagerMP = FlowManagerMP({"pool_graph": dsl}, results.append, serial_processing=True)
+    flowmanagerMP.submit_task([{"count": {"text": "one two three"}} for _ in range(4)])
+    flowmanagerMP.close_processes()
+
+    assert len(results) == 4
+    worker_pids = {r["worker_pid"] for r in results}
+    pool_pids = {r["pool_pid"] for r in results}
+    assert os.getpid() not in worker_pids | pool_pids
+    assert not worker_pids & pool_pids
+    assert not any(process_exists(pid) for pid in pool_pids), "the worker must shut its pool down"
+
+
+def test_unpicklable_process_job_raises_type_error():
+    """Test that a job that can't be sent to the process pool fails with a clear error."""
+    job = wrap(lambda: unpicklable(), executor="process")
+
+    async def run_graph():
+        async with job_graph_context_manager():
+            return await job._execute(Task({}))
+
+    with pytest.raises(TypeError, match="could not be pickled"):
+        asyncio.run(run_graph())
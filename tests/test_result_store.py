@@ -0,0 +1,109 @@
+"""
+    Tests the result stores and FlowManager's use of them:
+        - MemoryResultStore keeps every result, or the latest max_results as a ring buffer
+        - SpillResultStore spills the results over max_in_memory to disk and reads them back in order on pop
+        - DropResultStore drops completed results and keeps the errors
+"""
+
+import asyncio
+
+import pytest
+
+from flow4ai.flowmanager import FlowManager
+from flow4ai.job import JobABC
+from flow4ai.result_store import (COMPLETED, ERRORS, DropResultStore,
+                                  MemoryResultStore, SpillResultStore)
+
+
+class EchoJob(JobABC):
+    def __init__(self):
+        super().__init__("Echo Job")
+
+    async def run(self, task) -> dict:
+        await asyncio.sleep(0)
+        if task.get("fail"):
+            raise ValueError("failed on purpose")
+        return {"task_id": task["task_id"]}
+
+
+def add_results(store, count, fq_name="graph"):
+    for i in range(count):
+        store.add(COMPLETED, fq_name, {"task_id": i})
+
+
+def test_memory_store_is_unbounded_by_default():
+    store = MemoryResultStore()
+    add_results(store, 100)
+    assert store.count(COMPLETED) == 100
+    assert store.pop(COMPLETED) == {"graph": [{"task_id": i} for i in range(100)]}
+    assert store.pop(COMPLETED) == {}
+
+
+def test_memory_store_ring_buffer():
+    store = MemoryResultStore(max_results=10)
+    add_results(store, 25)
+    store.add(ERRORS, "graph", {"error": "failed"})
+    assert store.pop(COMPLETED) == {"graph": [{"task_id": i} for i in range(15, 25)]}
+    assert store.dropped == {COMPLETED: 15, ERRORS: 0}
+    assert store.pop(ERRORS) == {"graph": [{"error": "failed"}]}
+
+
+def test_spill_store_reads_spilled_results_back_in_order(tmp_path):
+    store = SpillResultStore(max_in_memory=5, spill_dir=str(tmp_path))
+    add_results(store, 8, "a")
+    add_results(store, 4, "b")
+    # An entry that can't be pickled stays in memory
+    store.add(COMPLETED, "b", {"task_id": 4, "callback": lambda: None})
+    assert store.count(COMPLETED) == 13
+    assert len(store._entries[COMPLETED]) == 6
+
+    popped = store.pop(COMPLETED)
+    assert [r["task_id"] for r in popped["a"]] == list(range(8))
+    assert [r["task_id"] for r in popped["b"]] == [4, 0, 1, 2, 3]
+    assert store.count(COMPLETED) == 0
+
+    # The spill file is reused after a pop
+    add_results(store, 7)
+    assert [r["task_id"] for r in store.pop(COMPLETED)["graph"]] == list(range(7))
+    store.close()
+
+
+def test_drop_store_keeps_errors():
+    store = DropResultStore(max_errors=2)
+    add_results(store, 10)
+    for i in range(3):
+        store.add(ERRORS, "graph", {"error": i})
+    assert store.pop(COMPLETED) == {}
+    assert store.pop(ERRORS) == {"graph": [{"error": 1}, {"error": 2}]}
+    assert store.dropped == {COMPLETED: 10, ERRORS: 1}
+
+
+@pytest.mark.parametrize("result_store, stored", [
+    (None, 20),
+    (MemoryResultStore(max_results=5), 5),
+    (SpillResultStore(max_in_memory=5), 20),
+    (DropResultStore(), 0),
+])
+def test_flowmanager_result_stores(result_store, stored):
+    handled = []
+    fm = FlowManager(EchoJob(), on_complete=handled.append, result_store=result_store)
+    try:
+        fm.submit_task([{"task_id": i} for i in range(20)] + [{"task_id": 20, "fail": True}])
+        assert fm.wait_for_completion()
+        stats = fm.get_stats()
+        assert stats["stored_results"] == stored
+        assert stats["dropped_results"] == 20 - stored
+        results = fm.pop_results()
+        completed = [r for results in results["completed"].values() for r in results]
+        assert len(completed) == stored
+        assert len(next(iter(results["errors"].values()))) == 1
+        assert len(handled) == 20
+    finally:
+        fm.close()
+
+
+def test_invalid_store_options():
+    with pytest.raises(ValueError, match="max_results"):
+        MemoryResultStore(max_results=0)
+    with pytest.raises(ValueError, match="max_in_memory"):
+        SpillResultStore(max_in_memory=-1)
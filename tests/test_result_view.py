@@ -0,0 +1,107 @@
+import asyncio
+import json
+import pickle
+from typing import Any, Dict
+
+from flow4ai.dsl import wrap
+from flow4ai.flowmanager import FlowManager
+from flow4ai.job import JobABC, Task, job_graph_context_manager
+from flow4ai.job_loader import JobFactory
+from flow4ai.result_view import ResultView, to_plain_result
+
+
+def test_result_view_copies_on_write():
+    result = {'text': 'hello', 'tokens': [1, 2, 3]}
+    view1, view2 = ResultView(result), ResultView(result)
+
+    assert view1['text'] == 'hello'
+    assert view1 == result and result == view1
+    view1['text'] = 'changed'
+    del view1['tokens']
+
+    assert view1 == {'text': 'changed'}
+    assert view2 == {'text': 'hello', 'tokens': [1, 2, 3]}
+    assert result == {'text': 'hello', 'tokens': [1, 2, 3]}, "the shared result must not change"
+
+
+def test_result_view_leaves_as_plain_dict():
+    view = ResultView({'a': 1})
+    unpickled = pickle.loads(pickle.dumps(view, protocol=5))
+    assert type(unpickled) is dict and unpickled == {'a': 1}
+
+    plain = to_plain_result({'A': view, 'b': 2})
+    assert type(plain['A']) is dict and plain == {'A': {'a': 1}, 'b': 2}
+    assert type(to_plain_result(view)) is dict
+
+    # Only the top level is converted, deeper views still unpickle as plain dicts
+    nested = to_plain_result({'inputs': {'x': view}})
+    assert isinstance(nested['inputs']['x'], ResultView)
+    assert type(pickle.loads(pickle.dumps(nested))['inputs']['x']) is dict
+
+
+def test_inputs_are_views_and_results_plain_dicts_in_flowmanager():
+    def a():
+        return {"value": 1}
+
+    def c(j_ctx):
+        inputs = j_ctx["inputs"]
+        assert isinstance(inputs["a"], ResultView)
+        inputs["a"]["value"] += 1
+        return inputs
+
+    jobs = wrap({"a": a, "c": c})
+    errors, result = FlowManager.run(jobs["a"] >> jobs["c"], {}, "plain_dicts")
+
+    assert errors == {}
+    assert type(result["a"]) is dict and result["a"] == {"value": 2}
+    assert json.loads(json.dumps(result))["a"] == {"value": 2}
+
+
+def test_reading_inputs_does_not_copy_the_result():
+    shared = {'payload': 'x' * 1000}
+    view = ResultView(shared)
+    assert view['payload'] is shared['payload']
+    assert dict(view.items()) == shared
+    assert view._data is shared, "reads must not copy"
+    view['extra'] = 1
+    assert view._data is not shared and 'extra' not in shared
+
+
+class ProduceJob(JobABC):
+    async def run(self, task: Dict[str, Any]) -> Any:
+        return {'payload': 'shared'}
+
+
+class MutateJob(JobABC):
+    async def run(self, task: Dict[str, Any]) -> Any:
+        inputs = self.get_inputs()
+        produced = inputs['produce']
+        produced['payload'] = JobABC.parse_job_name(self.name)
+        return {'seen': produced['payload']}
+
+
+class CollectJob(JobABC):
+    async def run(self, task: Dict[str, Any]) -> Any:
+        return self.get_inputs()
+
+
+def test_sibling_jobs_do_not_see_each_others_changes():
+    fq = {name: JobABC.create_FQName('graph', 'params', name) for name in ['produce', 'left', 'right', 'collect']}
+    jobs = {fq[name]: cls(fq[name]) for name, cls in
+            [('produce', ProduceJob), ('left', MutateJob), ('right', MutateJob), ('collect', CollectJob)]}
+    head_job = JobFactory.create_job_graph({
+        fq['produce']: {'next': [fq['left'], fq['right']]},
+        fq['left']: {'next': [fq['collect']]},
+        fq['right']: {'next': [fq['collect']]},
+        fq['collect']: {'next': []}
+    }, jobs)
+
+    async def run_graph():
+        async with job_graph_context_manager():
+            return await head_job._execute(Task({}))
+
+    result = asyncio.run(run_graph())
+    assert result['left'] == {'seen': 'left'}
+    assert result['right'] == {'seen': 'right'}
+    assert type(result['left']) is dict, "results leaving the graph must be plain dicts"
+    assert result['RETURN_JOB'] == fq['collect']
@@ -0,0 +1,178 @@
+"""
+    Tests streaming results with iter_results and results, in both managers:
+        - every result is yielded as its task completes, including tasks submitted while iterating
+        - FlowManager starts at most result_buffer_size tasks ahead of the consumer, with stream_results from the first task
+        - errors are not yielded, iteration stopped early leaves the rest of the results for pop_results
+        - FlowManagerMP iter_results can't be used with on_complete, and a full result buffer that is never
+          iterated neither stalls the workers nor close_processes
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from flow4ai.flowmanager import FlowManager
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC
+
+
+class DelayJob(JobABC):
+    def __init__(self):
+        super().__init__("Delay Job")
+
+    async def run(self, task) -> dict:
+        await asyncio.sleep(task.get("delay", 0))
+        if task.get("fail"):
+            raise ValueError("failed on purpose")
+        return {"task_id": task["task_id"]}
+
+
+def test_flowmanager_yields_results_as_tasks_complete():
+    fm = FlowManager(DelayJob())
+    try:
+        fm.submit_task([{"task_id": i, "delay": 0.05 * i} for i in range(5)] + [{"task_id": 5, "fail": True}])
+        start = time.perf_counter()
+        arrivals = []
+        for result in fm.iter_results(timeout=5):
+            arrivals.append((result["task_id"], time.perf_counter() - start))
+            if result["task_id"] == 0:
+                fm.submit_task({"task_id": 6, "delay": 0.3})
+        assert [task_id for task_id, _ in arrivals] == [0, 1, 2, 3, 4, 6]
+        # The first result arrives long before the last task completes
+        assert arrivals[0][1] < arrivals[-1][1] / 2
+        results = fm.pop_results()
+        assert results["completed"] == {}
+        assert len(next(iter(results["errors"].values()))) == 1
+    finally:
+        fm.close()
+
+
+def test_flowmanager_buffer_is_bounded():
+    fm = FlowManager(DelayJob(), result_buffer_size=2, stream_results=True)
+    try:
+        fm.submit_task([{"task_id": i} for i in range(10)])
+        time.sleep(0.2)
+        # The buffer is full and the other tasks wait for room before they start
+        assert len(fm._result_stream) == 2
+        assert fm.get_counts()["completed"] == 2
+        assert fm.pop_results()["completed"] == {}
+        iterator = fm.iter_results(timeout=5)
+        first = next(iterator)
+        time.sleep(0.2)
+        assert len(fm._result_stream) == 2
+        rest = list(iterator)
+        assert sorted(r["task_id"] for r in [first] + rest) == list(range(10))
+    finally:
+        fm.close()
+
+
+def test_flowmanager_failed_tasks_release_buffer_room():
+    fm = FlowManager(DelayJob(), result_buffer_size=2, stream_results=True)
+    try:
+        fm.submit_task([{"task_id": i, "fail": True} for i in range(5)] + [{"task_id": 5}])
+        assert [r["task_id"] for r in fm.iter_results(timeout=5)] == [5]
+    finally:
+        fm.close()
+
+
+def test_flowmanager_stopping_early_keeps_results():
+    fm = FlowManager(DelayJob())
+    try:
+        fm.submit_task([{"task_id": i} for i in range(5)])
+        assert fm.wait_for_completion()
+        for result in fm.iter_results():
+            break
+        completed = next(iter(fm.pop_results()["completed"].values()))
+        assert sorted(r["task_id"] for r in completed + [result]) == list(range(5))
+    finally:
+        fm.close()
+
+
+def test_flowmanager_async_results():
+    fm = FlowManager(DelayJob())
+
+    async def consume():
+        fm.submit_task([{"task_id": i, "delay": 0.01} for i in range(5)])
+        return sorted([result["task_id"] async for result in fm.results(timeout=5)])
+
+    try:
+        assert asyncio.run(consume()) == list(range(5))
+    finally:
+        fm.close()
+
+
+def test_flowmanager_iter_results_timeout():
+    fm = FlowManager(DelayJob())
+    try:
+        fm.submit_task({"task_id": 0, "delay": 1})
+        with pytest.raises(TimeoutError):
+            next(fm.iter_results(timeout=0.05))
+        assert fm.wait_for_completion()
+    finally:
+        fm.close()
+
+
+@pytest.mark.parametrize("result_buffer_size", [None, 2])
+def test_flowmanagerMP_yields_results_as_tasks_complete(result_buffer_size):
+    flowmanagerMP = FlowManagerMP(DelayJob(), num_workers=2, result_buffer_size=result_buffer_size)
+    try:
+        flowmanagerMP.submit_task([{"task_id": i, "delay": 0.01} for i in range(20)])
+        task_ids = []
+        for result in flowmanagerMP.iter_results(timeout=10):
+            task_ids.append(result["task_id"])
+            if result["task_id"] == 0:
+                flowmanagerMP.submit_task({"task_id": 21})
+        assert sorted(task_ids) == list(range(20)) + [21]
+        assert flowmanagerMP.get_stats()["completed"] == 21
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_flowmanagerMP_closes_with_a_full_result_buffer():
+    flowmanagerMP = FlowManagerMP(DelayJob(), result_buffer_size=2)
+    try:
+        flowmanagerMP.submit_task([{"task_id": i} for i in range(10)])
+        # The worker keeps running its tasks while their results wait for room
+        flowmanagerMP.wait_for_completion(timeout=5)
+        assert flowmanagerMP.get_stats()["completed"] == 10
+
+        closing = threading.Thread(target=flowmanagerMP.close_processes, daemon=True)
+        closing.start()
+        closing.join(timeout=10)
+        assert not closing.is_alive()
+        assert not any(p.is_alive() for p in flowmanagerMP.job_executor_processes)
+    finally:
+        for process in flowmanagerMP.job_executor_processes:
+            process.kill()
+
+
+def test_flowmanagerMP_async_results():
+    flowmanagerMP = FlowManagerMP(DelayJob())
+
+    async def consume():
+        flowmanagerMP.submit_task([{"task_id": i} for i in range(5)])
+        return sorted([result["task_id"] async for result in flowmanagerMP.results(timeout=10)])
+
+    try:
+        assert asyncio.run(consume()) == list(range(5))
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_flowmanagerMP_iter_results_needs_no_on_complete():
+    results = []
+    flowmanagerMP = FlowManagerMP(DelayJob(), results.append, serial_processing=True)
+    try:
+        with pytest.raises(RuntimeError, match="on_complete"):
+            next(flowmanagerMP.iter_results())
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_invalid_result_buffer_size():
+    with pytest.raises(ValueError, match="result_buffer_size"):
+        FlowManager(DelayJob(), result_buffer_size=0)
+    with pytest.raises(ValueError, match="result_buffer_size"):
+        FlowManagerMP(DelayJob(), result_buffer_size=0)
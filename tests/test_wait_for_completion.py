@@ -0,0 +1,87 @@
+"""
+    Tests that wait_for_completion is woken by the last task finishing, in both managers:
+        - it returns well before the check_interval the old polling slept for
+        - it still times out when tasks don't finish
+        - task stats are logged at INFO at most once per STATS_LOG_INTERVAL
+"""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+from flow4ai.flowmanager import FlowManager
+from flow4ai.flowmanagerMP import FlowManagerMP
+from flow4ai.job import JobABC
+
+
+class SleepJob(JobABC):
+    def __init__(self):
+        super().__init__("Sleep Job")
+
+    async def run(self, task) -> dict:
+        await asyncio.sleep(task.get("delay", 0.05))
+        return {"task_id": task["task_id"]}
+
+
+def test_flowmanager_wakes_when_last_task_completes():
+    fm = FlowManager(SleepJob())
+    try:
+        fm.wait_for_completion()
+        start = time.perf_counter()
+        fm.submit_task([{"task_id": i} for i in range(5)])
+        assert fm.wait_for_completion(timeout=10, check_interval=2)
+        assert time.perf_counter() - start < 1
+        assert fm.get_counts()["completed"] == 5
+    finally:
+        fm.close()
+
+
+def test_flowmanager_times_out():
+    fm = FlowManager(SleepJob())
+    try:
+        fm.submit_task({"task_id": 0, "delay": 2})
+        start = time.perf_counter()
+        assert not fm.wait_for_completion(timeout=0.2)
+        assert 0.2 <= time.perf_counter() - start < 1
+    finally:
+        fm.wait_for_completion()
+        fm.close()
+
+
+def test_flowmanagerMP_wakes_when_last_task_completes():
+    flowmanagerMP = FlowManagerMP(SleepJob())
+    try:
+        flowmanagerMP.submit_task([{"task_id": i} for i in range(5)])
+        start = time.perf_counter()
+        flowmanagerMP.wait_for_completion(timeout=10, check_interval=2)
+        assert time.perf_counter() - start < 1
+        assert flowmanagerMP.get_stats()["completed"] == 5
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_flowmanagerMP_times_out():
+    flowmanagerMP = FlowManagerMP(SleepJob())
+    try:
+        flowmanagerMP.submit_task({"task_id": 0, "delay": 2})
+        start = time.perf_counter()
+        flowmanagerMP.wait_for_completion(timeout=0.2)
+        assert 0.2 <= time.perf_counter() - start < 1
+        assert flowmanagerMP.get_stats()["completed"] == 0
+    finally:
+        flowmanagerMP.close_processes()
+
+
+def test_stats_logging_is_rate_limited():
+    fm = FlowManager(SleepJob())
+    try:
+        fm.logger = Mock()
+        for _ in range(10):
+            fm._log_stats("Task Stats")
+        assert fm.logger.info.call_count == 1
+        assert fm.logger.debug.call_count == 9
+        fm._stats_logged_at -= fm.STATS_LOG_INTERVAL
+        fm._log_stats("Task Stats")
+        assert fm.logger.info.call_count == 2
+    finally:
+        fm.close()